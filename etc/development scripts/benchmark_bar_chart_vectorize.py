@@ -0,0 +1,42 @@
+import logging
+import random
+import re
+import time
+
+from drawpyo.diagram_types import BarChart
+
+# Builds histogram sized bar charts with and without the NumPy path and
+# checks that both produce the same XML. Requires NumPy.
+
+logging.disable(logging.CRITICAL)
+
+
+def histogram(bins, seed=0):
+    rng = random.Random(seed)
+    return {"bin {0}".format(i): rng.gauss(100, 30) ** 2 for i in range(bins)}
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def chart_xml(chart):
+    # Object IDs differ between runs
+    return [re.sub(r'id="\d+"', 'id=""', obj.xml) for obj in chart.group.objects]
+
+
+for bins in [1000, 5000, 20000]:
+    data = histogram(bins)
+    scalar, scalar_time = timed(
+        BarChart, data, bar_width=4, bar_spacing=1, vectorize=False
+    )
+    vector, vector_time = timed(
+        BarChart, data, bar_width=4, bar_spacing=1, vectorize=True
+    )
+    print(
+        "{0} bars: scalar {1:.3f}s, vectorized {2:.3f}s, same XML: {3}".format(
+            bins, scalar_time, vector_time, chart_xml(scalar) == chart_xml(vector)
+        )
+    )
@@ -0,0 +1,40 @@
+import time
+import logging
+
+from drawpyo.diagram_types import BinaryTreeDiagram
+
+# Compares building complete binary trees from heap ordered arrays with
+# from_array against the nested dict equivalent through from_dict.
+
+logging.disable(logging.CRITICAL)
+
+
+def heap_to_dict(values, index=0):
+    left, right = 2 * index + 1, 2 * index + 2
+    if left >= len(values):
+        return str(values[index])
+    children = [heap_to_dict(values, left)]
+    if right < len(values):
+        children.append(heap_to_dict(values, right))
+    # Leaves are plain values, so wrap them in single key dicts when needed
+    children = [c if isinstance(c, dict) else {c: None} for c in children]
+    return {str(values[index]): children}
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+for levels in [10, 12, 14, 16]:
+    values = list(range(2**levels - 1))
+    array_tree, array_time = timed(BinaryTreeDiagram.from_array, values)
+    line = "{0} nodes: from_array {1:.3f}s".format(len(values), array_time)
+    if levels <= 14:
+        dict_tree, dict_time = timed(BinaryTreeDiagram.from_dict, heap_to_dict(values))
+        same = [o.position for o in array_tree.objects] == [
+            o.position for o in sorted(dict_tree.objects, key=lambda o: int(o.value))
+        ]
+        line += ", from_dict {0:.3f}s, same layout: {1}".format(dict_time, same)
+    print(line)
@@ -0,0 +1,137 @@
+import random
+import sys
+import time
+import logging
+
+from drawpyo.diagram_types import TreeDiagram, NodeObject, TreeGroup
+
+# Compares the iterative tree construction and group layout against the
+# recursive versions they replaced, then builds trees deeper than the
+# recursion limit.
+
+logging.disable(logging.CRITICAL)
+
+
+def recursive_from_dict(data):
+    tree = TreeDiagram()
+
+    def build(parent, item):
+        if isinstance(item, (str, int, float)):
+            NodeObject(tree=tree, value=str(item), tree_parent=parent)
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                build(NodeObject(tree=tree, value=str(key), tree_parent=parent), value)
+        else:
+            for element in item:
+                build(parent, element)
+
+    build(None, data)
+    return tree
+
+
+def recursive_group_layout(tree):
+    def layout_child(tree_parent):
+        grp = TreeGroup(tree=tree)
+        grp.parent_object = tree_parent
+        if tree_parent.tree_children:
+            for child in tree_parent.tree_children:
+                tree.connect(tree_parent, child)
+                if child.tree_children:
+                    grp.add_object(layout_child(child))
+                else:
+                    grp.add_object(child)
+            layout_group(grp)
+            grp.center_parent()
+        return grp
+
+    def layout_group(grp):
+        pos = tree.origin
+        for obj in grp.objects:
+            if obj is not grp.parent_object:
+                obj.position = pos
+                pos = tree.move_in_level(pos, obj.size_in_level + tree.item_spacing)
+
+    top_group = TreeGroup(tree=tree)
+    for root in tree.roots:
+        top_group.add_object(layout_child(root))
+    layout_group(top_group)
+    top_group.center_position = tree.move_between_levels(
+        tree.origin, top_group.size_of_level / 2
+    )
+
+
+def iterative_from_dict(data):
+    # from_dict without its auto_layout call
+    auto_layout = TreeDiagram.auto_layout
+    TreeDiagram.auto_layout = lambda self: None
+    try:
+        return TreeDiagram.from_dict(data)
+    finally:
+        TreeDiagram.auto_layout = auto_layout
+
+
+def chain(depth):
+    data = "leaf"
+    for i in reversed(range(depth)):
+        data = {str(i): data}
+    return data
+
+
+def bushy(size, seed=0):
+    rng = random.Random(seed)
+    root = {}
+    nodes = [root]
+    for i in range(size):
+        children = rng.choice(nodes[-50:])
+        child = {}
+        children["n{0}".format(i)] = child
+        nodes.append(child)
+    # Empty dicts become leaves
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        for key, value in item.items():
+            if value:
+                stack.append(value)
+            else:
+                item[key] = "leaf"
+    return {"root": root}
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def positions(tree):
+    return [(o.value, o.geometry.x, o.geometry.y) for o in tree.objects]
+
+
+for name, data in [("chain of 300", chain(300)), ("bushy 5000", bushy(5000))]:
+    old_tree, old_build = timed(recursive_from_dict, data)
+    new_tree, new_build = timed(iterative_from_dict, data)
+    _, old_layout = timed(recursive_group_layout, old_tree)
+    _, new_layout = timed(new_tree.auto_layout, "group")
+    same = all(
+        a[0] == b[0] and abs(a[1] - b[1]) < 1e-6 and abs(a[2] - b[2]) < 1e-6
+        for a, b in zip(positions(old_tree), positions(new_tree))
+    )
+    print(
+        "{0}: build {1:.3f}s -> {2:.3f}s, group layout {3:.3f}s -> {4:.3f}s, same layout: {5}".format(
+            name, old_build, new_build, old_layout, new_layout, same
+        )
+    )
+
+depth = 10 * sys.getrecursionlimit()
+try:
+    recursive_from_dict(chain(depth))
+except RecursionError:
+    print("recursive build of depth {0}: RecursionError".format(depth))
+for engine in TreeDiagram.LAYOUT_ENGINES:
+    tree, seconds = timed(
+        lambda: TreeDiagram.from_dict(chain(depth), layout_engine=engine)
+    )
+    print(
+        "from_dict with {0} layout, depth {1}: {2:.3f}s".format(engine, depth, seconds)
+    )
@@ -0,0 +1,33 @@
+import logging
+import random
+import time
+
+from drawpyo.diagram_types import Heatmap
+
+# Builds large heatmaps with and without the NumPy path.
+
+logging.disable(logging.CRITICAL)
+
+
+def grid(size, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)]
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+for size in [100, 300]:
+    data = grid(size)
+    for vectorize in [False, True]:
+        chart, seconds = timed(
+            Heatmap, data, colormap="coolwarm", value_range=(-1, 1), vectorize=vectorize
+        )
+        print(
+            "{0}x{0} grid ({1} cells), vectorize={2}: {3:.3f}s".format(
+                size, len(chart), vectorize, seconds
+            )
+        )
@@ -0,0 +1,49 @@
+import logging
+import tracemalloc
+
+import drawpyo
+
+# Measures the memory held by each Object and Edge, including their geometry
+# and text format helpers.
+
+logging.disable(logging.CRITICAL)
+
+COUNT = 10000
+
+
+def traced(build):
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size
+
+
+def objects():
+    file = drawpyo.File()
+    page = drawpyo.Page(file=file)
+    return file, [drawpyo.diagram.Object(page=page) for _ in range(COUNT)]
+
+
+def edges():
+    file = drawpyo.File()
+    page = drawpyo.Page(file=file)
+    return file, [drawpyo.diagram.Edge(page=page) for _ in range(COUNT)]
+
+
+def geometries():
+    return [drawpyo.diagram.Geometry() for _ in range(COUNT)]
+
+
+def text_formats():
+    return [drawpyo.diagram.TextFormat(fontSize=12) for _ in range(COUNT)]
+
+
+for name, build in [
+    ("Object", objects),
+    ("Edge", edges),
+    ("Geometry", geometries),
+    ("TextFormat", text_formats),
+]:
+    kept, size = traced(build)
+    print("{0}: {1:.0f} bytes each".format(name, size / COUNT))
@@ -0,0 +1,43 @@
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+import drawpyo
+
+# Streams chains of objects and edges to disk and reports the peak memory,
+# which should stay flat as the number of cells grows.
+
+logging.disable(logging.CRITICAL)
+
+
+def stream(count, file_path):
+    file = drawpyo.File()
+    with file.open_stream(file_path) as page:
+        previous = None
+        for i in range(count):
+            obj = drawpyo.diagram.Object(
+                page=page, value=str(i), position=(i % 100 * 150, i // 100 * 100)
+            )
+            page.finalize(obj)
+            if previous is not None:
+                edge = drawpyo.diagram.Edge(page=page, source=previous, target=obj)
+                page.finalize(edge)
+            previous = obj
+
+
+with tempfile.TemporaryDirectory() as directory:
+    file_path = os.path.join(directory, "stream.drawio")
+    for count in [10000, 50000]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        stream(count, file_path)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            "{0} objects + edges: {1:.1f}s, peak {2:.0f} KiB, file {3:.1f} MB".format(
+                count, seconds, peak / 1024, os.path.getsize(file_path) / 1e6
+            )
+        )
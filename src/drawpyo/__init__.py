@@ -1,13 +1,14 @@
-from .xml_base import XMLBase
+from .xml_base import XMLBase, XMLValue, WeakAttribute
 from .file import File
 from .page import Page
+from .streaming import StreamingPage
 
 from .utils.standard_colors import StandardColor
 from .utils.color_scheme import ColorScheme
 from .utils.logger import logger
 from .utils.page_sizes import PageSize
 
-from .drawio_import import load_diagram
+from .drawio_import import load_diagram, load_file, patch, diff
 
 from . import utils
 from . import diagram
@@ -16,8 +17,11 @@ from . import drawio_import
 
 __all__ = [
     XMLBase,
+    XMLValue,
+    WeakAttribute,
     File,
     Page,
+    StreamingPage,
     StandardColor,
     ColorScheme,
     PageSize,
@@ -27,6 +31,9 @@ __all__ = [
     diagram_types,
     drawio_import,
     load_diagram,
+    load_file,
+    patch,
+    diff,
 ]
 
 __version__ = "0.2.4"
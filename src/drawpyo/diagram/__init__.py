@@ -2,6 +2,7 @@ from .base_diagram import (
     DiagramBase,
     Geometry,
     style_str_from_dict,
+    parse_style_string,
     import_shape_database,
     color_input_check,
     width_input_check,
@@ -15,6 +16,7 @@ __all__ = [
     DiagramBase,
     Geometry,
     style_str_from_dict,
+    parse_style_string,
     import_shape_database,
     color_input_check,
     width_input_check,
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import List, Optional, Tuple, Dict, Any, Union
 
-from ..xml_base import XMLBase
+import weakref
+from functools import lru_cache
+
+from ..xml_base import XMLBase, XMLValue, WeakAttribute
 from os import path
 
 
@@ -10,6 +13,7 @@ __all__ = [
     "DiagramBase",
     "Geometry",
     "style_str_from_dict",
+    "parse_style_string",
     "import_shape_database",
     "color_input_check",
     "width_input_check",
@@ -124,14 +128,54 @@ def style_str_from_dict(style_dict: Dict[str, Any]) -> str:
     return ";".join(style_str)
 
 
+@lru_cache(maxsize=256)
+def parse_style_string(
+    style_str: str,
+) -> Tuple[Optional[str], Tuple[Tuple[str, Any], ...]]:
+    """
+    This function parses a Draw.io style string into its baseStyle and its attributes, converting whole number values to ints. The results are cached since files tend to reuse a handful of style strings across many objects. parse_style_string.cache_info() gives the hit and miss counts and parse_style_string.cache_clear() empties the cache.
+
+    Args:
+        style_str (str): A Draw.io style string
+
+    Returns:
+        tuple: The baseStyle, or None if there isn't one, and a tuple of (attribute, value) pairs in the order they appear
+    """
+    base_style: Optional[str] = None
+    attributes: List[Tuple[str, Any]] = []
+    for attrib in style_str.split(";"):
+        if attrib == "":
+            pass
+        elif "=" in attrib:
+            a_name, a_value = attrib.split("=")[:2]
+            if a_value.isdigit():
+                if "." in a_value:
+                    a_value = float(a_value)
+                else:
+                    a_value = int(a_value)
+            elif a_value == "True" or a_value == "False":
+                a_value = bool(a_value)
+            attributes.append((a_name, a_value))
+        else:
+            base_style = attrib
+    return base_style, tuple(attributes)
+
+
 class DiagramBase(XMLBase):
     """
     This class is the base for all diagram objects to inherit from. It defines some general creation methods and properties to make diagram objects printable and useful.
     """
 
+    # The style attributes are shared by every instance of a class until one
+    # adds its own, see style_attributes
+    _style_attributes: Tuple[str, ...] = ("html",)
+
+    # Back-references to the owners of the object
+    _page = WeakAttribute()
+    _xml_parent = WeakAttribute()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._style_attributes: List[str] = ["html"]
         self.page: Optional[Any] = kwargs.get("page", None)
         self.xml_parent: Optional[DiagramBase] = kwargs.get("xml_parent", None)
 
@@ -199,16 +243,20 @@ class DiagramBase(XMLBase):
     ###########################################################
     def add_style_attribute(self, style_attr: str) -> None:
         if style_attr not in self._style_attributes:
-            self._style_attributes.append(style_attr)
+            self.style_attributes.append(style_attr)
 
     @property
     def style_attributes(self) -> List[str]:
         """
         The style attributes are the list of style tags that should be printed into the style XML attribute. This is a subset of the attributes defined on the object method.
 
+        Instances of a class share its default style attributes. Accessing this property gives the instance its own list that can be changed.
+
         Returns:
             list: A list of the names of the style_attributes.
         """
+        if "_style_attributes" not in self.__dict__:
+            self._style_attributes = list(self._style_attributes)
         return self._style_attributes
 
     @style_attributes.setter
@@ -239,7 +287,7 @@ class DiagramBase(XMLBase):
             style_str = getattr(self, "baseStyle") + ";"
 
         # Add style attributes
-        for attribute in self.style_attributes:
+        for attribute in self._style_attributes:
             if hasattr(self, attribute) and getattr(self, attribute) is not None:
                 attr_val = getattr(self, attribute)
                 # reformat different datatypes to strings
@@ -247,9 +295,13 @@ class DiagramBase(XMLBase):
                     attr_val = format(attr_val * 1)
                 style_str = style_str + "{0}={1};".format(attribute, attr_val)
 
-        # Add style objects
-        if hasattr(self, "text_format") and self.text_format is not None:
-            style_str = style_str + self.text_format.style
+        # Add style objects. Read the stored text format rather than the
+        # text_format property.
+        text_format = self.__dict__.get("_text_format")
+        if text_format is None:
+            text_format = getattr(self, "text_format", None)
+        if text_format is not None:
+            style_str = style_str + text_format.style
         return style_str
 
     def _add_and_set_style_attrib(self, attrib: str, value: Any) -> None:
@@ -266,26 +318,14 @@ class DiagramBase(XMLBase):
         Args:
             style_str (str): A Draw.io style string
         """
-        for attrib in style_str.split(";"):
-            if attrib == "":
-                pass
-            elif "=" in attrib:
-                a_name = attrib.split("=")[0]
-                a_value = attrib.split("=")[1]
-                if a_value.isdigit():
-                    if "." in a_value:
-                        a_value = float(a_value)
-                    else:
-                        a_value = int(a_value)
-                elif a_value == "True" or a_value == "False":
-                    a_value = bool(a_value)
-
-                self._add_and_set_style_attrib(a_name, a_value)
-            else:
-                self.baseStyle = attrib
+        base_style, attributes = parse_style_string(style_str)
+        for a_name, a_value in attributes:
+            self._add_and_set_style_attrib(a_name, a_value)
+        if base_style is not None:
+            self.baseStyle = base_style
 
     def _apply_style_from_template(self, template: DiagramBase) -> None:
-        for attrib in template.style_attributes:
+        for attrib in template._style_attributes:
             value = getattr(template, attrib)
             self._add_and_set_style_attrib(attrib, value)
 
@@ -329,11 +369,14 @@ class DiagramBase(XMLBase):
         return new_obj
 
 
-class Geometry(DiagramBase):
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.xml_class: str = "mxGeometry"
+class Geometry(XMLValue):
+    """The position and size of an object. This is rendered as the mxGeometry subobject of the object in the Draw.io file."""
 
+    __slots__ = ("_parent_object", "_x", "_y", "width", "height", "as_attribute")
+
+    xml_class: str = "mxGeometry"
+
+    def __init__(self, **kwargs: Any) -> None:
         self.parent_object: Optional[Any] = kwargs.get("parent_object", None)
         self._x: Union[int, float] = kwargs.get("x", 0)
         self._y: Union[int, float] = kwargs.get("y", 0)
@@ -341,6 +384,30 @@ class Geometry(DiagramBase):
         self.height: Union[int, float] = kwargs.get("height", 60)
         self.as_attribute: str = kwargs.get("as_attribute", "geometry")
 
+    @property
+    def parent_object(self) -> Optional[Any]:
+        """The object the geometry belongs to. It's held through a weak reference since the object owns its geometry.
+
+        Returns:
+            Object: The owning object or None
+        """
+        return None if self._parent_object is None else self._parent_object()
+
+    @parent_object.setter
+    def parent_object(self, value: Optional[Any]) -> None:
+        self._parent_object = None if value is None else weakref.ref(value)
+
+    def copy(self) -> Geometry:
+        """Create a copy of the geometry with the same parent object.
+
+        Returns:
+            Geometry: The copy
+        """
+        new_geometry = self.__class__.__new__(self.__class__)
+        for name in Geometry.__slots__:
+            setattr(new_geometry, name, getattr(self, name))
+        return new_geometry
+
     @property
     def x(self) -> Union[int, float]:
         return self._x
@@ -1,6 +1,7 @@
 from os import path
 from typing import Optional, Dict, Any, List, Union, Tuple
 from ..utils.logger import logger
+from ..xml_base import XMLValue, WeakAttribute
 
 from .base_diagram import (
     DiagramBase,
@@ -9,7 +10,7 @@ from .base_diagram import (
     color_input_check,
     width_input_check,
 )
-from .text_format import TextFormat
+from .text_format import TextFormat, _TextFormatView, _resolve
 from ..utils.color_scheme import ColorScheme
 from ..utils.standard_colors import StandardColor
 
@@ -47,6 +48,41 @@ class Edge(DiagramBase):
     More information about edges are in the Usage documents at [Usage - Edges](../../usage/edges).
     """
 
+    _style_attributes: Tuple[str, ...] = (
+        "rounded",
+        "sketch",
+        "shadow",
+        "flowAnimation",
+        "jettySize",
+        "entryX",
+        "entryY",
+        "entryDx",
+        "entryDy",
+        "exitX",
+        "exitY",
+        "exitDx",
+        "exitDy",
+        "startArrow",
+        "endArrow",
+        "startFill",
+        "endFill",
+        "strokeColor",
+        "strokeWidth",
+        "fillColor",
+        "jumpStyle",
+        "jumpSize",
+        "targetPerimeterSpacing",
+        "sourcePerimeterSpacing",
+        "endSize",
+        "startSize",
+        "opacity",
+    )
+
+    # The page owns the edge and the objects it connects, which keep their
+    # own lists of edges, so the edge only refers to them weakly
+    _source = WeakAttribute()
+    _target = WeakAttribute()
+
     def __init__(self, **kwargs: Any) -> None:
         """Edges can be initialized with almost all styling parameters as args.
         See [Usage - Edges](../../usage/edges) for more information and the options for each parameter.
@@ -54,6 +90,8 @@ class Edge(DiagramBase):
         Args:
             source (DiagramBase): The Draw.io object that the edge originates from
             target (DiagramBase): The Draw.io object that the edge points to
+            source_point (tuple): Where the edge starts if it has no source object, in (X, Y) pixels
+            target_point (tuple): Where the edge ends if it has no target object, in (X, Y) pixels
             label (str): The text to place on the edge.
             label_position (float): Where along the edge the label is positioned. -1 is the source, 1 is the target, 0 is the center
             label_offset (int): How far the label is offset away from the axis of the edge in pixels
@@ -94,9 +132,16 @@ class Edge(DiagramBase):
 
         # Style
         self.color_scheme: Optional[ColorScheme] = kwargs.get("color_scheme", None)
-        self.text_format: Optional[TextFormat] = kwargs.get("text_format", TextFormat())
-        if not self.text_format.fontColor and self.color_scheme:
-            self.text_format.fontColor = self.color_scheme.font_color
+        self._text_format: TextFormat = _resolve(
+            kwargs.get("text_format", TextFormat.DEFAULT)
+        )
+        if not self._text_format.fontColor and self.color_scheme:
+            if self._text_format.frozen:
+                self._text_format = self._text_format.replace(
+                    fontColor=self.color_scheme.font_color
+                )
+            else:
+                self._text_format.fontColor = self.color_scheme.font_color
         self.waypoints: Optional[str] = kwargs.get("waypoints", "orthogonal")
         self.connection: Optional[str] = kwargs.get("connection", "line")
         self.pattern: Optional[str] = kwargs.get("pattern", "solid")
@@ -140,6 +185,8 @@ class Edge(DiagramBase):
         self.source = kwargs.get("source", None)
         self._target: Optional[DiagramBase] = None
         self.target = kwargs.get("target", None)
+        self.source_point = kwargs.get("source_point", None)
+        self.target_point = kwargs.get("target_point", None)
         self.entryX: Optional[float] = kwargs.get("entryX", None)
         self.entryY: Optional[float] = kwargs.get("entryY", None)
         self.entryDx: Optional[int] = kwargs.get("entryDx", None)
@@ -218,10 +265,34 @@ class Edge(DiagramBase):
             "source": self.source_id,
             "target": self.target_id,
         }
+        # Edges between free points don't reference a source or target
+        if self.source is None and self.geometry.source_point is not None:
+            base_attr_dict["source"] = None
+        if self.target is None and self.geometry.target_point is not None:
+            base_attr_dict["target"] = None
         if self.value is not None:
             base_attr_dict["value"] = self.value
         return base_attr_dict
 
+    ###########################################################
+    # Text format
+    ###########################################################
+
+    @property
+    def text_format(self) -> TextFormat:
+        """The formatting of the edge label. Like Object.text_format, the first change to a shared frozen TextFormat gives the edge its own mutable copy.
+
+        Returns:
+            TextFormat: The text format of the edge
+        """
+        if self._text_format.frozen:
+            return _TextFormatView(self)
+        return self._text_format
+
+    @text_format.setter
+    def text_format(self, value: TextFormat) -> None:
+        self._text_format = _resolve(value)
+
     ###########################################################
     # Source and Target Linking
     ###########################################################
@@ -292,6 +363,43 @@ class Edge(DiagramBase):
         else:
             return 1
 
+    # Free end points
+    @property
+    def source_point(self) -> Optional[Tuple[int, int]]:
+        """Where the edge starts when it isn't connected to a source object, as an (X, Y) tuple in pixels.
+
+        Returns:
+            tuple: The start point of the edge or None
+        """
+        point: Optional[Point] = self.geometry.source_point
+        return None if point is None else (point.x, point.y)
+
+    @source_point.setter
+    def source_point(self, position: Optional[Tuple[int, int]]) -> None:
+        self.geometry.source_point = (
+            None
+            if position is None
+            else Point(x=position[0], y=position[1], as_attribute="sourcePoint")
+        )
+
+    @property
+    def target_point(self) -> Optional[Tuple[int, int]]:
+        """Where the edge ends when it isn't connected to a target object, as an (X, Y) tuple in pixels.
+
+        Returns:
+            tuple: The end point of the edge or None
+        """
+        point: Optional[Point] = self.geometry.target_point
+        return None if point is None else (point.x, point.y)
+
+    @target_point.setter
+    def target_point(self, position: Optional[Tuple[int, int]]) -> None:
+        self.geometry.target_point = (
+            None
+            if position is None
+            else Point(x=position[0], y=position[1], as_attribute="targetPoint")
+        )
+
     def add_point(self, x: int, y: int) -> None:
         """Add a point to the edge
 
@@ -320,35 +428,7 @@ class Edge(DiagramBase):
         Returns:
             list: A list of style attributes
         """
-        return [
-            "rounded",
-            "sketch",
-            "shadow",
-            "flowAnimation",
-            "jettySize",
-            "entryX",
-            "entryY",
-            "entryDx",
-            "entryDy",
-            "exitX",
-            "exitY",
-            "exitDx",
-            "exitDy",
-            "startArrow",
-            "endArrow",
-            "startFill",
-            "endFill",
-            "strokeColor",
-            "strokeWidth",
-            "fillColor",
-            "jumpStyle",
-            "jumpSize",
-            "targetPerimeterSpacing",
-            "sourcePerimeterSpacing",
-            "endSize",
-            "startSize",
-            "opacity",
-        ]
+        return list(self._style_attributes)
 
     @property
     def baseStyle(self) -> Optional[str]:
@@ -598,16 +678,29 @@ class BasicEdge(Edge):
     pass
 
 
-class EdgeGeometry(DiagramBase):
+class EdgeGeometry(XMLValue):
     """This class stores the geometry associated with an edge. This is rendered as a subobject in the Draw.io file so it's convenient for it to have its own class."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "relative",
+        "points",
+        "source_point",
+        "target_point",
+        "as_attribute",
+    )
+
+    xml_class: str = "mxGeometry"
+
     def __init__(self, **kwargs: Any) -> None:
         """This class is automatically instantiated by a Edge object so the user should never need to create it."""
-        super().__init__(**kwargs)
-        self.xml_class: str = "mxGeometry"
-
+        self.x: Optional[float] = kwargs.get("x", None)
+        self.y: Optional[int] = kwargs.get("y", None)
         self.relative: int = kwargs.get("relative", 1)
         self.points: List[Point] = kwargs.get("points", [])
+        self.source_point: Optional[Point] = kwargs.get("source_point", None)
+        self.target_point: Optional[Point] = kwargs.get("target_point", None)
         self.as_attribute: str = kwargs.get("as_attribute", "geometry")
 
     def add_point(self, x: int, y: int) -> None:
@@ -630,16 +723,21 @@ class EdgeGeometry(DiagramBase):
 
     @property
     def xml(self) -> str:
-        if len(self.points) == 0:
+        end_points: List[Point] = [
+            pnt for pnt in (self.source_point, self.target_point) if pnt is not None
+        ]
+        if len(self.points) == 0 and len(end_points) == 0:
             return self.xml_open_tag[:-1] + " />"
-        else:
-            return (
-                self.xml_open_tag
-                + '\n<Array as="points">\n'
+        tag: str = self.xml_open_tag + "\n"
+        for pnt in end_points:
+            tag += pnt.xml + "\n"
+        if len(self.points) > 0:
+            tag += (
+                '<Array as="points">\n'
                 + "\n".join([pnt.xml for pnt in self.points])
                 + "\n</Array>\n"
-                + self.xml_close_tag
             )
+        return tag + self.xml_close_tag
 
 
 class EdgeLabel(DiagramBase):
@@ -661,14 +759,16 @@ class EdgeLabel(DiagramBase):
         return []
 
 
-class Point(DiagramBase):
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.xml_class: str = "mxPoint"
+class Point(XMLValue):
+    __slots__ = ("x", "y", "as_attribute")
+
+    xml_class: str = "mxPoint"
 
+    def __init__(self, **kwargs: Any) -> None:
         self.x: int = kwargs.get("x", 0)
         self.y: int = kwargs.get("y", 0)
+        self.as_attribute: Optional[str] = kwargs.get("as_attribute", None)
 
     @property
-    def attributes(self) -> Dict[str, int]:
-        return {"x": self.x, "y": self.y}
+    def attributes(self) -> Dict[str, Any]:
+        return {"x": self.x, "y": self.y, "as": self.as_attribute}
@@ -1,13 +1,14 @@
 from os import path
-from typing import Optional, Dict, Any, List, Union, Tuple
+from typing import Optional, Dict, Any, List, Sequence, Union, Tuple
 from ..utils.logger import logger
+from ..xml_base import WeakAttribute
 
 from .base_diagram import (
     DiagramBase,
     Geometry,
     import_shape_database,
 )
-from .text_format import TextFormat
+from .text_format import TextFormat, _TextFormatView, _resolve
 from ..utils.color_scheme import ColorScheme
 from ..utils.standard_colors import StandardColor
 
@@ -65,6 +66,17 @@ def object_from_library(
 ###########################################################
 
 
+def _shallow_copy(obj: DiagramBase) -> DiagramBase:
+    # A copy that shares the attribute values of obj but has its own ID and
+    # style attribute list, without running __init__
+    new = obj.__class__.__new__(obj.__class__)
+    new.__dict__.update(obj.__dict__)
+    new._id = id(new)
+    if "_style_attributes" in obj.__dict__:
+        new._style_attributes = list(obj._style_attributes)
+    return new
+
+
 class Object(DiagramBase):
     """
     The Object class is the base object for all shapes in Draw.io.
@@ -72,6 +84,29 @@ class Object(DiagramBase):
     More information about objects are in the Usage documents at [Usage - Objects](../../usage/objects).
     """
 
+    _style_attributes: Tuple[str, ...] = (
+        "whiteSpace",
+        "rounded",
+        "fillColor",
+        "strokeColor",
+        "glass",
+        "shadow",
+        "comic",
+        "sketch",
+        "opacity",
+        "dashed",
+    )
+
+    # Most objects never get children or edges, so they share these empty
+    # defaults until they do, see the children, in_edges, and out_edges
+    # properties
+    _children: Sequence["Object"] = ()
+    _in_edges: Sequence[Any] = ()
+    _out_edges: Sequence[Any] = ()
+
+    # The parent owns its children, so the child only refers back weakly
+    _parent = WeakAttribute()
+
     ###########################################################
     # Initialization Functions
     ###########################################################
@@ -108,24 +143,12 @@ class Object(DiagramBase):
             sketch (bool, optional): Add sketch styling to the object. Defaults to None.
             strokeColor (Union[str, StandardColor], optional): The object stroke color. Defaults to None.
             template_object (Object, optional): Another object to copy the style_attributes from. Defaults to None.
-            text_format (TextFormat, optional): Formatting specifically around text. Defaults to TextFormat().
+            text_format (TextFormat, optional): Formatting specifically around text. Defaults to the shared TextFormat.DEFAULT.
             vertex (int, optional): Vertex flag for the object. Defaults to 1.
             whiteSpace (str, optional): White space handling. Defaults to "wrap".
             width (int, optional): The width of the object in pixels. Defaults to 120.
         """
         super().__init__(**kwargs)
-        self._style_attributes: List[str] = [
-            "whiteSpace",
-            "rounded",
-            "fillColor",
-            "strokeColor",
-            "glass",
-            "shadow",
-            "comic",
-            "sketch",
-            "opacity",
-            "dashed",
-        ]
 
         self.geometry: Geometry = Geometry(parent_object=self)
 
@@ -139,7 +162,8 @@ class Object(DiagramBase):
             self.parent: Optional[Object] = parent
         else:
             self._parent: Optional[Object] = None
-        self.children: List[Object] = kwargs.get("children", [])
+        if "children" in kwargs:
+            self.children = kwargs["children"]
         self.autosize_to_children: bool = kwargs.get("autosize_to_children", False)
         self.autocontract: bool = kwargs.get("autocontract", False)
         self.autosize_margin: int = kwargs.get("autosize_margin", 20)
@@ -177,8 +201,10 @@ class Object(DiagramBase):
         self.sketch: Optional[bool] = kwargs.get("sketch", None)
         self.line_pattern: Optional[str] = kwargs.get("line_pattern", "solid")
 
-        self.out_edges: List[Any] = kwargs.get("out_edges", [])
-        self.in_edges: List[Any] = kwargs.get("in_edges", [])
+        if "out_edges" in kwargs:
+            self.out_edges = kwargs["out_edges"]
+        if "in_edges" in kwargs:
+            self.in_edges = kwargs["in_edges"]
 
         self.xml_class: str = "mxCell"
 
@@ -189,9 +215,16 @@ class Object(DiagramBase):
             self.height = self.template_object.height
 
         # Content
-        self.text_format: Optional[TextFormat] = kwargs.get("text_format", TextFormat())
-        if not self.text_format.fontColor and self.color_scheme:
-            self.text_format.fontColor = self.color_scheme.font_color
+        self._text_format: TextFormat = _resolve(
+            kwargs.get("text_format", TextFormat.DEFAULT)
+        )
+        if not self._text_format.fontColor and self.color_scheme:
+            if self._text_format.frozen:
+                self._text_format = self._text_format.replace(
+                    fontColor=self.color_scheme.font_color
+                )
+            else:
+                self._text_format.fontColor = self.color_scheme.font_color
         self.value: Optional[str] = value
 
         # If a parent was passed in, reactivate the parents autoexpanding and update it
@@ -216,8 +249,8 @@ class Object(DiagramBase):
             parts.append(f"parent: {self.parent.__class__.__name__}")
 
         # Child count
-        if getattr(self, "children", None):
-            parts.append(f"children: {len(self.children)}")
+        if self._children:
+            parts.append(f"children: {len(self._children)}")
 
         joined = " | ".join(parts)
         return f"{self.value} | {joined}"
@@ -260,6 +293,38 @@ class Object(DiagramBase):
             new_obj.value = value
         return new_obj
 
+    @classmethod
+    def create_many(cls, count: int, **kwargs: Any) -> List["Object"]:
+        """Create several objects with the same keyword arguments. Only the first object is built through __init__, the rest are copied from it with their own ID, geometry, and child and edge lists. They share the text format if it's frozen and get their own copy otherwise. This is much faster than calling the constructor when building thousands of similar objects, like the bars of a large chart. Set the values and positions of the objects afterwards.
+
+        Objects with a parent are created one at a time so each one is added to the parent. Subclasses that keep other per-object containers should create their objects one at a time as well.
+
+        Args:
+            count (int): The number of objects to create
+
+        Returns:
+            list[Object]: The new objects
+        """
+        if count < 1:
+            return []
+        if "parent" in kwargs or "xml_parent" in kwargs:
+            return [cls(**kwargs) for _ in range(count)]
+
+        first: Object = cls(**kwargs)
+        objects: List[Object] = [first]
+        for _ in range(count - 1):
+            obj = _shallow_copy(first)
+            obj.geometry = first.geometry.copy()
+            obj.geometry.parent_object = obj
+            if not first._text_format.frozen:
+                obj._text_format = first._text_format.copy()
+            for name in ("_children", "_in_edges", "_out_edges"):
+                obj.__dict__.pop(name, None)
+            if obj.page is not None:
+                obj.page.add_object(obj)
+            objects.append(obj)
+        return objects
+
     @classmethod
     def create_from_style_string(cls, style_string: str) -> "Object":
         """Objects can be instantiated from a style string. These strings are most easily found in the Draw.io app, by styling an object as desired then right-clicking and selecting "Edit Style". Copying that text into this function will generate an object styled the same.
@@ -329,6 +394,25 @@ class Object(DiagramBase):
             "parent": self.xml_parent_id,
         }
 
+    ###########################################################
+    # Text format
+    ###########################################################
+
+    @property
+    def text_format(self) -> TextFormat:
+        """The formatting of the object's text. Objects can share a frozen TextFormat, like the default one. Reading text_format doesn't copy it. The first change made through text_format gives the object its own mutable copy, so it can be changed without changing other objects.
+
+        Returns:
+            TextFormat: The text format of the object
+        """
+        if self._text_format.frozen:
+            return _TextFormatView(self)
+        return self._text_format
+
+    @text_format.setter
+    def text_format(self, value: TextFormat) -> None:
+        self._text_format = _resolve(value)
+
     ###########################################################
     # Style templates
     ###########################################################
@@ -514,10 +598,31 @@ class Object(DiagramBase):
     def parent(self, value: Optional["Object"]) -> None:
         if isinstance(value, Object):
             # value.add_object(self)
-            value.children.append(self)
+            value._own_list("_children").append(self)
             self.update_parent()
         self._parent = value
 
+    def _own_list(self, name: str) -> List[Any]:
+        # The object's own list for a container that's still the shared empty
+        # default, allocated the first time something is added to it
+        items = self.__dict__.get(name)
+        if items is None:
+            items = self.__dict__[name] = []
+        return items
+
+    @property
+    def children(self) -> Sequence["Object"]:
+        """The child objects of this object. Objects without children share an empty tuple, and only get their own list once a child is added with add_object() or by setting its parent. Reading the property never allocates.
+
+        Returns:
+            list[Object]: The child objects
+        """
+        return self._children
+
+    @children.setter
+    def children(self, value: List["Object"]) -> None:
+        self._children = value
+
     def add_object(self, child_object: "Object") -> None:
         """Adds a child object to this object, sets the child objects parent, and autoexpands this object if set to.
 
@@ -525,7 +630,7 @@ class Object(DiagramBase):
             child_object (Object): object to add as a child
         """
         child_object._parent = self  # Bypass the setter to prevent a loop
-        self.children.append(child_object)
+        self._own_list("_children").append(child_object)
         if self.autosize_to_children:
             self.resize_to_children()
 
@@ -536,7 +641,7 @@ class Object(DiagramBase):
             child_object (Object): object to remove as a child
         """
         child_object._parent = None  # Bypass the setter to prevent a loop
-        self.children.remove(child_object)
+        self.__dict__.get("_children", []).remove(child_object)
         if self.autosize_to_children:
             self.resize_to_children()
 
@@ -561,7 +666,7 @@ class Object(DiagramBase):
             contract (bool, optional): Contract the parent object to hug the children. Defaults to False.
         """
         # Get current extents
-        if len(self.children) == 0:
+        if len(self._children) == 0:
             return
         if self.autocontract:
             topmost: Union[int, float] = 65536
@@ -575,7 +680,7 @@ class Object(DiagramBase):
             rightmost: Union[int, float] = self.position[0] + self.width
 
         # Check all child objects for extents
-        for child_object in self.children:
+        for child_object in self._children:
             topmost = min(topmost, child_object.position[1] - self.autosize_margin)
             bottommost = max(
                 bottommost,
@@ -609,7 +714,7 @@ class Object(DiagramBase):
         pos_delta: List[Union[int, float]] = [
             old_pos - new_pos for old_pos, new_pos in zip(self.position, position)
         ]
-        for child_object in self.children:
+        for child_object in self._children:
             child_object.position = (
                 child_object.position[0] + pos_delta[0],
                 child_object.position[1] + pos_delta[1],
@@ -623,13 +728,39 @@ class Object(DiagramBase):
     # Edge Tracking
     ###########################################################
 
+    @property
+    def out_edges(self) -> Sequence[Any]:
+        """The edges starting at this object. Like children, it's the shared empty tuple until an edge is added with add_out_edge().
+
+        Returns:
+            list[Edge]: The edges out of the object
+        """
+        return self._out_edges
+
+    @out_edges.setter
+    def out_edges(self, value: List[Any]) -> None:
+        self._out_edges = value
+
+    @property
+    def in_edges(self) -> Sequence[Any]:
+        """The edges ending at this object. Like children, it's the shared empty tuple until an edge is added with add_in_edge().
+
+        Returns:
+            list[Edge]: The edges into the object
+        """
+        return self._in_edges
+
+    @in_edges.setter
+    def in_edges(self, value: List[Any]) -> None:
+        self._in_edges = value
+
     def add_out_edge(self, edge: Any) -> None:
         """Add an edge out of the object. If an edge is created with this object set as the source this function will be called automatically.
 
         Args:
             edge (Edge): An Edge object originating at this object
         """
-        self.out_edges.append(edge)
+        self._own_list("_out_edges").append(edge)
 
     def remove_out_edge(self, edge: Any) -> None:
         """Remove an edge out of the object. If an edge linked to this object has the source changed or removed this function will be called automatically.
@@ -637,7 +768,7 @@ class Object(DiagramBase):
         Args:
             edge (Edge): An Edge object originating at this object
         """
-        self.out_edges.remove(edge)
+        self.__dict__.get("_out_edges", []).remove(edge)
 
     def add_in_edge(self, edge: Any) -> None:
         """Add an edge into the object. If an edge is created with this object set as the target this function will be called automatically.
@@ -645,7 +776,7 @@ class Object(DiagramBase):
         Args:
             edge (Edge): An Edge object ending at this object
         """
-        self.in_edges.append(edge)
+        self._own_list("_in_edges").append(edge)
 
     def remove_in_edge(self, edge: Any) -> None:
         """Remove an edge into the object. If an edge linked to this object has the target changed or removed this function will be called automatically.
@@ -653,7 +784,7 @@ class Object(DiagramBase):
         Args:
             edge (Edge): An Edge object ending at this object
         """
-        self.in_edges.remove(edge)
+        self.__dict__.get("_in_edges", []).remove(edge)
 
     ###########################################################
     # XML Generation
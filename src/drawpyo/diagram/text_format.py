@@ -1,6 +1,8 @@
+import copy
+import weakref
 from typing import Optional, Dict, Any, Union
 from ..utils.logger import logger
-from .base_diagram import DiagramBase
+from ..xml_base import XMLValue
 
 __all__ = ["TextFormat"]
 
@@ -14,8 +16,68 @@ directions_inv: Dict[Optional[int], Optional[str]] = {
 }
 
 
-class TextFormat(DiagramBase):
-    """The TextFormat class handles all of the formatting specifically around a text box or label."""
+class TextFormat(XMLValue):
+    """The TextFormat class handles all of the formatting specifically around a text box or label.
+
+    A TextFormat can be frozen with freeze(). Frozen TextFormats can't be changed, so equal ones are interned and shared between any number of objects. Objects and edges created without a text_format share TextFormat.DEFAULT, and they give themselves a mutable copy the first time their text_format is changed.
+    """
+
+    __slots__ = (
+        "fontFamily",
+        "fontSize",
+        "fontColor",
+        "labelBorderColor",
+        "labelBackgroundColor",
+        "labelPosition",
+        "textShadow",
+        "textOpacity",
+        "spacingTop",
+        "spacingLeft",
+        "spacingBottom",
+        "spacingRight",
+        "spacing",
+        "align",
+        "verticalAlign",
+        "_direction",
+        "html",
+        "bold",
+        "italic",
+        "underline",
+        "_frozen",
+        "_style",
+        "__weakref__",
+    )
+
+    # The formatting attributes, everything but the frozen state
+    _FORMATTING: tuple = __slots__[:-3]
+
+    # The attributes printed into the style string, in order
+    _STYLE_ATTRIBUTES: tuple = (
+        "html",
+        "fontFamily",
+        "fontStyle",
+        "fontSize",
+        "fontColor",
+        "labelBorderColor",
+        "labelBackgroundColor",
+        "labelPosition",
+        "textShadow",
+        "textOpacity",
+        "spacingTop",
+        "spacingLeft",
+        "spacingBottom",
+        "spacingRight",
+        "spacing",
+        "align",
+        "verticalAlign",
+        "horizontal",
+    )
+
+    # Frozen TextFormats by their formatting, see freeze(). They're only
+    # kept while some object or edge still uses them.
+    _interned: "weakref.WeakValueDictionary[tuple, TextFormat]" = (
+        weakref.WeakValueDictionary()
+    )
 
     def __init__(self, **kwargs: Any) -> None:
         """TextFormat objects can be initialized with no properties or any of what's listed below:
@@ -37,7 +99,7 @@ class TextFormat(DiagramBase):
             formattedText (bool, optional): Whether to render the text as HTML formatted or not
 
         """
-        super().__init__(**kwargs)
+        object.__setattr__(self, "_frozen", False)
         self.fontFamily: Optional[str] = kwargs.get("fontFamily", None)
         self.fontSize: Optional[int] = kwargs.get("fontSize", None)
         self.fontColor: Optional[str] = kwargs.get("fontColor", None)
@@ -66,26 +128,120 @@ class TextFormat(DiagramBase):
         self.italic: bool = kwargs.get("italic", False)
         self.underline: bool = kwargs.get("underline", False)
 
-        self._style_attributes: list[str] = [
-            "html",
-            "fontFamily",
-            "fontStyle",
-            "fontSize",
-            "fontColor",
-            "labelBorderColor",
-            "labelBackgroundColor",
-            "labelPosition",
-            "textShadow",
-            "textOpacity",
-            "spacingTop",
-            "spacingLeft",
-            "spacingBottom",
-            "spacingRight",
-            "spacing",
-            "align",
-            "verticalAlign",
-            "horizontal",
-        ]
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(
+                "This TextFormat is frozen and may be shared between objects. Change a copy() of it instead."
+            )
+        object.__setattr__(self, name, value)
+
+    def __copy__(self) -> "TextFormat":
+        return self if self._frozen else self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TextFormat":
+        # Frozen TextFormats are immutable so they're never copied
+        if self._frozen:
+            return self
+        new_format = self.copy()
+        memo[id(self)] = new_format
+        return new_format
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._FORMATTING}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Unpickled TextFormats are mutable, freeze() them to share them again
+        object.__setattr__(self, "_frozen", False)
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    ###########################################################
+    # Freezing and copying
+    ###########################################################
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the TextFormat is frozen and can't be changed."""
+        return self._frozen
+
+    def copy(self) -> "TextFormat":
+        """Create a mutable copy of the TextFormat.
+
+        Returns:
+            TextFormat: The copy
+        """
+        new_format = self.__class__.__new__(self.__class__)
+        new_format.__setstate__(self.__getstate__())
+        return new_format
+
+    def freeze(self) -> "TextFormat":
+        """Get the frozen TextFormat with the same formatting. Equal frozen TextFormats are interned, so this returns the same instance for every TextFormat with this formatting, and its style string is only built once. The TextFormat itself isn't changed.
+
+        Returns:
+            TextFormat: The shared frozen TextFormat
+        """
+        if self._frozen:
+            return self
+        key = self._formatting_key()
+        frozen = TextFormat._interned.get(key)
+        if frozen is None:
+            frozen = self.copy()
+            object.__setattr__(frozen, "_style", frozen.style)
+            object.__setattr__(frozen, "_frozen", True)
+            TextFormat._interned[key] = frozen
+        return frozen
+
+    def replace(self, **kwargs: Any) -> "TextFormat":
+        """Get the frozen TextFormat with this formatting except for the attributes passed in.
+
+        Keyword Args:
+            Any TextFormat attribute, like align="center" or fontColor="#000000"
+
+        Returns:
+            TextFormat: The shared frozen TextFormat
+        """
+        if self._frozen and all(
+            getattr(self, attribute) == value for attribute, value in kwargs.items()
+        ):
+            return self
+        new_format = self.copy()
+        for attribute, value in kwargs.items():
+            setattr(new_format, attribute, value)
+        return new_format.freeze()
+
+    def _formatting_key(self) -> tuple:
+        # With the types of the values, as equal values like 12 and 12.0
+        # print differently into the style string
+        values = tuple(getattr(self, name) for name in self._FORMATTING)
+        return (self.__class__,) + values + tuple(map(type, values))
+
+    @property
+    def style_attributes(self) -> list[str]:
+        """The names of the attributes printed into the style string.
+
+        Returns:
+            list: A list of the names of the style_attributes.
+        """
+        return list(self._STYLE_ATTRIBUTES)
+
+    @property
+    def style(self) -> str:
+        """The style string of the text format, to be appended to the style of the owning object or edge.
+
+        Returns:
+            str: The style string of the text format.
+        """
+        if self._frozen:
+            return self._style
+        style_str = ""
+        for attribute in self._STYLE_ATTRIBUTES:
+            attr_val = getattr(self, attribute)
+            if attr_val is not None:
+                # reformat different datatypes to strings
+                if isinstance(attr_val, bool):
+                    attr_val = format(attr_val * 1)
+                style_str = style_str + "{0}={1};".format(attribute, attr_val)
+        return style_str
 
     def __repr__(self) -> str:
         """
@@ -142,6 +298,15 @@ class TextFormat(DiagramBase):
     def formattedText(self) -> None:
         self.html = None
 
+    @property
+    def font_color(self) -> Optional[str]:
+        """font_color is an alias of fontColor."""
+        return self.fontColor
+
+    @font_color.setter
+    def font_color(self, value: Optional[str]) -> None:
+        self.fontColor = value
+
     # The direction of the text is encoded as 'horizontal' in Draw.io. This is
     # unintuitive so I provided a direction alternate syntax.
     @property
@@ -210,3 +375,41 @@ class TextFormat(DiagramBase):
         if self.font_style != 0:
             return self.font_style
         return None
+
+
+# The text format shared by objects and edges created without one
+TextFormat.DEFAULT = TextFormat().freeze()
+
+
+class _TextFormatView(TextFormat):
+    """What the text_format property of an object or edge returns while it shares a frozen TextFormat. Attributes are read from the shared format, and the first change gives the owner its own mutable copy to change, so reading a text format never copies it."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: Any) -> None:
+        object.__setattr__(self, "_owner", owner)
+
+    def __getattribute__(self, name: str) -> Any:
+        return getattr(object.__getattribute__(self, "_owner")._text_format, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        owner = object.__getattribute__(self, "_owner")
+        if owner._text_format.frozen:
+            owner._text_format = owner._text_format.copy()
+        setattr(owner._text_format, name, value)
+
+    def __copy__(self) -> TextFormat:
+        return copy.copy(_resolve(self))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> TextFormat:
+        return copy.deepcopy(_resolve(self), memo)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return _resolve(self).__reduce_ex__(protocol)
+
+
+def _resolve(text_format: TextFormat) -> TextFormat:
+    """The TextFormat an object or edge stores for one passed to it, which is the format behind a view from another object's text_format."""
+    if type(text_format) is _TextFormatView:
+        return object.__getattribute__(text_format, "_owner")._text_format
+    return text_format
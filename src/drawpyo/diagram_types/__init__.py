@@ -1,6 +1,8 @@
 from .tree import NodeObject, TreeGroup, TreeDiagram
 from .class_diagram import ClassDiagram
 from .bar_chart import BarChart
+from .line_chart import LineChart
+from .heatmap import Heatmap
 from .pie_chart import PieChart
 from .legend import Legend
 from .binary_tree import BinaryNodeObject, BinaryTreeDiagram
@@ -12,6 +14,8 @@ __all__ = [
     TreeDiagram,
     ClassDiagram,
     BarChart,
+    LineChart,
+    Heatmap,
     PieChart,
     Legend,
     BinaryNodeObject,
@@ -1,11 +1,15 @@
 from typing import Callable, Union, Optional
-from copy import deepcopy
 from ..diagram.objects import Object, Group
 from ..diagram.text_format import TextFormat
 from ..utils.standard_colors import StandardColor
 from ..utils.color_scheme import ColorScheme
 from ..page import Page
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, charts fall back to plain Python
+    np = None
+
 
 class BarChart:
     """A configurable bar chart built entirely from Object and Group.
@@ -30,6 +34,10 @@ class BarChart:
     TICK_LABEL_MARGIN = 4
     TICK_COLOR = "#000000"
 
+    # Charts with at least this many bars are built with NumPy when it's
+    # installed and vectorize isn't set
+    VECTORIZE_MIN_BARS = 1000
+
     def __init__(self, data: dict[str, float], **kwargs):
         """
         Args:
@@ -53,6 +61,7 @@ class BarChart:
             axis_text_format (TextFormat): TextFormat for axis tick labels. Default: TextFormat()
             glass (bool): Whether bars have a glass effect. Default: False
             rounded (bool): Whether bars have rounded corners. Default: False
+            vectorize (bool): Whether to compute the bar geometry with NumPy. The chart is identical either way. Default: None, which uses NumPy for charts of 1000 bars or more when it's installed
         """
         # Validate data
         if not isinstance(data, dict):
@@ -83,17 +92,26 @@ class BarChart:
         )
 
         # Text formats
-        self._title_text_format: Optional[TextFormat] = deepcopy(
-            kwargs.get("title_text_format", TextFormat())
-        )
-        self._base_text_format: Optional[TextFormat] = deepcopy(
-            kwargs.get("base_text_format", TextFormat())
+        self._title_text_format: TextFormat = kwargs.get(
+            "title_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._base_text_format: TextFormat = kwargs.get(
+            "base_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._inside_text_format: TextFormat = kwargs.get(
+            "inside_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._axis_text_format: TextFormat = kwargs.get(
+            "axis_text_format", TextFormat.DEFAULT
+        ).freeze()
+
+        # Every bar label shares one of these frozen formats
+        self._inside_label_format: TextFormat = self._inside_text_format.replace(
+            align=self._inside_text_format.align or "center",
+            verticalAlign=self._inside_text_format.verticalAlign or "middle",
         )
-        self._inside_text_format: Optional[TextFormat] = deepcopy(
-            kwargs.get("inside_text_format", TextFormat())
-        )
-        self._axis_text_format: Optional[TextFormat] = deepcopy(
-            kwargs.get("axis_text_format", TextFormat())
+        self._base_label_format: TextFormat = self._base_text_format.replace(
+            align=self._base_text_format.align or "center"
         )
 
         # Label formatters
@@ -130,9 +148,19 @@ class BarChart:
         ] = bar_colors
         self._glass: Optional[bool] = kwargs.get("glass", False)
         self._rounded: Optional[bool] = kwargs.get("rounded", False)
+        self._vectorize: Optional[bool] = kwargs.get("vectorize", None)
+        if self._vectorize and np is None:
+            raise ImportError("vectorize=True requires NumPy to be installed.")
 
-        # Build the chart
+        # Build the chart. The objects are kept by role so updates can change
+        # them in place, and the bars and their base labels by data label.
         self._group: Group = Group()
+        self._background: Optional[Object] = None
+        self._title_obj: Optional[Object] = None
+        self._axis_objects: list[Object] = []
+        self._tick_labels: list[Object] = []
+        self._bars: dict[str, tuple[Object, Object]] = {}
+        self._pages: list[Page] = []
         self._build_chart()
 
     # ------------------------------------------------------------------
@@ -156,6 +184,11 @@ class BarChart:
     # ------------------------------------------------------------------
 
     def update_data(self, data: dict[str, Union[float, int]]) -> None:
+        """Replace the chart data. The bars are matched to the data by label: bars that are still in the data are moved and relabeled in place and keep their IDs, new bars are created, and the bars that are gone are removed from the chart and from the pages it was added to.
+
+        Args:
+            data (dict[str, float]): Mapping of labels to numeric values.
+        """
         # Validate data
         if not isinstance(data, dict):
             raise TypeError("Data must be a dict.")
@@ -179,6 +212,11 @@ class BarChart:
     def update_colors(
         self, bar_colors: list[Union[str, StandardColor, ColorScheme]]
     ) -> None:
+        """Recolor the bars in place.
+
+        Args:
+            bar_colors (list[Union[str, StandardColor, ColorScheme]]): List of colors, repeated if there are more bars than colors.
+        """
         self._original_bar_colors = bar_colors
         self._bar_colors = self._normalize_colors(bar_colors, len(self._data))
         self._rebuild()
@@ -198,8 +236,15 @@ class BarChart:
         self._group.update_geometry()
 
     def add_to_page(self, page: Page) -> None:
+        """Add the chart objects to a page. Later updates to the chart add and remove objects on the page to match.
+
+        Args:
+            page (Page): The page to draw the chart on
+        """
         for obj in self._group.objects:
             page.add_object(obj)
+        if page not in self._pages:
+            self._pages.append(page)
 
     # ------------------------------------------------------------------
     # Private methods
@@ -246,19 +291,60 @@ class BarChart:
 
         return width, height
 
+    def _content_y(self) -> int:
+        # The top of the bars, below the title
+        _, y = self._position
+        if self._title:
+            y += (self._title_text_format.fontSize or 16) + self.TITLE_BOTTOM_MARGIN
+        return y
+
     def _rebuild(self) -> None:
-        self._group.objects.clear()
-        self._build_chart()
+        # Bring the existing objects up to date with the data and colors,
+        # creating and removing only the bars that were added or removed
+        scale = self._calculate_scale()
+        content_y = self._content_y()
+
+        if self._background is not None:
+            self._place_background(self._background)
+        if self._title_obj is not None:
+            self._place_title(self._title_obj)
+        for i, label_obj in enumerate(self._tick_labels):
+            label_obj.value = self._tick_label(i)
+
+        old_bars = self._bars
+        self._bars = {}
+        added: list[Object] = []
+        for i, (key, value) in enumerate(self._data.items()):
+            if key in old_bars:
+                bar, base_obj = old_bars.pop(key)
+                self._bars[key] = (bar, base_obj)
+                self._place_bar_and_label(
+                    bar, base_obj, i, key, value, content_y, scale
+                )
+            else:
+                added.extend(self._add_bar_and_label(i, key, value, content_y, scale))
+        removed = [obj for objs in old_bars.values() for obj in objs]
+
+        # Keep the group in build order
+        self._group.objects[:] = self._fixed_objects() + [
+            obj for objs in self._bars.values() for obj in objs
+        ]
+        self._group.update_geometry()
+
+        for page in self._pages:
+            if removed:
+                page.remove_objects(removed)
+            for obj in added:
+                page.add_object(obj)
+
+    def _fixed_objects(self) -> list[Object]:
+        # The objects that don't depend on the number of bars
+        objects = [o for o in (self._background, self._title_obj) if o is not None]
+        return objects + self._axis_objects
 
     def _build_chart(self) -> None:
-        x, y = self._position
         scale = self._calculate_scale()
-
-        content_y = y
-        if self._title:
-            content_y += (
-                self._title_text_format.fontSize or 16
-            ) + self.TITLE_BOTTOM_MARGIN
+        content_y = self._content_y()
 
         if self._background_color:
             self._add_background()
@@ -269,43 +355,52 @@ class BarChart:
         if self._show_axis:
             self._add_axis_and_ticks(content_y, scale)
 
-        for i, (key, value) in enumerate(self._data.items()):
-            self._add_bar_and_label(i, key, value, content_y, scale)
+        if self._use_vectorized(scale):
+            self._add_bars_vectorized(content_y, scale)
+        else:
+            for i, (key, value) in enumerate(self._data.items()):
+                self._add_bar_and_label(i, key, value, content_y, scale)
 
+        self._group.objects[:] = self._fixed_objects() + [
+            obj for objs in self._bars.values() for obj in objs
+        ]
         self._group.update_geometry()
 
     def _add_background(self) -> None:
-        width, height = self._calculate_chart_dimensions()
-        x, y = self._position
-
         bg = Object(
             value="",
-            position=(x - self.BACKGROUND_PADDING, y - self.BACKGROUND_PADDING),
-            width=width + 2 * self.BACKGROUND_PADDING,
-            height=height + 2 * self.BACKGROUND_PADDING,
             fillColor=self._background_color,
             strokeColor=None,
         )
-        self._group.add_object(bg)
+        self._place_background(bg)
+        self._background = bg
 
-    def _add_title(self) -> None:
+    def _place_background(self, bg: Object) -> None:
+        width, height = self._calculate_chart_dimensions()
         x, y = self._position
-        chart_width, _ = self._calculate_chart_dimensions()
 
+        bg.position = (x - self.BACKGROUND_PADDING, y - self.BACKGROUND_PADDING)
+        bg.width = width + 2 * self.BACKGROUND_PADDING
+        bg.height = height + 2 * self.BACKGROUND_PADDING
+
+    def _add_title(self) -> None:
         title_obj = Object(
             value=self._title,
-            position=(x, y),
-            width=chart_width,
             height=(self._title_text_format.fontSize or 16) + 4,
             fillColor="none",
             strokeColor="none",
         )
-        title_obj.text_format = deepcopy(self._title_text_format)
-        title_obj.text_format.align = title_obj.text_format.align or "center"
-        title_obj.text_format.verticalAlign = (
-            title_obj.text_format.verticalAlign or "top"
+        title_obj.text_format = self._title_text_format.replace(
+            align=self._title_text_format.align or "center",
+            verticalAlign=self._title_text_format.verticalAlign or "top",
         )
-        self._group.add_object(title_obj)
+        self._place_title(title_obj)
+        self._title_obj = title_obj
+
+    def _place_title(self, title_obj: Object) -> None:
+        chart_width, _ = self._calculate_chart_dimensions()
+        title_obj.position = self._position
+        title_obj.width = chart_width
 
     # Draw axis and tick marks
     def _add_axis_and_ticks(self, content_y: int, scale: float) -> None:
@@ -323,21 +418,25 @@ class BarChart:
             fillColor=None,
             strokeColor=self.TICK_COLOR,
         )
-        self._group.add_object(axis_line)
+        self._axis_objects.append(axis_line)
 
         self._add_ticks(axis_x, content_y, scale)
 
+    def _tick_label(self, i: int) -> str:
+        t = i / self._axis_tick_count
+        tick_value = max(self._data.values()) * (1 - t)
+        return str(round(tick_value, 2))
+
     def _add_ticks(self, axis_x: int, content_y: int, scale: float) -> None:
         if self._axis_tick_count < 1:
             return
 
-        max_value = max(self._data.values())
         font_size = self._axis_text_format.fontSize or 12
+        label_format = self._axis_text_format.replace(align="right")
 
         for i in range(self._axis_tick_count + 1):
             t = i / self._axis_tick_count
 
-            tick_value = max_value * (1 - t)
             tick_y = content_y + (self._max_bar_height * t)
 
             tick = Object(
@@ -348,10 +447,10 @@ class BarChart:
                 fillColor=None,
                 strokeColor=self.TICK_COLOR,
             )
-            self._group.add_object(tick)
+            self._axis_objects.append(tick)
 
             label_obj = Object(
-                value=str(round(tick_value, 2)),
+                value=self._tick_label(i),
                 position=(
                     axis_x - self.TICK_LENGTH - self.TICK_LABEL_MARGIN - 40,
                     tick_y - font_size / 2,
@@ -361,63 +460,154 @@ class BarChart:
                 fillColor="none",
                 strokeColor="none",
             )
-            label_obj.text_format = deepcopy(self._axis_text_format)
-            label_obj.text_format.align = "right"
-            self._group.add_object(label_obj)
+            label_obj.text_format = label_format
+            self._axis_objects.append(label_obj)
+            self._tick_labels.append(label_obj)
 
     def _add_bar_and_label(
         self, index: int, key: str, value: float, content_y: int, scale: float
+    ) -> tuple[Object, Object]:
+        bar = Object(
+            value="",
+            width=self._bar_width,
+            rounded=self._rounded,
+            glass=self._glass,
+            text_format=self._inside_label_format,
+        )
+
+        base_obj = Object(
+            value="",
+            width=self._bar_width,
+            height=(self._base_text_format.fontSize or 12) + 10,
+            fillColor="none",
+            strokeColor="none",
+            text_format=self._base_label_format,
+        )
+
+        self._place_bar_and_label(bar, base_obj, index, key, value, content_y, scale)
+        self._bars[key] = (bar, base_obj)
+        return bar, base_obj
+
+    def _place_bar_and_label(
+        self,
+        bar: Object,
+        base_obj: Object,
+        index: int,
+        key: str,
+        value: float,
+        content_y: int,
+        scale: float,
     ) -> None:
         x, _ = self._position
         bar_height = value * scale
-        if isinstance(self._bar_colors[index], ColorScheme):
-            color_scheme = self._bar_colors[index]
-        elif isinstance(self._bar_colors[index], (StandardColor, str)):
-            fill_color = self._bar_colors[index]
 
         # Calculate geometry
         bar_x = x + index * (self._bar_width + self._bar_spacing)
         bar_y = content_y + (self._max_bar_height - bar_height)
-        bar_width = self._bar_width
 
-        # Resolve color
-        color_value = self._bar_colors[index]
+        # INSIDE LABEL
+        bar.value = self._inside_label_formatter(key, value)
+        bar.position = (bar_x, bar_y)
+        bar.height = bar_height
+        (
+            bar.color_scheme,
+            bar.fillColor,
+            bar.strokeColor,
+            bar.text_format,
+        ) = self._bar_color_attributes(self._bar_colors[index])
+
+        # BASE LABEL
+        base_obj.value = self._base_label_formatter(key, value)
+        base_obj.position = (
+            bar_x,
+            content_y + self._max_bar_height + self.LABEL_TOP_MARGIN,
+        )
+
+    def _bar_color_attributes(
+        self, color_value: Union[str, StandardColor, ColorScheme]
+    ) -> tuple:
+        # Resolve color the way Object applies color_scheme and fillColor:
+        # the color scheme, fill, stroke, and inside label format of a bar
         color_scheme = color_value if isinstance(color_value, ColorScheme) else None
-        fill_color = None if color_scheme else color_value
+        font_color = self._inside_text_format.fontColor or (
+            color_scheme.font_color if color_scheme else None
+        )
+        text_format = self._inside_label_format.replace(fontColor=font_color)
+        if color_scheme:
+            return (
+                color_scheme,
+                color_scheme.fill_color,
+                color_scheme.stroke_color,
+                text_format,
+            )
+        return None, color_value, None, text_format
+
+    def _use_vectorized(self, scale: float) -> bool:
+        # An all zero chart has an integer scale, which only the scalar path
+        # keeps as integer bar heights
+        if np is None or self._vectorize is False or isinstance(scale, int):
+            return False
+        return bool(self._vectorize) or len(self._data) >= self.VECTORIZE_MIN_BARS
+
+    def _add_bars_vectorized(self, content_y: int, scale: float) -> None:
+        # Compute the geometry of every bar at once with the same arithmetic
+        # as _place_bar_and_label, then convert back to Python numbers so the
+        # XML matches the scalar path exactly
+        x, _ = self._position
+        keys = list(self._data)
+        values = list(self._data.values())
+        count = len(keys)
 
-        # INSIDE LABEL
-        inside_label = self._inside_label_formatter(key, value)
-        inside_text_format = deepcopy(self._inside_text_format)
-        inside_text_format.align = inside_text_format.align or "center"
-        inside_text_format.verticalAlign = inside_text_format.verticalAlign or "middle"
+        heights = np.asarray(values, dtype=float) * scale
+        bar_ys = (content_y + (self._max_bar_height - heights)).tolist()
+        bar_xs = (x + np.arange(count) * (self._bar_width + self._bar_spacing)).tolist()
+        heights = heights.tolist()
+        base_y = content_y + self._max_bar_height + self.LABEL_TOP_MARGIN
 
-        bar = Object(
-            value=inside_label,
-            position=(bar_x, bar_y),
-            width=bar_width,
-            height=bar_height,
-            color_scheme=color_scheme,
-            fillColor=fill_color,
+        bars = Object.create_many(
+            count,
+            value="",
+            width=self._bar_width,
             rounded=self._rounded,
             glass=self._glass,
-            text_format=inside_text_format,
+            text_format=self._inside_label_format,
         )
-
-        self._group.add_object(bar)
-
-        # BASE LABEL
-        base_label = self._base_label_formatter(key, value)
-        base_obj = Object(
-            value=base_label,
-            position=(bar_x, content_y + self._max_bar_height + self.LABEL_TOP_MARGIN),
-            width=bar_width,
+        base_objs = Object.create_many(
+            count,
+            value="",
+            width=self._bar_width,
             height=(self._base_text_format.fontSize or 12) + 10,
             fillColor="none",
             strokeColor="none",
+            text_format=self._base_label_format,
         )
-        base_obj.text_format = deepcopy(self._base_text_format)
-        base_obj.text_format.align = base_obj.text_format.align or "center"
-        self._group.add_object(base_obj)
+
+        # Colors repeat, so resolve each distinct one once
+        color_attributes = {}
+        for i, key in enumerate(keys):
+            bar = bars[i]
+            base_obj = base_objs[i]
+            value = values[i]
+            color_value = self._bar_colors[i]
+            if id(color_value) not in color_attributes:
+                color_attributes[id(color_value)] = self._bar_color_attributes(
+                    color_value
+                )
+            (
+                bar.color_scheme,
+                bar.fillColor,
+                bar.strokeColor,
+                bar.text_format,
+            ) = color_attributes[id(color_value)]
+
+            bar.value = self._inside_label_formatter(key, value)
+            bar.geometry.x = bar_xs[i]
+            bar.geometry.y = bar_ys[i]
+            bar.geometry.height = heights[i]
+            base_obj.value = self._base_label_formatter(key, value)
+            base_obj.geometry.x = bar_xs[i]
+            base_obj.geometry.y = base_y
+            self._bars[key] = (bar, base_obj)
 
     def __repr__(self) -> str:
         return f"BarChart(bars={len(self._data)}, position={self._position})"
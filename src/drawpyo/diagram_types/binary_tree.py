@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 
 from .tree import NodeObject, TreeDiagram
 import drawpyo
-import hashlib
 
 
 class BinaryNodeObject(NodeObject):
@@ -57,6 +56,7 @@ class BinaryNodeObject(NodeObject):
                 if existing is node:
                     parent.tree_children[i] = None
                     break
+            parent._changed()
 
         node._tree_parent = None
 
@@ -84,6 +84,7 @@ class BinaryNodeObject(NodeObject):
             if existing is not None:
                 self.tree_children[index] = None
                 existing._tree_parent = None
+                self._changed()
             return
 
         if not node in self.tree_children:
@@ -100,6 +101,7 @@ class BinaryNodeObject(NodeObject):
 
         self.tree_children[index] = node
         node._tree_parent = self
+        self._changed()
 
     # ---------------------------------------------------------
     # Properties and setters
@@ -131,6 +133,7 @@ class BinaryTreeDiagram(TreeDiagram):
     DEFAULT_ITEM_SPACING = 20
     DEFAULT_GROUP_SPACING = 30
     DEFAULT_LINK_STYLE = "straight"
+    COLORING_MODES = TreeDiagram.COLORING_MODES + ["directional"]
 
     def __init__(self, **kwargs) -> None:
         kwargs.setdefault("level_spacing", self.DEFAULT_LEVEL_SPACING)
@@ -159,6 +162,35 @@ class BinaryTreeDiagram(TreeDiagram):
     def add_right(self, parent: BinaryNodeObject, child: BinaryNodeObject) -> None:
         self._attach(parent, child, "right")
 
+    @classmethod
+    def _choose_color(
+        cls,
+        colors: Optional[list],
+        coloring: str,
+        value: str,
+        node_type: str,
+        depth: int,
+        side: Optional[object] = None,
+    ):
+        """Return a color from the palette based on mode. In directional mode the side is 'left' or 'right', or a boolean where True is left."""
+        if not colors or coloring != "directional":
+            return super()._choose_color(colors, coloring, value, node_type, depth)
+
+        if len(colors) < 2:
+            raise ValueError(
+                "colors list must be of length at least 2 for directional coloring"
+            )
+
+        if side is None:
+            return None
+
+        if isinstance(side, bool):
+            is_left = side
+        else:
+            is_left = str(side).lower() == "left"
+
+        return colors[0 if is_left else 1]
+
     @classmethod
     def from_dict(
         cls,
@@ -181,51 +213,54 @@ class BinaryTreeDiagram(TreeDiagram):
             Note: In colors Left Nodes are coloured by 0th index and Right Nodes are coloured by 1st index in the list of colors.
         """
 
-        if coloring not in {"depth", "hash", "type", "directional"}:
-            raise ValueError(f"Invalid coloring mode: {coloring}")
-
-        if colors is not None and not isinstance(colors, list):
-            raise TypeError("colors must be a list or None")
-
-        colors = colors or None
-        TYPE_INDEX = {"category": 0, "list_item": 1, "leaf": 2}
+        colors = cls._check_coloring(colors, coloring)
 
         # -------------------------
         # Validation
         # -------------------------
 
-        def validate(tree_node: Dict, *, is_root=False):
-            if tree_node is None or isinstance(tree_node, (str, int, float)):
-                return
+        def validate(data: Dict):
+            # Depth first with an explicit stack so deep trees don't hit the
+            # recursion limit. Each entry is (tree_node, is_root, is_key, key),
+            # where is_key marks the entries of a dict.
+            stack = [(data, True, False, None)]
+            while stack:
+                tree_node, is_root, is_key, key = stack.pop()
+
+                if is_key:
+                    if not isinstance(key, (str, int, float)):
+                        raise TypeError(f"Invalid dict key type: {type(key)}")
+                    stack.append((tree_node, False, False, None))
+                    continue
 
-            if isinstance(tree_node, (list, tuple)):
-                if len(tree_node) > 2:
-                    raise TypeError("List node can have at most two children")
-                for x in tree_node:
-                    validate(x)
-                return
+                if tree_node is None or isinstance(tree_node, (str, int, float)):
+                    continue
 
-            if isinstance(tree_node, dict):
-                if is_root and len(tree_node) != 1:
-                    raise TypeError("Root dict must contain exactly one key")
+                if isinstance(tree_node, (list, tuple)):
+                    if len(tree_node) > 2:
+                        raise TypeError("List node can have at most two children")
+                    for x in reversed(tree_node):
+                        stack.append((x, False, False, None))
+                    continue
 
-                if not is_root and not (1 <= len(tree_node) <= 2):
-                    raise TypeError("Dict node must have 1 or 2 children")
+                if isinstance(tree_node, dict):
+                    if is_root and len(tree_node) != 1:
+                        raise TypeError("Root dict must contain exactly one key")
 
-                for node, children in tree_node.items():
-                    if not isinstance(node, (str, int, float)):
-                        raise TypeError(f"Invalid dict key type: {type(node)}")
+                    if not is_root and not (1 <= len(tree_node) <= 2):
+                        raise TypeError("Dict node must have 1 or 2 children")
 
-                    validate(children)
-                return
+                    for node, children in reversed(list(tree_node.items())):
+                        stack.append((children, False, True, node))
+                    continue
 
-            raise TypeError(f"Unsupported tree tree_node type: {type(tree_node)}")
+                raise TypeError(f"Unsupported tree tree_node type: {type(tree_node)}")
 
         if not isinstance(data, dict):
             raise TypeError("Top-level tree must be a dict")
 
         # Checks if the provided dict data is valid for a binary tree construction
-        validate(data, is_root=True)
+        validate(data)
 
         # -------------------------
         # Helpers
@@ -236,37 +271,7 @@ class BinaryTreeDiagram(TreeDiagram):
         def choose_color(
             value: str, node_type: str, depth: int, side: Optional[object] = None
         ):
-            if not colors:
-                return None
-
-            n = len(colors)
-
-            if coloring == "depth":
-                idx = depth % n
-            elif coloring == "hash":
-                h = int(hashlib.md5(value.encode()).hexdigest(), 16)
-                idx = h % n
-            elif coloring == "directional":
-                # side can be 'left'/'right' or a boolean where True==left
-                if n < 2:
-                    raise ValueError(
-                        "colors list must be of length at least 2 for directional coloring"
-                    )
-
-                if side is None:
-                    return None
-
-                if isinstance(side, bool):
-                    is_left = side
-                else:
-                    is_left = str(side).lower() == "left"
-
-                idx = (0 if is_left else 1) % n
-
-            else:  # type
-                idx = TYPE_INDEX[node_type] % n
-
-            return colors[idx]
+            return cls._choose_color(colors, coloring, value, node_type, depth, side)
 
         def create_node(value: str, parent, color):
             if color is None:
@@ -285,74 +290,89 @@ class BinaryTreeDiagram(TreeDiagram):
         # Build
         # -------------------------
 
-        def build(parent: BinaryNodeObject, item: Any, depth: int):
-            if item is None:
-                return
-
-            # Leaf
-            if isinstance(item, (str, int, float)):
-                value = str(item)
-                # leaf nodes in this branch are always attached as left
-                node = create_node(
-                    value,
-                    parent,
-                    choose_color(value, "leaf", depth, side="left"),
-                )
+        def attach(parent: BinaryNodeObject, node: BinaryNodeObject, index: int):
+            if index == 0:
                 diagram.add_left(parent, node)
-                return
-
-            # Dict (named children)
-            if isinstance(item, dict):
-                for index, (node, children) in enumerate(item.items()):
-                    name = str(node)
+            else:
+                diagram.add_right(parent, node)
+
+        def build(root: BinaryNodeObject, root_value: Any):
+            # Depth first with an explicit stack so deep trees don't hit the
+            # recursion limit. Each entry is (kind, parent, index, key, item,
+            # depth): "children" entries hold the children of parent, "dict"
+            # and "list" entries hold the child at index of a dict or list.
+            stack = [("children", root, None, None, root_value, 1)]
+            while stack:
+                kind, parent, index, key, item, depth = stack.pop()
+
+                # Dict (named children)
+                if kind == "dict":
+                    name = str(key)
                     side = "left" if index == 0 else "right"
                     node = create_node(
                         name,
                         parent,
                         choose_color(name, "category", depth, side=side),
                     )
+                    attach(parent, node, index)
+                    stack.append(("children", node, None, None, item, depth + 1))
+                    continue
 
-                    if index == 0:
-                        diagram.add_left(parent, node)
+                # List / Tuple (positional children)
+                if kind == "list":
+                    side = "left" if index == 0 else "right"
+                    if isinstance(item, (str, int, float)):
+                        name = str(item)
+                        node = create_node(
+                            name,
+                            parent,
+                            choose_color(name, "leaf", depth + 1, side=side),
+                        )
+                        attach(parent, node, index)
+
+                    elif isinstance(item, dict) and len(item) == 1:
+                        node, children = next(iter(item.items()))
+                        name = str(node)
+                        node = create_node(
+                            name,
+                            parent,
+                            choose_color(name, "category", depth + 1, side=side),
+                        )
+                        attach(parent, node, index)
+                        stack.append(
+                            ("children", node, None, None, children, depth + 1)
+                        )
                     else:
-                        diagram.add_right(parent, node)
-
-                    build(node, children, depth + 1)
-                return
+                        raise TypeError(
+                            "List elements must be primitive or single-key dict"
+                        )
+                    continue
 
-            # List / Tuple (positional children)
-            for index, elem in enumerate(item):
-                if elem is None:
+                if item is None:
                     continue
 
-                if isinstance(elem, (str, int, float)):
-                    name = str(elem)
-                    side = "left" if index == 0 else "right"
+                # Leaf
+                if isinstance(item, (str, int, float)):
+                    value = str(item)
+                    # leaf nodes in this branch are always attached as left
                     node = create_node(
-                        name,
+                        value,
                         parent,
-                        choose_color(name, "leaf", depth + 1, side=side),
+                        choose_color(value, "leaf", depth, side="left"),
                     )
+                    diagram.add_left(parent, node)
+                    continue
 
-                elif isinstance(elem, dict) and len(elem) == 1:
-                    node, children = next(iter(elem.items()))
-                    name = str(node)
-                    side = "left" if index == 0 else "right"
-                    node = create_node(
-                        name,
-                        parent,
-                        choose_color(name, "category", depth + 1, side=side),
-                    )
-                    build(node, children, depth + 1)
-                else:
-                    raise TypeError(
-                        "List elements must be primitive or single-key dict"
-                    )
+                # Children are pushed in reverse so they're built in order
+                if isinstance(item, dict):
+                    entries = list(enumerate(item.items()))
+                    for index, (node, children) in reversed(entries):
+                        stack.append(("dict", parent, index, node, children, depth))
+                    continue
 
-                if index == 0:
-                    diagram.add_left(parent, node)
-                else:
-                    diagram.add_right(parent, node)
+                for index, elem in reversed(list(enumerate(item))):
+                    if elem is not None:
+                        stack.append(("list", parent, index, None, elem, depth))
 
         # -------------------------
         # Root
@@ -367,6 +387,88 @@ class BinaryTreeDiagram(TreeDiagram):
             choose_color(root_name, "category", 0, None),
         )
 
-        build(root, root_value, depth=1)
+        build(root, root_value)
         diagram.auto_layout()
         return diagram
+
+    @classmethod
+    def from_array(
+        cls,
+        values: Sequence[Any],
+        *,
+        colors: list = None,
+        coloring: str = "depth",
+        **kwargs,
+    ) -> "BinaryTreeDiagram":
+        """
+        Build a BinaryTreeDiagram from a heap ordered array, like the array behind a binary heap or segment tree. The children of the value at index i are at 2i + 1 and 2i + 2, and None marks a missing node.
+
+        This is a fast path for large, mostly complete trees: the nodes and their links are created in one pass over the array, and each node is placed from its index and depth alone, as if the tree were complete. Every leaf slot of the bottom level gets its own column, so sparse trees come out wider than with auto_layout.
+        values: Sequence of node values in heap order, with None for missing nodes.
+        colors: List of ColorSchemes, StandardColors, or color hex strings to use for coloring nodes. Default: None
+        coloring: str - "depth" | "hash" | "type" | "directional" - Method to match colors to nodes, as in from_dict. Default: "depth"
+        """
+        colors = cls._check_coloring(colors, coloring)
+        values = list(values)
+        diagram = cls(**kwargs)
+
+        # Trailing holes don't add levels
+        last = len(values) - 1
+        while last >= 0 and values[last] is None:
+            last -= 1
+        if last < 0:
+            return diagram
+        for index in range(1, last + 1):
+            if values[index] is not None and values[(index - 1) // 2] is None:
+                raise ValueError(
+                    "The value at index {0} has no parent. Its parent at index {1} is None.".format(
+                        index, (index - 1) // 2
+                    )
+                )
+
+        def has_value(index: int) -> bool:
+            return index <= last and values[index] is not None
+
+        levels = (last + 1).bit_length()
+        nodes: List[Optional[BinaryNodeObject]] = [None] * (last + 1)
+        for index in range(last + 1):
+            if values[index] is None:
+                continue
+            value = str(values[index])
+            depth = (index + 1).bit_length() - 1
+            if has_value(2 * index + 1) or has_value(2 * index + 2):
+                node_type = "category"
+            else:
+                node_type = "leaf"
+            side = None if index == 0 else ("left" if index % 2 else "right")
+            color = cls._choose_color(colors, coloring, value, node_type, depth, side)
+            node = BinaryNodeObject(
+                tree=diagram, value=value, **cls._color_kwargs(color)
+            )
+            nodes[index] = node
+
+            if index == 0:
+                # Every node has the default size, so the root sets the grid:
+                # one column per slot of the bottom level, centered on the
+                # origin like auto_layout
+                column = node.size_in_level + diagram.item_spacing
+                band = node.size_of_level + diagram.level_spacing
+                span = (1 << (levels - 1)) * column - diagram.item_spacing
+                start = diagram.move_in_level(diagram.origin, -span / 2)
+            else:
+                parent = nodes[(index - 1) // 2]
+                parent._assign_child(1 - index % 2, node)
+                diagram.connect(parent, node)
+
+            # A node at depth d sits over the 2^(levels - 1 - d) columns of its
+            # subtree
+            slot = index + 1 - (1 << depth)
+            columns = 1 << (levels - 1 - depth)
+            node.center_position = diagram.move_between_levels(
+                diagram.move_in_level(
+                    start, (slot + 0.5) * columns * column - diagram.item_spacing / 2
+                ),
+                depth * band + node.size_of_level / 2,
+            )
+
+        return diagram
@@ -0,0 +1,486 @@
+import math
+from typing import Callable, Union, Optional, Sequence
+from numbers import Real
+from ..diagram.objects import Object, Group
+from ..diagram.text_format import TextFormat
+from ..utils.standard_colors import StandardColor
+from ..utils.color_scheme import ColorScheme
+from ..page import Page
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, heatmaps fall back to plain Python
+    np = None
+
+
+class Heatmap:
+    """A heatmap of a 2-D grid of values built from Object and Group. Every value is drawn as a cell filled with a color from a colormap, quantized to a fixed number of levels.
+
+    This chart is mutable - you can update data, styling, and position after creation.
+    """
+
+    # Layout constants
+    DEFAULT_CELL_SIZE = 20
+    DEFAULT_LEVELS = 16
+
+    # Spacing constants
+    TITLE_BOTTOM_MARGIN = 10
+    LABEL_MARGIN = 4
+    ROW_LABEL_WIDTH = 60
+
+    # Colormaps from the lowest to the highest value. Colors in between are
+    # interpolated.
+    COLORMAPS = {
+        "blues": ["#F7FBFF", "#6BAED6", "#08306B"],
+        "reds": ["#FFF5F0", "#FB6A4A", "#67000D"],
+        "greens": ["#F7FCF5", "#74C476", "#00441B"],
+        "grays": ["#FFFFFF", "#000000"],
+        "viridis": ["#440154", "#3B528B", "#21918C", "#5EC962", "#FDE725"],
+        "coolwarm": ["#3B4CC0", "#DDDDDD", "#B40426"],
+    }
+
+    # Grids with at least this many cells are built with NumPy when it's
+    # installed and vectorize isn't set
+    VECTORIZE_MIN_CELLS = 1000
+
+    def __init__(self, data: Sequence[Sequence[float]], **kwargs):
+        """
+        Args:
+            data (list[list[float]]): The grid of values as a list of rows, or a 2-D NumPy array.
+
+        Keyword Args:
+            position (tuple[int, int]): Chart top-left position. Default: (0, 0)
+            cell_width (int): Width of each cell. Default: 20
+            cell_height (int): Height of each cell. Default: 20
+            colormap (str | list[str | StandardColor]): Name of one of the COLORMAPS or a list of hex colors from the lowest to the highest value. Default: "blues"
+            levels (int): Number of colors the values are quantized to. Default: 16
+            value_range (tuple[float, float]): The values mapped to the first and last color, values outside it are clamped. Default: the range of the data
+            missing_color (str | StandardColor): Fill for NaN values. Default: "none"
+            grid_color (str | StandardColor): Stroke color between the cells. Default: "#FFFFFF"
+            row_labels (list[str]): Optional labels left of the rows. Default: None
+            column_labels (list[str]): Optional labels above the columns. Default: None
+            label_text_format (TextFormat): TextFormat for row and column labels. Default: TextFormat()
+            show_values (bool): Whether to write the values in the cells. Default: False
+            value_formatter (Callable[[float], str]): Custom formatter for the cell values. Default: lambda v: f"{v:.2g}"
+            value_text_format (TextFormat): TextFormat for the cell values. The font color defaults to black or white, whichever reads better on the cell. Default: TextFormat()
+            title (str): Optional chart title. Default: None
+            title_text_format (TextFormat): TextFormat for the title. Default: TextFormat()
+            vectorize (bool): Whether to compute the cell geometry and colors with NumPy. The chart is identical either way. Default: None, which uses NumPy for grids of 1000 cells or more when it's installed
+        """
+        self._data: list[list[Union[int, float]]] = self._validate_data(data)
+
+        # Position and dimensions
+        self._position: tuple[int, int] = kwargs.get("position", (0, 0))
+        self._cell_width: int = kwargs.get("cell_width", self.DEFAULT_CELL_SIZE)
+        self._cell_height: int = kwargs.get("cell_height", self.DEFAULT_CELL_SIZE)
+
+        # Colors
+        self._levels: int = kwargs.get("levels", self.DEFAULT_LEVELS)
+        if self._levels < 1:
+            raise ValueError("levels must be at least 1")
+        self._colormap: list[str] = self._validate_colormap(
+            kwargs.get("colormap", "blues")
+        )
+        self._level_colors: list[str] = self._interpolate_colors(
+            self._colormap, self._levels
+        )
+        self._value_range: Optional[tuple[float, float]] = kwargs.get("value_range")
+        self._missing_color: Union[str, StandardColor] = kwargs.get(
+            "missing_color", "none"
+        )
+        self._grid_color: Union[str, StandardColor] = kwargs.get(
+            "grid_color", "#FFFFFF"
+        )
+
+        # Labels
+        self._row_labels: Optional[list[str]] = kwargs.get("row_labels")
+        self._column_labels: Optional[list[str]] = kwargs.get("column_labels")
+        self._label_text_format: TextFormat = kwargs.get(
+            "label_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._show_values: bool = kwargs.get("show_values", False)
+        self._value_formatter: Callable[[float], str] = kwargs.get(
+            "value_formatter", lambda value: f"{value:.2g}"
+        )
+        self._value_text_format: TextFormat = kwargs.get(
+            "value_text_format", TextFormat.DEFAULT
+        ).freeze()
+
+        # Title
+        self._title: Optional[str] = kwargs.get("title")
+        self._title_text_format: TextFormat = kwargs.get(
+            "title_text_format", TextFormat.DEFAULT
+        ).freeze()
+
+        self._vectorize: Optional[bool] = kwargs.get("vectorize", None)
+        if self._vectorize and np is None:
+            raise ImportError("vectorize=True requires NumPy to be installed.")
+
+        # Build
+        self._group: Group = Group()
+        self._cells: list[list[Object]] = []
+        self._pages: list[Page] = []
+        self._build_chart()
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def data(self) -> list[list[Union[int, float]]]:
+        return [list(row) for row in self._data]
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self._position
+
+    @property
+    def group(self) -> Group:
+        return self._group
+
+    @property
+    def cells(self) -> list[list[Object]]:
+        """The cell Objects as a list of rows."""
+        return [list(row) for row in self._cells]
+
+    @property
+    def level_colors(self) -> list[str]:
+        """The fill colors the values are quantized to, from the lowest to the highest."""
+        return list(self._level_colors)
+
+    # ------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------
+
+    def update_data(self, data: Sequence[Sequence[float]]) -> None:
+        """Replace the grid of values and redraw the chart.
+
+        Args:
+            data (list[list[float]]): The grid of values as a list of rows, or a 2-D NumPy array.
+        """
+        self._data = self._validate_data(data)
+        self._rebuild()
+
+    def update_colormap(
+        self, colormap: Union[str, list[Union[str, StandardColor]]]
+    ) -> None:
+        """Recolor the cells in place.
+
+        Args:
+            colormap (str | list[str | StandardColor]): Name of one of the COLORMAPS or a list of hex colors from the lowest to the highest value.
+        """
+        self._colormap = self._validate_colormap(colormap)
+        self._level_colors = self._interpolate_colors(self._colormap, self._levels)
+        indices = self._level_indices(self._use_vectorized())
+        for cell_row, index_row in zip(self._cells, indices):
+            for cell, index in zip(cell_row, index_row):
+                self._color_cell(cell, index)
+
+    def move(self, new_position: tuple[int, int]) -> None:
+        if not isinstance(new_position, (tuple, list)) or len(new_position) != 2:
+            raise ValueError("new_position must be a tuple of (x, y)")
+
+        dx = new_position[0] - self._position[0]
+        dy = new_position[1] - self._position[1]
+
+        for obj in self._group.objects:
+            old_x, old_y = obj.position
+            obj.position = (old_x + dx, old_y + dy)
+
+        self._position = new_position
+        self._group.update_geometry()
+
+    def add_to_page(self, page: Page) -> None:
+        """Add the chart objects to a page. Later data updates replace them on the page.
+
+        Args:
+            page (Page): The page to draw the chart on
+        """
+        for obj in self._group.objects:
+            page.add_object(obj)
+        if page not in self._pages:
+            self._pages.append(page)
+
+    # ------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------
+
+    def _validate_data(
+        self, data: Sequence[Sequence[float]]
+    ) -> list[list[Union[int, float]]]:
+        if np is not None and isinstance(data, np.ndarray):
+            if data.ndim != 2:
+                raise ValueError("Data must be a 2-D array.")
+            data = data.tolist()
+        if isinstance(data, (str, bytes)) or not isinstance(data, Sequence):
+            raise TypeError("Data must be a list of rows.")
+        if not data or not data[0]:
+            raise ValueError("Data cannot be empty.")
+
+        rows = []
+        for row in data:
+            if isinstance(row, (str, bytes)) or not isinstance(row, Sequence):
+                raise TypeError("Data must be a list of rows.")
+            rows.append(list(row))
+
+        invalid_rows = [i for i, row in enumerate(rows) if len(row) != len(rows[0])]
+        if invalid_rows:
+            raise ValueError(
+                f"All rows must have the same length. Invalid rows: {invalid_rows}"
+            )
+        invalid_values = [
+            (i, j)
+            for i, row in enumerate(rows)
+            for j, value in enumerate(row)
+            if not isinstance(value, Real)
+        ]
+        if invalid_values:
+            raise TypeError(f"Values must be numeric. Invalid cells: {invalid_values}")
+        infinite_values = [
+            (i, j)
+            for i, row in enumerate(rows)
+            for j, value in enumerate(row)
+            if math.isinf(value)
+        ]
+        if infinite_values:
+            raise ValueError(
+                f"Values must be finite or NaN. Invalid cells: {infinite_values}"
+            )
+        return rows
+
+    def _validate_colormap(
+        self, colormap: Union[str, list[Union[str, StandardColor]]]
+    ) -> list[str]:
+        if isinstance(colormap, str) and not isinstance(colormap, StandardColor):
+            if colormap not in self.COLORMAPS:
+                raise ValueError(
+                    f"Invalid colormap: {colormap}. Must be one of {list(self.COLORMAPS)} or a list of colors"
+                )
+            return self.COLORMAPS[colormap]
+        if not colormap:
+            raise ValueError("Colormap cannot be empty.")
+        colors = []
+        for color in colormap:
+            color = color.value if isinstance(color, StandardColor) else color
+            if not isinstance(color, str) or not ColorScheme.is_valid_hex(color):
+                raise ValueError(
+                    f"Invalid color '{color}'. Expected '#RRGGBB' (example: #A1B2C3)."
+                )
+            colors.append(color)
+        return colors
+
+    @staticmethod
+    def _interpolate_colors(colormap: list[str], levels: int) -> list[str]:
+        # Spread the levels evenly over the colormap
+        rgbs = [
+            tuple(int(color[i : i + 2], 16) for i in (1, 3, 5)) for color in colormap
+        ]
+        if len(rgbs) == 1:
+            rgbs = rgbs * 2
+        colors = []
+        for level in range(levels):
+            t = level / (levels - 1) if levels > 1 else 0
+            position = t * (len(rgbs) - 1)
+            segment = min(int(position), len(rgbs) - 2)
+            fraction = position - segment
+            low, high = rgbs[segment], rgbs[segment + 1]
+            colors.append(
+                "#{0:02X}{1:02X}{2:02X}".format(
+                    *(round(a + (b - a) * fraction) for a, b in zip(low, high))
+                )
+            )
+        return colors
+
+    @staticmethod
+    def _font_color(fill_color: str) -> str:
+        # Black or white text, whichever contrasts more with the fill
+        red, green, blue = (int(fill_color[i : i + 2], 16) for i in (1, 3, 5))
+        luminance = 0.299 * red + 0.587 * green + 0.114 * blue
+        return "#000000" if luminance > 140 else "#FFFFFF"
+
+    def _range(self) -> tuple[float, float]:
+        if self._value_range is not None:
+            return self._value_range
+        values = [v for row in self._data for v in row if not math.isnan(v)]
+        if not values:
+            return 0, 1
+        return min(values), max(values)
+
+    def _use_vectorized(self) -> bool:
+        if np is None or self._vectorize is False:
+            return False
+        cell_count = len(self._data) * len(self._data[0])
+        return bool(self._vectorize) or cell_count >= self.VECTORIZE_MIN_CELLS
+
+    def _level_indices(self, vectorized: bool) -> list[list[Optional[int]]]:
+        # The colormap level of every cell, or None for NaN. The value range
+        # is split into equal bins, with the top of the range in the last one.
+        low, high = self._range()
+        span = (high - low) or 1
+        levels = self._levels
+
+        if vectorized:
+            values = np.asarray(self._data, dtype=float)
+            indices = np.floor((values - low) / span * levels)
+            indices = np.clip(indices, 0, levels - 1)
+            indices = np.where(np.isnan(values), -1, indices).astype(int).tolist()
+            return [[None if i < 0 else i for i in row] for row in indices]
+
+        result = []
+        for row in self._data:
+            indices = []
+            for value in row:
+                if math.isnan(value):
+                    indices.append(None)
+                else:
+                    index = math.floor((value - low) / span * levels)
+                    indices.append(min(max(index, 0), levels - 1))
+            result.append(indices)
+        return result
+
+    def _grid_origin(self) -> tuple[int, int]:
+        # The top left corner of the first cell
+        x, y = self._position
+        if self._title:
+            y += (self._title_text_format.fontSize or 16) + self.TITLE_BOTTOM_MARGIN
+        if self._column_labels:
+            y += (self._label_text_format.fontSize or 12) + 4 + self.LABEL_MARGIN
+        if self._row_labels:
+            x += self.ROW_LABEL_WIDTH + self.LABEL_MARGIN
+        return x, y
+
+    def _rebuild(self) -> None:
+        old_objects = list(self._group.objects)
+        self._group.objects.clear()
+        self._cells = []
+        self._build_chart()
+
+        for page in self._pages:
+            page.remove_objects(old_objects)
+            for obj in self._group.objects:
+                page.add_object(obj)
+
+    def _build_chart(self) -> None:
+        if self._title:
+            self._add_title()
+        self._add_labels()
+        self._add_cells()
+        self._group.update_geometry()
+
+    def _add_cells(self) -> None:
+        rows = len(self._data)
+        columns = len(self._data[0])
+        x, y = self._grid_origin()
+        vectorized = self._use_vectorized()
+
+        if vectorized:
+            xs = (x + np.arange(columns) * self._cell_width).tolist()
+            ys = (y + np.arange(rows) * self._cell_height).tolist()
+        else:
+            xs = [x + j * self._cell_width for j in range(columns)]
+            ys = [y + i * self._cell_height for i in range(rows)]
+        indices = self._level_indices(vectorized)
+
+        # Every cell is a copy of one styled cell
+        cells = Object.create_many(
+            rows * columns,
+            value="",
+            width=self._cell_width,
+            height=self._cell_height,
+            strokeColor=self._grid_color,
+            text_format=self._cell_text_format(),
+        )
+
+        for i in range(rows):
+            row = cells[i * columns : (i + 1) * columns]
+            for j, cell in enumerate(row):
+                cell.geometry.x = xs[j]
+                cell.geometry.y = ys[i]
+                self._color_cell(cell, indices[i][j])
+                if self._show_values:
+                    cell.value = self._value_formatter(self._data[i][j])
+            self._cells.append(row)
+        self._group.objects.extend(cells)
+
+    def _color_cell(self, cell: Object, index: Optional[int]) -> None:
+        if index is None:
+            cell.fillColor = self._missing_color
+            return
+        cell.fillColor = self._level_colors[index]
+        if self._show_values and not self._value_text_format.fontColor:
+            cell.text_format = self._cell_text_format(
+                fontColor=self._font_color(cell.fillColor)
+            )
+
+    def _cell_text_format(self, **kwargs) -> TextFormat:
+        # Frozen formats are interned, so cells of the same level share one
+        return self._value_text_format.replace(
+            align=self._value_text_format.align or "center",
+            verticalAlign=self._value_text_format.verticalAlign or "middle",
+            **kwargs,
+        )
+
+    def _add_title(self) -> None:
+        grid_x, _ = self._grid_origin()
+        title_obj = Object(
+            value=self._title,
+            position=(grid_x, self._position[1]),
+            width=len(self._data[0]) * self._cell_width,
+            height=(self._title_text_format.fontSize or 16) + 4,
+            fillColor="none",
+            strokeColor="none",
+        )
+        title_obj.text_format = self._title_text_format.replace(
+            align=self._title_text_format.align or "center",
+            verticalAlign=self._title_text_format.verticalAlign or "top",
+        )
+        self._group.add_object(title_obj)
+
+    def _add_labels(self) -> None:
+        x, y = self._grid_origin()
+        label_height = (self._label_text_format.fontSize or 12) + 4
+
+        for j, label in enumerate(self._column_labels or []):
+            self._group.objects.append(
+                self._label(
+                    label,
+                    (x + j * self._cell_width, y - label_height - self.LABEL_MARGIN),
+                    self._cell_width,
+                    "center",
+                )
+            )
+        for i, label in enumerate(self._row_labels or []):
+            label_y = y + i * self._cell_height + (self._cell_height - label_height) / 2
+            self._group.objects.append(
+                self._label(
+                    label,
+                    (self._position[0], label_y),
+                    self.ROW_LABEL_WIDTH,
+                    "right",
+                )
+            )
+
+    def _label(
+        self, text: str, position: tuple[float, float], width: int, align: str
+    ) -> Object:
+        label_obj = Object(
+            value=text,
+            position=position,
+            width=width,
+            height=(self._label_text_format.fontSize or 12) + 4,
+            fillColor="none",
+            strokeColor="none",
+        )
+        label_obj.text_format = self._label_text_format.replace(
+            align=self._label_text_format.align or align
+        )
+        return label_obj
+
+    def __repr__(self) -> str:
+        return (
+            f"Heatmap(rows={len(self._data)}, columns={len(self._data[0])}, "
+            f"position={self._position})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data) * len(self._data[0])
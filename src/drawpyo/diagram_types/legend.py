@@ -1,5 +1,4 @@
 from typing import Union, Optional
-from copy import deepcopy
 from ..diagram.objects import Object, Group
 from ..diagram.text_format import TextFormat
 from ..utils.standard_colors import StandardColor
@@ -48,12 +47,12 @@ class Legend:
         self._title: Optional[str] = kwargs.get("title")
 
         # Text formats
-        self._title_text_format: TextFormat = deepcopy(
-            kwargs.get("title_text_format", TextFormat())
-        )
-        self._label_text_format: TextFormat = deepcopy(
-            kwargs.get("label_text_format", TextFormat())
-        )
+        self._title_text_format: TextFormat = kwargs.get(
+            "title_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._label_text_format: TextFormat = kwargs.get(
+            "label_text_format", TextFormat.DEFAULT
+        ).freeze()
 
         # Color box styles
         self._glass: Optional[bool] = kwargs.get("glass", False)
@@ -183,9 +182,9 @@ class Legend:
             strokeColor="none",
         )
 
-        title_obj.text_format = deepcopy(self._title_text_format)
-        title_obj.text_format.align = "left"
-        title_obj.text_format.verticalAlign = "top"
+        title_obj.text_format = self._title_text_format.replace(
+            align="left", verticalAlign="top"
+        )
 
         self._group.add_object(title_obj)
 
@@ -216,9 +215,9 @@ class Legend:
             fillColor="none",
             strokeColor="none",
         )
-        label_obj.text_format = deepcopy(self._label_text_format)
-        label_obj.text_format.align = "left"
-        label_obj.text_format.verticalAlign = "middle"
+        label_obj.text_format = self._label_text_format.replace(
+            align="left", verticalAlign="middle"
+        )
 
         self._group.add_object(label_obj)
 
@@ -0,0 +1,596 @@
+import math
+from typing import Callable, Union, Optional, Sequence
+from numbers import Real
+from ..diagram.objects import Object, Group
+from ..diagram.edges import Edge, Point
+from ..diagram.text_format import TextFormat
+from ..utils.standard_colors import StandardColor
+from ..utils.color_scheme import ColorScheme
+from ..page import Page
+
+Coordinate = tuple[float, float]
+
+
+# ------------------------------------------------------------------
+# Downsampling
+# ------------------------------------------------------------------
+
+
+def downsample_lttb(points: Sequence[Coordinate], max_points: int) -> list[Coordinate]:
+    """Downsample a series with the Largest-Triangle-Three-Buckets algorithm. The first and last points are kept, and the points between them are split into max_points - 2 buckets. From each bucket the point forming the largest triangle with the point picked from the previous bucket and the average of the next bucket is kept, which preserves the visual shape of the series.
+
+    Args:
+        points (list[tuple[float, float]]): The (x, y) points of the series in x order
+        max_points (int): The maximum number of points to keep, at least 3
+
+    Returns:
+        list[tuple[float, float]]: The downsampled points
+    """
+    count = len(points)
+    if max_points >= count:
+        return list(points)
+    if max_points < 3:
+        raise ValueError("max_points must be at least 3")
+
+    sampled = [points[0]]
+    bucket_size = (count - 2) / (max_points - 2)
+    previous = 0
+    for i in range(max_points - 2):
+        # The average of the next bucket, or the last point for the last bucket
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, count)
+        avg_x = avg_y = 0.0
+        for x, y in points[next_start:next_end]:
+            avg_x += x
+            avg_y += y
+        avg_x /= next_end - next_start
+        avg_y /= next_end - next_start
+
+        prev_x, prev_y = points[previous]
+        largest = -1.0
+        for j in range(int(i * bucket_size) + 1, int((i + 1) * bucket_size) + 1):
+            x, y = points[j]
+            # Twice the triangle area, the factor doesn't change the largest
+            area = abs(
+                (prev_x - avg_x) * (y - prev_y) - (prev_x - x) * (avg_y - prev_y)
+            )
+            if area > largest:
+                largest = area
+                picked = j
+        sampled.append(points[picked])
+        previous = picked
+    sampled.append(points[-1])
+    return sampled
+
+
+def downsample_min_max(
+    points: Sequence[Coordinate], max_points: int
+) -> list[Coordinate]:
+    """Downsample a series by keeping the lowest and highest point of each bucket. The points are split into max_points // 2 buckets of consecutive points, so spikes and dips are never lost.
+
+    Args:
+        points (list[tuple[float, float]]): The (x, y) points of the series in x order
+        max_points (int): The maximum number of points to keep, at least 2
+
+    Returns:
+        list[tuple[float, float]]: The downsampled points
+    """
+    count = len(points)
+    if max_points >= count:
+        return list(points)
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+
+    buckets = max_points // 2
+    bucket_size = count / buckets
+    sampled = []
+    for i in range(buckets):
+        start = int(i * bucket_size)
+        end = count if i == buckets - 1 else int((i + 1) * bucket_size)
+        lowest = highest = start
+        for j in range(start + 1, end):
+            y = points[j][1]
+            if y < points[lowest][1]:
+                lowest = j
+            elif y > points[highest][1]:
+                highest = j
+        # Keep the points in x order
+        for j in sorted({lowest, highest}):
+            sampled.append(points[j])
+    return sampled
+
+
+class LineChart:
+    """A line chart for long series built from Object, Edge, and Group. Each series is drawn as a single Edge through its points, and series longer than the point budget are downsampled first so the size of the diagram doesn't grow with the length of the data.
+
+    This chart is mutable - you can update data, styling, and position after creation.
+    """
+
+    # Layout constants
+    DEFAULT_WIDTH = 400
+    DEFAULT_HEIGHT = 200
+    DEFAULT_MAX_POINTS = 500
+    DEFAULT_STROKE_WIDTH = 2
+
+    # Spacing constants
+    TITLE_BOTTOM_MARGIN = 10
+    LABEL_TOP_MARGIN = 5
+    BACKGROUND_PADDING = 20
+
+    # Axis constants
+    TICK_COUNT = 5
+    TICK_LENGTH = 4
+    TICK_LABEL_MARGIN = 4
+    TICK_LABEL_WIDTH = 40
+    TICK_COLOR = "#000000"
+
+    DOWNSAMPLING_METHODS = {"lttb": downsample_lttb, "minmax": downsample_min_max}
+
+    def __init__(self, data: dict[str, Sequence], **kwargs):
+        """
+        Args:
+            data (dict[str, list]): Mapping of series names to their values. A series is either a list of y values, plotted at x = 0, 1, 2, ..., or a list of (x, y) pairs in x order.
+
+        Keyword Args:
+            position (tuple[int, int]): Chart top-left position. Default: (0, 0)
+            width (int): Width of the plot area. Default: 400
+            height (int): Height of the plot area. Default: 200
+            max_points (int): Most points drawn per series, longer series are downsampled. Default: 500
+            downsampling (str): How to downsample, "lttb" (Largest-Triangle-Three-Buckets) or "minmax" (lowest and highest point per bucket). Default: "lttb"
+            line_colors (list[Union[str, StandardColor, ColorScheme]]): List of colors, one per series. Default: ["#66ccff"]
+            stroke_width (int): Width of the lines. Default: 2
+            title (str): Optional chart title. Default: None
+            title_text_format (TextFormat): TextFormat for the title. Default: TextFormat()
+            background_color (str | StandardColor): Optional chart background fill. Default: None
+            show_axis (bool): Whether to show the axes and ticks. Default: False
+            axis_tick_count (int): Number of tick intervals on each axis. Default: 5
+            axis_text_format (TextFormat): TextFormat for axis tick labels. Default: TextFormat()
+            x_label_formatter (Callable[[float], str]): Custom formatter for the x axis tick labels. Default: lambda v: str(round(v, 2))
+            y_label_formatter (Callable[[float], str]): Custom formatter for the y axis tick labels. Default: lambda v: str(round(v, 2))
+        """
+        self._data: dict[str, list[Coordinate]] = self._validate_data(data)
+
+        # Position and dimensions
+        self._position: tuple[int, int] = kwargs.get("position", (0, 0))
+        self._width: int = kwargs.get("width", self.DEFAULT_WIDTH)
+        self._height: int = kwargs.get("height", self.DEFAULT_HEIGHT)
+
+        # Downsampling
+        self._max_points: int = kwargs.get("max_points", self.DEFAULT_MAX_POINTS)
+        if self._max_points < 3:
+            raise ValueError("max_points must be at least 3")
+        self._downsampling: str = kwargs.get("downsampling", "lttb")
+        if self._downsampling not in self.DOWNSAMPLING_METHODS:
+            raise ValueError(
+                f"Invalid downsampling method: {self._downsampling}. Must be one of {list(self.DOWNSAMPLING_METHODS)}"
+            )
+
+        # Text formats
+        self._title_text_format: TextFormat = kwargs.get(
+            "title_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._axis_text_format: TextFormat = kwargs.get(
+            "axis_text_format", TextFormat.DEFAULT
+        ).freeze()
+
+        # Label formatters
+        self._x_label_formatter: Callable[[float], str] = kwargs.get(
+            "x_label_formatter", lambda value: str(round(value, 2))
+        )
+        self._y_label_formatter: Callable[[float], str] = kwargs.get(
+            "y_label_formatter", lambda value: str(round(value, 2))
+        )
+
+        # Title and background
+        self._title: Optional[str] = kwargs.get("title")
+        self._background_color: Optional[Union[str, StandardColor]] = kwargs.get(
+            "background_color"
+        )
+
+        # Axis settings
+        self._show_axis: bool = kwargs.get("show_axis", False)
+        self._axis_tick_count: int = kwargs.get("axis_tick_count", self.TICK_COUNT)
+
+        # Line appearance
+        self._original_line_colors: list[Union[str, StandardColor, ColorScheme]] = (
+            kwargs.get("line_colors", ["#66ccff"])
+        )
+        self._line_colors: list[Union[str, StandardColor, ColorScheme]] = (
+            self._normalize_colors(self._original_line_colors, len(self._data))
+        )
+        self._stroke_width: int = kwargs.get("stroke_width", self.DEFAULT_STROKE_WIDTH)
+
+        # Build
+        self._group: Group = Group()
+        self._lines: dict[str, Edge] = {}
+        self._pages: list[Page] = []
+        self._build_chart()
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def data(self) -> dict[str, list[Coordinate]]:
+        """The (x, y) points of each series, before downsampling."""
+        return {name: list(points) for name, points in self._data.items()}
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self._position
+
+    @property
+    def group(self) -> Group:
+        """The Group of the chart Objects. The lines are Edges so they aren't in the group, see lines."""
+        return self._group
+
+    @property
+    def lines(self) -> dict[str, Edge]:
+        """The Edge drawing each series, by series name."""
+        return self._lines.copy()
+
+    # ------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------
+
+    def update_data(self, data: dict[str, Sequence]) -> None:
+        """Replace the chart data and redraw the chart.
+
+        Args:
+            data (dict[str, list]): Mapping of series names to their values, like the data passed to the chart.
+        """
+        self._data = self._validate_data(data)
+        self._line_colors = self._normalize_colors(
+            self._original_line_colors, len(self._data)
+        )
+        self._rebuild()
+
+    def update_colors(
+        self, line_colors: list[Union[str, StandardColor, ColorScheme]]
+    ) -> None:
+        """Recolor the lines in place.
+
+        Args:
+            line_colors (list[Union[str, StandardColor, ColorScheme]]): List of colors, repeated if there are more series than colors.
+        """
+        self._original_line_colors = line_colors
+        self._line_colors = self._normalize_colors(line_colors, len(self._data))
+        for line, color_value in zip(self._lines.values(), self._line_colors):
+            self._color_line(line, color_value)
+
+    def move(self, new_position: tuple[int, int]) -> None:
+        if not isinstance(new_position, (tuple, list)) or len(new_position) != 2:
+            raise ValueError("new_position must be a tuple of (x, y)")
+
+        dx = new_position[0] - self._position[0]
+        dy = new_position[1] - self._position[1]
+
+        for obj in self._group.objects:
+            old_x, old_y = obj.position
+            obj.position = (old_x + dx, old_y + dy)
+        for line in self._lines.values():
+            geometry = line.geometry
+            end_points = [geometry.source_point, geometry.target_point]
+            for point in end_points + geometry.points:
+                if point is not None:
+                    point.x = round(point.x + dx, 2)
+                    point.y = round(point.y + dy, 2)
+
+        self._position = new_position
+        self._group.update_geometry()
+
+    def add_to_page(self, page: Page) -> None:
+        """Add the chart objects and lines to a page. Later data updates replace them on the page.
+
+        Args:
+            page (Page): The page to draw the chart on
+        """
+        for obj in self._objects():
+            page.add_object(obj)
+        if page not in self._pages:
+            self._pages.append(page)
+
+    # ------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------
+
+    def _validate_data(self, data: dict[str, Sequence]) -> dict[str, list[Coordinate]]:
+        # Check the data and convert every series to (x, y) points
+        if not isinstance(data, dict):
+            raise TypeError("Data must be a dict.")
+        if not data:
+            raise ValueError("Data cannot be empty.")
+
+        invalid_keys = [key for key in data if not isinstance(key, str)]
+        if invalid_keys:
+            raise TypeError(f"All keys must be strings. Invalid: {invalid_keys}")
+
+        series = {}
+        invalid_values = []
+        for key, values in data.items():
+            points = self._to_points(values)
+            if points is None:
+                invalid_values.append(key)
+            else:
+                series[key] = points
+        if invalid_values:
+            raise TypeError(
+                f"Series must be non-empty lists of numbers or (x, y) pairs. Invalid: {invalid_values}"
+            )
+        non_finite = [
+            key
+            for key, points in series.items()
+            if not all(math.isfinite(x) and math.isfinite(y) for x, y in points)
+        ]
+        if non_finite:
+            raise ValueError(
+                f"Values must be finite, without NaN or infinity. Invalid: {non_finite}"
+            )
+        return series
+
+    @staticmethod
+    def _to_points(values: Sequence) -> Optional[list[Coordinate]]:
+        # The (x, y) points of a series, or None if it isn't a valid series
+        if isinstance(values, (str, bytes)):
+            return None
+        try:
+            values = list(values)
+        except TypeError:
+            return None
+        if not values:
+            return None
+
+        if isinstance(values[0], Real):
+            if not all(isinstance(value, Real) for value in values):
+                return None
+            return [(i, float(value)) for i, value in enumerate(values)]
+
+        points = []
+        for pair in values:
+            if (
+                not isinstance(pair, (tuple, list))
+                or len(pair) != 2
+                or not isinstance(pair[0], Real)
+                or not isinstance(pair[1], Real)
+            ):
+                return None
+            points.append((float(pair[0]), float(pair[1])))
+        return points
+
+    def _normalize_colors(
+        self,
+        colors: list[Union[str, StandardColor, ColorScheme]],
+        count: int,
+    ) -> list[Union[str, StandardColor, ColorScheme]]:
+        if not colors:
+            return ["#66ccff"] * count
+        return [colors[i % len(colors)] for i in range(count)]
+
+    def _ranges(self) -> tuple[float, float, float, float]:
+        # The x and y ranges of all series, widened if they're a single value
+        xs = [x for points in self._data.values() for x, _ in points]
+        ys = [y for points in self._data.values() for _, y in points]
+        x_min, x_max = min(xs), max(xs)
+        y_min, y_max = min(ys), max(ys)
+        if x_max == x_min:
+            x_max = x_min + 1
+        if y_max == y_min:
+            y_max = y_min + 1
+        return x_min, x_max, y_min, y_max
+
+    def _content_y(self) -> int:
+        # The top of the plot area, below the title
+        _, y = self._position
+        if self._title:
+            y += (self._title_text_format.fontSize or 16) + self.TITLE_BOTTOM_MARGIN
+        return y
+
+    def _calculate_chart_dimensions(self) -> tuple[int, int]:
+        height = self._height
+        if self._show_axis:
+            height += (
+                self.LABEL_TOP_MARGIN
+                + (self._axis_text_format.fontSize or 12)
+                + self.TICK_LABEL_MARGIN
+            )
+        if self._title:
+            height += (
+                self._title_text_format.fontSize or 16
+            ) + self.TITLE_BOTTOM_MARGIN
+        return self._width, height
+
+    def _objects(self) -> list:
+        return self._group.objects + list(self._lines.values())
+
+    def _rebuild(self) -> None:
+        old_objects = self._objects()
+        self._group.objects.clear()
+        self._lines = {}
+        self._build_chart()
+
+        for page in self._pages:
+            page.remove_objects(old_objects)
+            for obj in self._objects():
+                page.add_object(obj)
+
+    def _build_chart(self) -> None:
+        content_y = self._content_y()
+        ranges = self._ranges()
+
+        if self._background_color:
+            self._add_background()
+        if self._title:
+            self._add_title()
+
+        # The plot area anchors the group even without a title or axes
+        x, _ = self._position
+        self._group.add_object(
+            Object(
+                value="",
+                position=(x, content_y),
+                width=self._width,
+                height=self._height,
+                fillColor="none",
+                strokeColor="none",
+            )
+        )
+
+        if self._show_axis:
+            self._add_axes(content_y, ranges)
+
+        method = self.DOWNSAMPLING_METHODS[self._downsampling]
+        for i, (name, points) in enumerate(self._data.items()):
+            sampled = method(points, self._max_points)
+            self._lines[name] = self._add_line(sampled, content_y, ranges)
+            self._color_line(self._lines[name], self._line_colors[i])
+
+        self._group.update_geometry()
+
+    def _to_chart(
+        self,
+        point: Coordinate,
+        content_y: int,
+        ranges: tuple[float, float, float, float],
+    ) -> tuple[float, float]:
+        # Map a data point to page coordinates
+        x_min, x_max, y_min, y_max = ranges
+        x, _ = self._position
+        px = x + (point[0] - x_min) / (x_max - x_min) * self._width
+        py = content_y + (y_max - point[1]) / (y_max - y_min) * self._height
+        return round(px, 2), round(py, 2)
+
+    def _add_line(
+        self,
+        points: list[Coordinate],
+        content_y: int,
+        ranges: tuple[float, float, float, float],
+    ) -> Edge:
+        coordinates = [self._to_chart(point, content_y, ranges) for point in points]
+        line = Edge(
+            waypoints="straight",
+            line_end_target="none",
+            strokeWidth=self._stroke_width,
+            source_point=coordinates[0],
+            target_point=coordinates[-1],
+        )
+        line.geometry.points = [Point(x=px, y=py) for px, py in coordinates[1:-1]]
+        return line
+
+    def _color_line(
+        self, line: Edge, color_value: Union[str, StandardColor, ColorScheme]
+    ) -> None:
+        if isinstance(color_value, ColorScheme):
+            line.color_scheme = color_value
+            line.strokeColor = color_value.stroke_color or color_value.fill_color
+        else:
+            line.color_scheme = None
+            line.strokeColor = color_value
+
+    def _add_background(self) -> None:
+        width, height = self._calculate_chart_dimensions()
+        x, y = self._position
+        bg = Object(
+            value="",
+            position=(x - self.BACKGROUND_PADDING, y - self.BACKGROUND_PADDING),
+            width=width + 2 * self.BACKGROUND_PADDING,
+            height=height + 2 * self.BACKGROUND_PADDING,
+            fillColor=self._background_color,
+            strokeColor=None,
+        )
+        self._group.add_object(bg)
+
+    def _add_title(self) -> None:
+        title_obj = Object(
+            value=self._title,
+            position=self._position,
+            width=self._width,
+            height=(self._title_text_format.fontSize or 16) + 4,
+            fillColor="none",
+            strokeColor="none",
+        )
+        title_obj.text_format = self._title_text_format.replace(
+            align=self._title_text_format.align or "center",
+            verticalAlign=self._title_text_format.verticalAlign or "top",
+        )
+        self._group.add_object(title_obj)
+
+    # Draw axes and tick marks
+    def _add_axes(
+        self, content_y: int, ranges: tuple[float, float, float, float]
+    ) -> None:
+        x, _ = self._position
+        x_min, x_max, y_min, y_max = ranges
+        bottom = content_y + self._height
+        font_size = self._axis_text_format.fontSize or 12
+
+        self._group.add_object(self._axis_line((x, content_y), 1, self._height))
+        self._group.add_object(self._axis_line((x, bottom), self._width, 1))
+
+        if self._axis_tick_count < 1:
+            return
+
+        label_x = x - self.TICK_LENGTH - self.TICK_LABEL_MARGIN - self.TICK_LABEL_WIDTH
+        for i in range(self._axis_tick_count + 1):
+            t = i / self._axis_tick_count
+
+            # Y axis, top to bottom
+            tick_y = content_y + self._height * t
+            self._group.add_object(
+                self._axis_line((x - self.TICK_LENGTH, tick_y), self.TICK_LENGTH, 1)
+            )
+            self._group.add_object(
+                self._axis_label(
+                    self._y_label_formatter(y_max - (y_max - y_min) * t),
+                    (label_x, tick_y - font_size / 2),
+                    "right",
+                )
+            )
+
+            # X axis, left to right
+            tick_x = x + self._width * t
+            self._group.add_object(
+                self._axis_line((tick_x, bottom), 1, self.TICK_LENGTH)
+            )
+            self._group.add_object(
+                self._axis_label(
+                    self._x_label_formatter(x_min + (x_max - x_min) * t),
+                    (
+                        tick_x - self.TICK_LABEL_WIDTH / 2,
+                        bottom + self.TICK_LENGTH + self.TICK_LABEL_MARGIN,
+                    ),
+                )
+            )
+
+    def _axis_line(
+        self, position: tuple[float, float], width: int, height: int
+    ) -> Object:
+        return Object(
+            value="",
+            position=position,
+            width=width,
+            height=height,
+            fillColor=None,
+            strokeColor=self.TICK_COLOR,
+        )
+
+    def _axis_label(
+        self, text: str, position: tuple[float, float], align: Optional[str] = None
+    ) -> Object:
+        label_obj = Object(
+            value=text,
+            position=position,
+            width=self.TICK_LABEL_WIDTH,
+            height=(self._axis_text_format.fontSize or 12) + 4,
+            fillColor="none",
+            strokeColor="none",
+        )
+        label_obj.text_format = self._axis_text_format.replace(
+            align=align or self._axis_text_format.align or "center"
+        )
+        return label_obj
+
+    def __repr__(self) -> str:
+        return f"LineChart(series={len(self._data)}, position={self._position})"
+
+    def __len__(self) -> int:
+        return len(self._data)
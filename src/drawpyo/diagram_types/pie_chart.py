@@ -1,5 +1,4 @@
 from typing import Callable, Union, Optional
-from copy import deepcopy
 from ..diagram.objects import Object, Group
 from ..diagram.text_format import TextFormat
 from ..utils.standard_colors import StandardColor
@@ -57,12 +56,12 @@ class PieChart:
         self._size: int = kwargs.get("size", self.DEFAULT_SIZE)
 
         # Text formats
-        self._title_text_format: TextFormat = deepcopy(
-            kwargs.get("title_text_format", TextFormat())
-        )
-        self._label_text_format: TextFormat = deepcopy(
-            kwargs.get("label_text_format", TextFormat())
-        )
+        self._title_text_format: TextFormat = kwargs.get(
+            "title_text_format", TextFormat.DEFAULT
+        ).freeze()
+        self._label_text_format: TextFormat = kwargs.get(
+            "label_text_format", TextFormat.DEFAULT
+        ).freeze()
 
         # Title
         self._title: Optional[str] = kwargs.get("title")
@@ -140,7 +139,9 @@ class PieChart:
         for obj in self._group.objects:
             page.add_object(obj)
 
-    def default_label_formatter(self, key, value, total):
+    # A staticmethod so the chart doesn't store a bound method of itself
+    @staticmethod
+    def default_label_formatter(key, value, total):
         return f"{key}: {value/total*100:.1f}%"
 
     # ------------------------------------------------------------------
@@ -264,9 +265,9 @@ class PieChart:
             strokeColor="none",
         )
 
-        title_obj.text_format = deepcopy(self._title_text_format)
-        title_obj.text_format.align = "center"
-        title_obj.text_format.verticalAlign = "top"
+        title_obj.text_format = self._title_text_format.replace(
+            align="center", verticalAlign="top"
+        )
 
         self._group.add_object(title_obj)
 
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Hashable, Iterable, Sequence
 
 import hashlib
+import json
+import weakref
+from ..xml_base import WeakAttribute
 from ..file import File
 from ..page import Page
 from ..diagram.objects import Object, Group
 from ..diagram.edges import Edge
+from .tree_layout import TreeLayout, GroupLayout, BuchheimLayout
 import drawpyo
 
 
 class NodeObject(Object):
     """This class defines one of the nodes on a tree graph. It inherits from Object and performs the same in most regards. It also tracks the tree-specific parameters like the tree, children, parent, etc."""
 
+    # The tree owns its nodes and each node owns its tree_children
+    _tree = WeakAttribute()
+    _tree_parent = WeakAttribute()
+
     def __init__(self, tree=None, **kwargs) -> None:
         """The NodeObject should be instantiated with an owning tree object. A NodeObject can only have a single parent but can have any number of children.
         Args:
@@ -26,7 +34,9 @@ class NodeObject(Object):
         self.tree: Optional[TreeDiagram] = tree
         self.tree_children: List[NodeObject] = kwargs.get("tree_children", [])
         self.tree_parent: Optional[NodeObject] = kwargs.get("tree_parent", None)
-        self.peers: List[NodeObject] = []
+        # An ordered set of peers, kept as the keys of a dict. Peers link
+        # both ways so they're held weakly.
+        self.peers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         # self.level = kwargs.get("level", None)
         # self.peers = kwargs.get("peers", [])
 
@@ -56,8 +66,19 @@ class NodeObject(Object):
 
     @tree_parent.setter
     def tree_parent(self, value: Optional[NodeObject]) -> None:
+        old_parent = self._tree_parent
+        if old_parent is value:
+            return
+        if old_parent is not None:
+            # Reparented, so it leaves the children of its old parent
+            old_parent.tree_children.remove(self)
+            old_parent._changed()
+            tree = getattr(self, "_tree", None)
+            if tree is not None:
+                tree._remove_tree_link(self)
         if value is not None:
             value.tree_children.append(self)
+            value._changed()
         self._tree_parent = value
 
     def add_child(self, obj: NodeObject) -> None:
@@ -68,12 +89,22 @@ class NodeObject(Object):
         """
         self.tree_children.append(obj)
         obj._tree_parent = self
+        self._changed()
+
+    def _changed(self) -> None:
+        # Flag the node for the next relayout of its tree
+        tree = getattr(self, "_tree", None)
+        if tree is not None:
+            tree.mark_dirty(self)
 
     def add_peer(self, obj: NodeObject) -> None:
-        if obj not in self.peers:
-            self.peers.append(obj)
-        if self not in obj.peers:
-            obj.peers.append(self)
+        """Add a peer to the object, and the object as a peer of it. Peers are linked by connect_peers.
+
+        Args:
+            obj (NodeObject)
+        """
+        self.peers.setdefault(obj, None)
+        obj.peers.setdefault(self, None)
 
     @property
     def size_of_level(self) -> Optional[int]:
@@ -105,6 +136,8 @@ class NodeObject(Object):
 class TreeGroup(Group):
     """This class defines a group within a TreeDiagram. When a set of NodeObjects share the same parent they're grouped together for auto positioning. Each level of a TreeDiagram is a set of groups."""
 
+    tree = WeakAttribute()
+
     def __init__(self, tree=None, parent_object=None, **kwargs) -> None:
         """The TreeGroup is instantiated with all the arguments of the Group. Additionally, the owning tree and the parent_object.
 
@@ -179,6 +212,11 @@ class TreeGroup(Group):
 class TreeDiagram:
     """The TreeDiagram contains a File object, a Page object, and all the NodeObjects in the tree."""
 
+    LAYOUT_ENGINES = ["group", "buchheim"]
+    COLORING_MODES = ["depth", "hash", "type"]
+    PAGINATION_STRATEGIES = ["subtree"]
+    TYPE_INDEX = {"category": 0, "list_item": 1, "leaf": 2}
+
     def __init__(self, **kwargs) -> None:
         """The TreeDiagram initiates its own File and Page objects. There are a number of formatting parameters that can be set to fine tune the rendering of the tree.
 
@@ -188,6 +226,7 @@ class TreeDiagram:
             level_spacing (int, optional): Spacing in pixels between levels. Defaults to 60.
             item_spacing (int, optional): Spacing in pixels between groups within a level. Defaults to 15.
             padding (int, optional): Spacing in pixels between objects within a group. Defaults to 10.
+            layout_engine (str, optional): The algorithm auto_layout uses to position the nodes. Options are 'group' and 'buchheim'. Defaults to 'group'.
             file_name (str, optional): The name of the tree diagram.
             file_path (str, optional): The path where the tree diagram should be saved.
         """
@@ -198,6 +237,7 @@ class TreeDiagram:
         self.direction: str = kwargs.get("direction", "down")
         self.link_style: str = kwargs.get("link_style", "orthogonal")
         self.padding: int = kwargs.get("padding", 10)
+        self.layout_engine: str = kwargs.get("layout_engine", "group")
 
         # Set up the File and Page objects
         self.file: File = File()
@@ -208,6 +248,21 @@ class TreeDiagram:
         # Set up object and level lists
         self.objects: List[NodeObject] = []
         self.links: List[Edge] = []
+        # Links keyed by the unordered pair of nodes they join, and how much of
+        # self.links is already in the index
+        self._link_index: Dict[frozenset, Edge] = {}
+        self._indexed_links: int = 0
+        # Membership index of objects so adding a node doesn't scan the list
+        self._object_set: set = set()
+        # The link from its tree parent to each node
+        self._tree_links: Dict[NodeObject, Edge] = {}
+
+        # The engine of the last layout, which caches the layout of every
+        # subtree, and the nodes that changed since
+        self._layout: Optional[TreeLayout] = None
+        self._dirty: set = set()
+        # Once paginate() split the tree, the layout of each of its pages
+        self._page_layouts: Dict[Page, TreeLayout] = {}
 
     ###########################################################
     # Properties
@@ -262,6 +317,31 @@ class TreeDiagram:
                 )
             )
 
+    @property
+    def layout_engine(self) -> str:
+        """The algorithm auto_layout uses to position the nodes. Options are "group" or "buchheim".
+
+        "group" nests every set of siblings in a TreeGroup and stacks the groups side by side. "buchheim" computes a compact tidy tree, packing subtrees as close as their outlines allow.
+
+        Returns:
+            str
+        """
+        return self._layout_engine
+
+    @layout_engine.setter
+    def layout_engine(self, e: str) -> None:
+        self._check_layout_engine(e)
+        self._layout_engine = e
+
+    def _check_layout_engine(self, e: str) -> None:
+        # Each engine is implemented by a method named _<engine>_layout
+        if e not in self.LAYOUT_ENGINES:
+            raise ValueError(
+                "{0} is not a valid entry for layout_engine. Must be {1}.".format(
+                    e, ", ".join(self.LAYOUT_ENGINES)
+                )
+            )
+
     ###########################################################
     # Formatting Properties
     ###########################################################
@@ -431,11 +511,21 @@ class TreeDiagram:
     ###########################################################
 
     def add_object(self, obj: NodeObject, **kwargs: Any) -> None:
-        if obj not in self.objects:
+        if obj not in self._object_set:
             obj.page = self.page
             if "tree_parent" in kwargs:
                 obj.tree_parent = kwargs.get("tree_parent")
             self.objects.append(obj)
+            self._object_set.add(obj)
+            self.mark_dirty(obj)
+
+    def mark_dirty(self, node: NodeObject) -> None:
+        """Flag a node whose size or children changed, so the next relayout lays out its subtree again. Nodes are flagged automatically when they're added to the tree or their tree children change, but not when they're resized.
+
+        Args:
+            node (NodeObject): The changed node
+        """
+        self._dirty.add(node)
 
     ###########################################################
     # Creating from dict
@@ -460,91 +550,244 @@ class TreeDiagram:
             3. "type" - Color nodes based on their type (category, list_item, leaf).
         """
 
+        colors = cls._check_coloring(colors, coloring)
         diagram = cls(**diagram_kwargs)
 
-        TYPE_INDEX = {"category": 0, "list_item": 1, "leaf": 2}
-
-        if coloring not in ("depth", "hash", "type"):
-            raise ValueError(f"Invalid coloring mode: {coloring}")
-
-        if colors is not None and not isinstance(colors, list):
-            raise TypeError("colors must be a list or None")
-        if colors == []:
-            colors = None
-
-        def choose_color(value: str, node_type: str, depth: int):
-            """Return a color from the palette based on mode."""
-            if not colors:
-                return None
-
-            n = len(colors)
-
-            if coloring == "depth":
-                index = depth % n
-            elif coloring == "hash":
-                # Stable hash using md5
-                h = int(hashlib.md5(value.encode("utf-8")).hexdigest(), 16)
-                index = h % n
-            elif coloring == "type":
-                index = TYPE_INDEX[node_type] % n
-
-            return colors[index]
-
-        def create_node(tree, value, parent, color):
+        def create_node(tree, value, parent, node_type, depth):
             """Create NodeObject with proper color argument."""
-            if color is None:
-                return NodeObject(tree=tree, value=value, tree_parent=parent)
-
-            if isinstance(color, drawpyo.ColorScheme):
-                return NodeObject(
-                    tree=tree, value=value, tree_parent=parent, color_scheme=color
-                )
-            elif isinstance(color, (drawpyo.StandardColor, str)):
-                return NodeObject(
-                    tree=tree, value=value, tree_parent=parent, fillColor=color
-                )
-            else:
-                raise TypeError(f"Unsupported color type: {type(color)}")
+            color = cls._choose_color(colors, coloring, value, node_type, depth)
+            return NodeObject(
+                tree=tree, value=value, tree_parent=parent, **cls._color_kwargs(color)
+            )
 
-        def build(parent: Optional[NodeObject], item, depth: int):
-            """Recursively build tree nodes."""
+        def build(data: dict) -> None:
+            """Build the tree nodes depth first, parents before children.
 
-            # LEAF NODE
-            if isinstance(item, (str, int, float)):
-                value = str(item)
-                color = choose_color(value, "leaf", depth)
-                create_node(diagram, value, parent, color)
-                return
+            The pending work is kept on an explicit stack instead of recursing,
+            so the nesting depth of the data isn't limited by the recursion
+            limit. Each entry is (parent, item, depth, is_key, key), where
+            is_key marks the entries of a dict.
+            """
+            stack = [(None, data, 0, False, None)]
+            while stack:
+                parent, item, depth, is_key, key = stack.pop()
 
-            # CATEGORY NODE (dict)
-            if isinstance(item, dict):
-                for key, value in item.items():
+                # CATEGORY NODE (dict entry)
+                if is_key:
                     if not isinstance(key, (str, int, float)):
                         raise TypeError(f"Invalid dict key type: {type(key)}")
 
                     key_str = str(key)
-                    color = choose_color(key_str, "category", depth)
-                    node = create_node(diagram, key_str, parent, color)
-                    build(node, value, depth + 1)
-                return
-
-            # LIST / TUPLE NODES
-            if isinstance(item, (list, tuple)):
-                for element in item:
+                    node = create_node(diagram, key_str, parent, "category", depth)
+                    stack.append((node, item, depth + 1, False, None))
+                    continue
+
+                # LEAF NODE
+                if isinstance(item, (str, int, float)):
+                    create_node(diagram, str(item), parent, "leaf", depth)
+                    continue
+
+                # Entries are pushed in reverse so they're built in order
+                if isinstance(item, dict):
+                    for key, value in reversed(list(item.items())):
+                        stack.append((parent, value, depth, True, key))
+                    continue
+
+                # LIST / TUPLE NODES
+                if isinstance(item, (list, tuple)):
                     # list itself does not create a node, elements are siblings
-                    build(parent, element, depth)
-                return
+                    for element in reversed(item):
+                        stack.append((parent, element, depth, False, None))
+                    continue
 
-            raise TypeError(f"Unsupported type in tree data: {type(item)}")
+                raise TypeError(f"Unsupported type in tree data: {type(item)}")
 
         if not isinstance(data, dict):
             raise TypeError("Top-level tree must be a dict")
 
-        build(None, data, depth=0)
+        build(data)
+
+        diagram.auto_layout()
+        return diagram
+
+    @classmethod
+    def from_edges(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        *,
+        colors: list = None,
+        coloring: str = "depth",
+        **diagram_kwargs,
+    ) -> "TreeDiagram":
+        """
+        Build a TreeDiagram from a stream of (id, parent_id, label) rows, like the rows of a database export. The rows are read in a single pass so they don't need to be held in memory, and a child may come before its parent.
+        rows: Iterable of (id, parent_id) or (id, parent_id, label) tuples. The ids can be any hashable value. Rows with a parent_id of None are roots. The label defaults to the id.
+        colors: List of ColorSchemes, StandardColors, or color hex strings to use for coloring nodes. Default: None
+        coloring: str - "depth" | "hash" | "type" - Method to match colors to nodes, as in from_dict. Nodes with children are categories and nodes without them are leaves. Default: "depth"
+        """
+        colors = cls._check_coloring(colors, coloring)
+        diagram = cls(**diagram_kwargs)
+
+        # External id -> node, and the nodes still waiting for their parent
+        nodes: Dict[Hashable, NodeObject] = {}
+        orphans: Dict[Hashable, List[NodeObject]] = {}
+
+        for number, row in enumerate(rows, 1):
+            if len(row) == 2:
+                node_id, parent_id = row
+                label = None
+            elif len(row) == 3:
+                node_id, parent_id, label = row
+            else:
+                raise ValueError(
+                    "{0} is not a valid row. Must be (id, parent_id) or (id, parent_id, label).".format(
+                        row
+                    )
+                )
+            try:
+                hash((node_id, parent_id))
+            except TypeError:
+                raise ValueError(
+                    "Row {0} {1} is not valid. The id and parent_id must be hashable.".format(
+                        number, row
+                    )
+                ) from None
+            if node_id in nodes:
+                raise ValueError("Duplicate node id: {0}".format(node_id))
+            if node_id == parent_id:
+                raise ValueError("Node {0} is its own parent".format(node_id))
+
+            node = NodeObject(
+                tree=diagram,
+                value=str(node_id if label is None else label),
+                tree_parent=nodes.get(parent_id),
+            )
+            nodes[node_id] = node
+            if parent_id is not None and node.tree_parent is None:
+                orphans.setdefault(parent_id, []).append(node)
+            for child in orphans.pop(node_id, ()):
+                node.add_child(child)
+
+        if orphans:
+            raise ValueError(
+                "Unknown parent ids: {0}".format(", ".join(map(str, orphans)))
+            )
+
+        # Depths are only known once every row is in, so color afterwards. Any
+        # node the walk doesn't reach from a root is part of a cycle.
+        reached = 0
+        stack = [(root, 0) for root in reversed(diagram.roots)]
+        while stack:
+            node, depth = stack.pop()
+            reached += 1
+            node_type = "category" if node.tree_children else "leaf"
+            cls._apply_color(
+                node, cls._choose_color(colors, coloring, node.value, node_type, depth)
+            )
+            for child in reversed(node.tree_children):
+                stack.append((child, depth + 1))
+        if reached < len(nodes):
+            raise ValueError("The rows contain a cycle")
 
         diagram.auto_layout()
         return diagram
 
+    @classmethod
+    def from_jsonl(cls, path: str, **kwargs) -> "TreeDiagram":
+        """
+        Build a TreeDiagram from a JSON Lines file with one node per line, streamed through from_edges.
+        path: Path to the file. Each line is either an object with "id", "parent_id", and optional "label" keys or an [id, parent_id, label] array. The ids must be strings, numbers, or null. Blank lines are skipped.
+        kwargs: Passed on to from_edges, including colors and coloring.
+        """
+
+        def read_rows(lines):
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if isinstance(row, dict):
+                    row = (row["id"], row.get("parent_id"), row.get("label"))
+                # JSON arrays and objects can't be ids
+                if isinstance(row, (list, tuple)) and any(
+                    isinstance(value, (list, dict)) for value in row[:2]
+                ):
+                    raise ValueError(
+                        "Line {0} of {1}: ids must be strings, numbers, or null, not {2}".format(
+                            number, path, line.strip()
+                        )
+                    )
+                yield row
+
+        with open(path, encoding="utf-8") as f:
+            return cls.from_edges(read_rows(f), **kwargs)
+
+    ###########################################################
+    # Coloring
+    ###########################################################
+
+    @classmethod
+    def _check_coloring(cls, colors: Optional[list], coloring: str) -> Optional[list]:
+        # Validate the coloring options and normalize an empty palette to None
+        if coloring not in cls.COLORING_MODES:
+            raise ValueError(f"Invalid coloring mode: {coloring}")
+
+        if colors is not None and not isinstance(colors, list):
+            raise TypeError("colors must be a list or None")
+        return colors or None
+
+    @classmethod
+    def _choose_color(
+        cls,
+        colors: Optional[list],
+        coloring: str,
+        value: str,
+        node_type: str,
+        depth: int,
+    ):
+        """Return a color from the palette based on mode."""
+        if not colors:
+            return None
+
+        n = len(colors)
+
+        if coloring == "depth":
+            index = depth % n
+        elif coloring == "hash":
+            # Stable hash using md5
+            h = int(hashlib.md5(value.encode("utf-8")).hexdigest(), 16)
+            index = h % n
+        elif coloring == "type":
+            index = cls.TYPE_INDEX[node_type] % n
+
+        return colors[index]
+
+    @staticmethod
+    def _color_kwargs(color) -> Dict[str, Any]:
+        # The NodeObject keyword argument that applies a palette color
+        if color is None:
+            return {}
+        if isinstance(color, drawpyo.ColorScheme):
+            return {"color_scheme": color}
+        if isinstance(color, (drawpyo.StandardColor, str)):
+            return {"fillColor": color}
+        raise TypeError(f"Unsupported color type: {type(color)}")
+
+    @classmethod
+    def _apply_color(cls, node: NodeObject, color) -> None:
+        # Color an existing node the way its color keyword arguments would have
+        kwargs = cls._color_kwargs(color)
+        scheme = kwargs.get("color_scheme")
+        if scheme is not None:
+            node.color_scheme = scheme
+            node.strokeColor = scheme.stroke_color
+            node.fillColor = scheme.fill_color
+            if not node._text_format.fontColor:
+                node.text_format = node._text_format.replace(
+                    fontColor=scheme.font_color
+                )
+        elif "fillColor" in kwargs:
+            node.fillColor = kwargs["fillColor"]
+
     ###########################################################
     # Layout and Output
     ###########################################################
@@ -553,72 +796,105 @@ class TreeDiagram:
     def roots(self) -> List[NodeObject]:
         return [x for x in self.objects if x.tree_parent is None]
 
-    def auto_layout(self) -> TreeGroup:
-        def layout_child(tree_parent: Optional[NodeObject]) -> TreeGroup:
-            grp = TreeGroup(tree=self)
-            grp.parent_object = tree_parent
-            # Filter out None children (for BinaryNodeObject compatibility)
-            actual_children = [c for c in tree_parent.tree_children if c is not None]
-            if len(actual_children) > 0:
-                # has children, go through each child and check its children
-                for child in actual_children:
-                    self.connect(tree_parent, child)
-                    child_actual_children = [
-                        c for c in child.tree_children if c is not None
-                    ]
-                    if len(child_actual_children) > 0:
-                        # If this child has its own children then recursive call
-                        grp.add_object(layout_child(child))
-                    else:
-                        grp.add_object(child)
-
-                # layout the row
-                grp = layout_group(grp)
-                # grp = add_parent(grp, parent)
-                grp.center_parent()
-            return grp
-
-        def layout_group(grp: TreeGroup) -> TreeGroup:
-            pos = self.origin
-
-            for obj in grp.objects:
-                if obj is not grp.parent_object:
-                    obj.position = pos
-                    pos = self.move_in_level(pos, obj.size_in_level + self.item_spacing)
-            return grp
-
-        # def add_parent(grp, parent):
-        #     pos = grp.center_position
-        #     level_space = (
-        #         grp.size_of_level / 2
-        #         + self.level_spacing
-        #         + tree_parent.size_of_level / 2
-        #     )
-        #     pos = self.move_between_levels(pos, -level_space)
-        #     parent.center_position = pos
-        #     # add the parent_object
-        #     grp.parent_object = parent
-        #     return grp
-
-        top_group = TreeGroup(tree=self)
+    def auto_layout(self, engine: Optional[str] = None) -> TreeGroup:
+        """Position all of the NodeObjects in the tree, link each one to its tree parent, then add the peer links. Links that already exist are kept, so laying out a tree again doesn't duplicate them.
 
-        for root in self.roots:
-            top_group.add_object(layout_child(root))
+        Args:
+            engine (str, optional): The layout engine to use, "group" or "buchheim". Defaults to the layout_engine of the TreeDiagram.
 
-        if len(top_group.objects) > 0:
-            # Position top group
-            top_group = layout_group(top_group)
-            # Center the top group
-            pos = self.origin
-            pos = self.move_between_levels(pos, top_group.size_of_level / 2)
-            top_group.center_position = pos
+        Returns:
+            TreeGroup: A group of the laid out objects
+        """
+        if self._page_layouts:
+            raise ValueError(
+                "This tree was split across pages by paginate() and can't be laid out as one tree again. Use relayout() to update the layout of its pages."
+            )
+        engine = self.layout_engine if engine is None else engine
+        self._check_layout_engine(engine)
+        top_group = getattr(self, "_{0}_layout".format(engine))()
+        self._dirty.clear()
 
         # lastly add peer links
         self.connect_peers()
 
         return top_group
 
+    def relayout(self) -> None:
+        """Update the layout after nodes were added or changed, moving as few nodes as possible.
+
+        Only the subtrees of the nodes that changed since the last layout are laid out again, using the same engine, then their siblings and ancestors are shifted to make room. Nodes whose place in the layout didn't change aren't touched and the existing links are kept. Unlike auto_layout, the tree isn't centered on the page again: the first root stays where it is.
+
+        Nodes are flagged for relayout when they're added to the tree or their tree children change. Call mark_dirty after resizing a node, and auto_layout after changing the spacing of the tree. If the tree was never laid out or its direction changed, the whole tree is laid out again.
+
+        After paginate(), every page keeps its own layout and is updated on its own.
+        """
+        if self._page_layouts:
+            self._layout_pages()
+            self.connect_peers()
+            return
+        layout = self._layout
+        if layout is None:
+            self.auto_layout()
+            return
+        if layout.direction != self.direction:
+            self.auto_layout(engine=layout.name)
+            return
+
+        self._place(layout.relayout(self.roots, self._dirty))
+        self._dirty.clear()
+        self.connect_peers()
+
+    def _place(self, nodes: List[Tuple[NodeObject, Optional[NodeObject]]]) -> None:
+        # Move nodes to their place in the current layout and link them to
+        # their tree parents
+        for node, parent in nodes:
+            if parent is not None:
+                self.connect(parent, node)
+            node.position = self._layout.position(node)
+
+    def _group_layout(self) -> TreeGroup:
+        layout = GroupLayout(self)
+        order = layout.layout(self.roots)
+        self._layout = layout
+        self._place(order)
+
+        # Group every node that has children with the groups of its children,
+        # as well as every root
+        top_group = TreeGroup(tree=self)
+        groups: Dict[NodeObject, TreeGroup] = {}
+        for node, parent in reversed(order):
+            children = layout.children(node)
+            if children or parent is None:
+                grp = TreeGroup(tree=self, parent_object=node)
+                grp.objects.extend(groups.get(child, child) for child in children)
+                grp.geometry.x, grp.geometry.y = layout.to_page(layout.anchors[node])
+                grp.geometry.width, grp.geometry.height = layout.to_page(
+                    layout.sizes[node]
+                )
+                groups[node] = grp
+            if parent is None:
+                top_group.objects.insert(0, groups[node])
+
+        if len(top_group.objects) > 0:
+            top_group.geometry.x, top_group.geometry.y = layout.to_page(layout.forest)
+            top_group.geometry.width, top_group.geometry.height = layout.to_page(
+                layout.row
+            )
+        return top_group
+
+    def _buchheim_layout(self) -> TreeGroup:
+        layout = BuchheimLayout(self)
+        order = layout.layout(self.roots)
+        self._layout = layout
+        self._place(order)
+
+        top_group = TreeGroup(tree=self, objects=[node for node, _ in order])
+        if len(top_group.objects) > 0:
+            top_group.update_geometry()
+        return top_group
+
     def connect_peers(self) -> None:
+        """Link every pair of peers that isn't linked yet, in the order of the objects and their peers."""
         peer_style = {
             "endArrow": "none",
             "dashed": 1,
@@ -636,19 +912,25 @@ class TreeDiagram:
         }
         for obj in self.objects:
             for peer in obj.peers:
-                link_exists = False
-                for link in self.links:
-                    if link.source == obj and link.target == peer:
-                        link_exists = True
-                    elif link.source == peer and link.target == obj:
-                        link_exists = True
-                if not link_exists:
-                    edge = Edge(page=self.page, source=obj, target=peer)
+                # Peers on different pages of a paginated tree aren't linked
+                if peer.page is obj.page and self._link_between(obj, peer) is None:
+                    edge = Edge(page=obj.page, source=obj, target=peer)
                     edge.apply_attribute_dict(peer_style)
-                    self.links.append(edge)
+                    self._add_link(edge)
 
     def connect(self, source: NodeObject, target: NodeObject) -> None:
-        edge = Edge(page=self.page, source=source, target=target)
+        """Link a node to its tree parent, reusing the link made by an earlier layout.
+
+        Args:
+            source (NodeObject): The tree parent
+            target (NodeObject): The child
+        """
+        edge = self._tree_links.get(target)
+        if edge is None or edge.source is not source:
+            self._remove_tree_link(target)
+            edge = Edge(page=target.page, source=source, target=target)
+            self._add_link(edge)
+            self._tree_links[target] = edge
         edge.apply_attribute_dict(self.link_style_dict)
         if self.direction == "down":
             # parent style
@@ -678,7 +960,40 @@ class TreeDiagram:
             # child style
             edge.entryX = 0
             edge.entryY = 0.5
+
+    def _index_links(self) -> Dict[frozenset, Edge]:
+        # Catch the index up with any links appended to self.links directly and
+        # rebuild it if links were removed
+        if self._indexed_links > len(self.links):
+            self._link_index = {}
+            self._indexed_links = 0
+        for link in self.links[self._indexed_links :]:
+            self._link_index.setdefault(frozenset((link.source, link.target)), link)
+        self._indexed_links = len(self.links)
+        return self._link_index
+
+    def _link_between(self, a: NodeObject, b: NodeObject) -> Optional[Edge]:
+        """The first link between two nodes in either direction, or None if they aren't linked."""
+        return self._index_links().get(frozenset((a, b)))
+
+    def _add_link(self, edge: Edge) -> None:
+        self._index_links().setdefault(frozenset((edge.source, edge.target)), edge)
         self.links.append(edge)
+        self._indexed_links += 1
+
+    def _remove_tree_link(self, node: NodeObject) -> None:
+        # Remove the link from a node's old tree parent from the links and
+        # its page, and index the links again without it
+        edge = self._tree_links.pop(node, None)
+        if edge is None:
+            return
+        edge.remove()
+        if edge.page is not None and edge in edge.page.objects:
+            edge.page.remove_object(edge)
+        if edge in self.links:
+            self.links.remove(edge)
+        self._link_index = {}
+        self._indexed_links = 0
 
     def draw_connections(self) -> None:
         # Draw connections
@@ -689,3 +1004,168 @@ class TreeDiagram:
 
     def write(self, **kwargs) -> None:
         self.file.write(**kwargs)
+
+    ###########################################################
+    # Pagination
+    ###########################################################
+
+    def paginate(
+        self, max_nodes_per_page: int, strategy: str = "subtree"
+    ) -> List[Page]:
+        """Split a large tree across several pages of its file. Subtrees are moved to their own pages until every page fits the budget, and each subtree that moved is replaced by a dashed stub node that links to its page. Every page is then laid out again with the tree's layout engine.
+
+        The heaviest subtrees are moved first, which keeps the number of pages low. A stub counts as a node on its page. A node with more leaf children than the budget can't be split and stays on one page with them. Peer links between nodes that end up on different pages are removed.
+
+        Args:
+            max_nodes_per_page (int): The most nodes a page should hold
+            strategy (str, optional): How to split the tree. Only "subtree" is supported. Defaults to "subtree".
+
+        Returns:
+            list: The pages of the tree, starting with the pages it was on
+        """
+        if strategy not in self.PAGINATION_STRATEGIES:
+            raise ValueError(
+                "{0} is not a valid entry for strategy. Must be {1}.".format(
+                    strategy, ", ".join(self.PAGINATION_STRATEGIES)
+                )
+            )
+        if not isinstance(max_nodes_per_page, int) or max_nodes_per_page < 1:
+            raise ValueError(
+                "{0} is not a valid entry for max_nodes_per_page. Must be a positive integer.".format(
+                    max_nodes_per_page
+                )
+            )
+
+        order = TreeLayout.depth_first(self.roots)
+        cuts = self._page_cuts(order, max_nodes_per_page)
+
+        # Give every moved subtree a page of its own, in depth first order
+        page_of: Dict[NodeObject, Page] = {}
+        for node, parent in order:
+            if node in cuts:
+                page_of[node] = Page(file=self.file, name=str(node.value))
+            elif parent is None:
+                page_of[node] = node.page
+            else:
+                page_of[node] = page_of[parent]
+
+        # Replace each moved subtree with a stub that links to its page
+        for node, parent in order:
+            if node not in cuts or parent is None:
+                continue
+            stub = type(node)(
+                tree=self,
+                value=node.value,
+                template_object=node,
+                link="data:page/id,{0}".format(page_of[node].diagram.id),
+            )
+            stub.line_pattern = "medium_dash"
+            page_of[stub] = page_of[parent]
+            parent.tree_children[parent.tree_children.index(node)] = stub
+            stub._tree_parent = parent
+            node._tree_parent = None
+            self._tree_links.pop(node, None)
+
+        self._move_to_pages(page_of)
+
+        # Lay out every page on its own
+        if self._page_layouts:
+            engine = next(iter(self._page_layouts.values())).name
+        else:
+            engine = self.layout_engine if self._layout is None else self._layout.name
+        pages = self._layout_pages(engine)
+        return [page for page in self.file.pages if page in pages]
+
+    def _layout_pages(self, engine: Optional[str] = None) -> Dict[Page, List]:
+        # Lay out the roots of each page with the page's own layout, only
+        # updating the subtrees that changed unless the engine is given. The
+        # pages can't be laid out as one tree again, so self._layout is left
+        # unset.
+        layouts = {"group": GroupLayout, "buchheim": BuchheimLayout}
+        if engine is None:
+            engine = next(iter(self._page_layouts.values())).name
+        else:
+            self._page_layouts = {}
+        # Nodes added since are moved to the page of their root
+        for node in self._dirty:
+            root = node
+            while root.tree_parent is not None:
+                root = root.tree_parent
+            if node.page is not root.page:
+                del node.page
+                node.page = root.page
+
+        pages: Dict[Page, List[NodeObject]] = {}
+        for root in self.roots:
+            pages.setdefault(root.page, []).append(root)
+        for page, roots in pages.items():
+            layout = self._page_layouts.get(page)
+            if layout is None or layout.direction != self.direction:
+                layout = self._page_layouts[page] = layouts[engine](self)
+                order = layout.layout(roots)
+            else:
+                dirty = [node for node in self._dirty if node.page is page]
+                order = layout.relayout(roots, dirty)
+            self._layout = layout
+            self._place(order)
+        self._layout = None
+        self._dirty.clear()
+        return pages
+
+    def _page_cuts(
+        self, order: List[Tuple[NodeObject, Optional[NodeObject]]], budget: int
+    ) -> set:
+        # Bottom up, the weight of a node is the number of nodes its subtree
+        # puts on its page. While the children of a node don't fit on the page
+        # with it, the heaviest one moves to a page of its own and leaves a
+        # stub of weight 1 behind, the last one first on ties. The roots after
+        # the first root of each page are cut the same way, without stubs.
+        weights: Dict[NodeObject, int] = {}
+        cuts: set = set()
+
+        def cut(children: List[NodeObject], capacity: int, stub: int) -> int:
+            total = sum(weights[child] for child in children)
+            if total > capacity:
+                heaviest = sorted(reversed(children), key=weights.get, reverse=True)
+                for child in heaviest:
+                    if total <= capacity or weights[child] <= stub:
+                        break
+                    total -= weights[child] - stub
+                    cuts.add(child)
+            return total
+
+        for node, _ in reversed(order):
+            weights[node] = 1 + cut(TreeLayout.children(node), budget - 1, 1)
+
+        pages: Dict[Page, List[NodeObject]] = {}
+        for node, parent in order:
+            if parent is None:
+                pages.setdefault(node.page, []).append(node)
+        for roots in pages.values():
+            cut(roots[1:], budget - weights[roots[0]], 0)
+        return cuts
+
+    def _move_to_pages(self, page_of: Dict[NodeObject, Page]) -> None:
+        # Move the nodes to their pages with the links between them, and
+        # remove the links between pages
+        moved: Dict[Page, set] = {}
+        for node, page in page_of.items():
+            if node.page is not page:
+                moved.setdefault(node.page, set()).add(node)
+                node.page = page
+
+        links = []
+        for link in self.links:
+            if link.source.page is not link.target.page:
+                link.remove()
+                moved.setdefault(link.page, set()).add(link)
+                continue
+            if link.page is not link.source.page:
+                moved.setdefault(link.page, set()).add(link)
+                link.page = link.source.page
+            links.append(link)
+        self.links[:] = links
+        for page, objects in moved.items():
+            page.remove_objects(objects)
+        self._link_index = {}
+        self._indexed_links = 0
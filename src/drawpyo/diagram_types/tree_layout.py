@@ -0,0 +1,538 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+from ..xml_base import WeakAttribute
+
+__all__ = ["TreeLayout", "GroupLayout", "BuchheimLayout"]
+
+# Positions within a layout are (within the level, between levels) pairs, so
+# the engines don't depend on the direction of the tree.
+Point = Tuple[float, float]
+
+# A contour is a singly linked chain of immutable cells, one per level of a
+# subtree, following its leftmost or rightmost nodes: (dx, half, next). dx is
+# the center offset from the cell above it (the head cell is relative to the
+# frame the contour is measured in) and half is half of the node's size within
+# the level. Cells are shared between subtrees and never mutated, so a cached
+# contour stays valid for as long as the nodes in its subtree don't change.
+Contour = Optional[Tuple[float, float, Any]]
+
+
+def _add(a: Point, b: Point) -> Point:
+    return (a[0] + b[0], a[1] + b[1])
+
+
+def _walk(contour: Contour, level: int) -> Tuple[Contour, float]:
+    """Return the cell at a given level of a contour and its position."""
+    cell = contour
+    pos = cell[0]
+    for _ in range(level):
+        cell = cell[2]
+        pos += cell[0]
+    return cell, pos
+
+
+def _splice(contour: Contour, count: int, tail: Contour, tail_pos: float) -> Contour:
+    """Copy the first count cells of a contour and continue it with tail, a cell positioned at tail_pos in the same frame."""
+    cells: List[Tuple[float, float]] = []
+    cell = contour
+    pos = 0.0
+    for _ in range(count):
+        pos += cell[0]
+        cells.append((cell[0], cell[1]))
+        cell = cell[2]
+    new_cell = (tail_pos - pos, tail[1], tail[2])
+    for dx, half in reversed(cells):
+        new_cell = (dx, half, new_cell)
+    return new_cell
+
+
+class TreeLayout:
+    """The shared machinery of the layout engines.
+
+    Every subtree is laid out relative to its own root by layout_node, from the cached layouts of its children. Each node then gets an anchor, a point that is the anchor of its tree parent plus the node's offset, which the engine turns into a position on the page. Because the subtree layouts are cached, relayout only lays out the subtrees that changed and only moves the nodes whose anchor changed.
+    """
+
+    # The name of the engine in TreeDiagram.LAYOUT_ENGINES
+    name = ""
+
+    # The tree owns its layout
+    tree = WeakAttribute()
+
+    def __init__(self, tree: Any) -> None:
+        """
+        Args:
+            tree (TreeDiagram): The tree to lay out
+        """
+        self.tree: Any = tree
+        # The direction the layout was made for
+        self.direction: str = tree.direction
+        self.sign: int = 1 if self.direction in ["down", "right"] else -1
+        # Offset of the anchor of each node from the anchor of its tree
+        # parent. Roots are relative to the anchor of the forest.
+        self.offsets: Dict[Any, Point] = {}
+        # The anchor of each node when it was last placed
+        self.anchors: Dict[Any, Point] = {}
+        self.forest: Point = (0, 0)
+
+    @staticmethod
+    def children(node: Any) -> List[Any]:
+        """The tree children of a node, skipping the empty slots of binary nodes."""
+        return [c for c in node.tree_children if c is not None]
+
+    def to_page(self, point: Point) -> Point:
+        """Convert a point between (within the level, between levels) and (X, Y) coordinates. The conversion is its own inverse."""
+        if self.direction in ["up", "down"]:
+            return point
+        return (point[1], point[0])
+
+    @staticmethod
+    def depth_first(roots: List[Any]) -> List[Tuple[Any, Any]]:
+        """The nodes of a forest in depth first order, parents before children.
+
+        Args:
+            roots (list): The root NodeObjects of the forest
+
+        Returns:
+            list: The nodes as (node, tree parent) tuples
+        """
+        order: List[Tuple[Any, Any]] = []
+        stack = [(root, None) for root in reversed(roots)]
+        while stack:
+            node, parent = stack.pop()
+            order.append((node, parent))
+            for child in reversed(TreeLayout.children(node)):
+                stack.append((child, node))
+        return order
+
+    ###########################################################
+    # Engine specific
+    ###########################################################
+
+    def layout_node(self, node: Any, children: List[Any]) -> None:
+        """Lay out the subtree of a node from the cached layouts of its children and set the offsets of the children.
+
+        Args:
+            node (NodeObject): The root of the subtree
+            children (list): The node's tree children, each already laid out
+        """
+        raise NotImplementedError
+
+    def layout_roots(self, roots: List[Any]) -> None:
+        """Lay out the row of roots, setting their offsets and the anchor of the forest.
+
+        Args:
+            roots (list): The root NodeObjects, each already laid out
+        """
+        raise NotImplementedError
+
+    def local(self, node: Any) -> Point:
+        """The point of a node relative to its anchor."""
+        raise NotImplementedError
+
+    def position(self, node: Any) -> Point:
+        """The top left corner of a placed node on the page.
+
+        Args:
+            node (NodeObject): The node
+
+        Returns:
+            tuple: The (X, Y) position
+        """
+        raise NotImplementedError
+
+    def update_levels(self, nodes: Iterable[Any]) -> bool:
+        """Fit the levels to newly placed nodes.
+
+        Args:
+            nodes (iterable): The nodes placed since the levels were last updated
+
+        Returns:
+            bool: Whether any level changed, which moves every node
+        """
+        return False
+
+    ###########################################################
+    # Full and incremental layout
+    ###########################################################
+
+    def layout(self, roots: List[Any]) -> List[Tuple[Any, Any]]:
+        """Lay out a forest of trees from scratch.
+
+        Args:
+            roots (list): The root NodeObjects of the forest
+
+        Returns:
+            list: Every node in depth first order as (node, tree parent) tuples
+        """
+        self.offsets.clear()
+        self.anchors.clear()
+        order = self.depth_first(roots)
+
+        # Children before parents
+        for node, _ in reversed(order):
+            self.layout_node(node, self.children(node))
+        if not roots:
+            return order
+        self.layout_roots(roots)
+
+        for node, parent in order:
+            base = self.forest if parent is None else self.anchors[parent]
+            self.anchors[node] = _add(base, self.offsets[node])
+        self.update_levels(node for node, _ in order)
+        return order
+
+    def relayout(self, roots: List[Any], dirty: Iterable[Any]) -> List[Tuple[Any, Any]]:
+        """Lay out the subtrees of changed nodes again and find the nodes that moved.
+
+        The changed nodes and their ancestors are laid out again from the cached layouts of their other children. The first root that was laid out before keeps its place, rather than centering the forest again, so the subtrees whose anchor didn't change keep their positions.
+
+        Args:
+            roots (list): The root NodeObjects of the forest
+            dirty (iterable): The nodes that were added or whose size or children changed since the last layout
+
+        Returns:
+            list: The nodes to place again in depth first order, as (node, tree parent) tuples
+        """
+        pinned = next((root for root in roots if root in self.anchors), None)
+        if pinned is None:
+            return self.layout(roots)
+        pin = _add(self.anchors[pinned], self.local(pinned))
+
+        # The changed nodes and their ancestors, with their depth
+        stale: Dict[Any, int] = {}
+        for node in dirty:
+            chain = []
+            ancestor = node
+            while ancestor is not None and ancestor not in stale:
+                chain.append(ancestor)
+                ancestor = ancestor.tree_parent
+            depth = -1 if ancestor is None else stale[ancestor]
+            for ancestor in reversed(chain):
+                depth += 1
+                stale[ancestor] = depth
+        # Along with the subtrees that were never laid out
+        stack = [
+            (child, depth + 1)
+            for node, depth in stale.items()
+            for child in self.children(node)
+            if child not in self.anchors and child not in stale
+        ]
+        while stack:
+            node, depth = stack.pop()
+            stale[node] = depth
+            for child in self.children(node):
+                if child not in stale:
+                    stack.append((child, depth + 1))
+
+        # Children before parents
+        for node in sorted(stale, key=stale.get, reverse=True):
+            self.layout_node(node, self.children(node))
+        self.layout_roots(roots)
+        local = self.local(pinned)
+        self.forest = (
+            pin[0] - local[0] - self.offsets[pinned][0],
+            pin[1] - local[1] - self.offsets[pinned][1],
+        )
+
+        # Parents before children, skipping the subtrees that didn't move
+        placed: List[Tuple[Any, Any]] = []
+        stack = [(root, None) for root in reversed(roots)]
+        while stack:
+            node, parent = stack.pop()
+            base = self.forest if parent is None else self.anchors[parent]
+            anchor = _add(base, self.offsets[node])
+            if node not in stale and self.anchors.get(node) == anchor:
+                continue
+            self.anchors[node] = anchor
+            placed.append((node, parent))
+            for child in reversed(TreeLayout.children(node)):
+                stack.append((child, node))
+
+        if self.update_levels(node for node, _ in placed):
+            return self.depth_first(roots)
+        return placed
+
+
+class GroupLayout(TreeLayout):
+    """The layout of the "group" engine.
+
+    Every node with children is grouped with the row of its children, which are laid out side by side with the parent centered on the level above them. The anchor of a node is the corner of its group, so each group is laid out relative to its own corner.
+    """
+
+    name = "group"
+
+    def __init__(self, tree: Any) -> None:
+        """
+        Args:
+            tree (TreeDiagram): The tree to lay out. Its item_spacing separates the items of a row and its level_spacing separates a parent from the row of its children.
+        """
+        super().__init__(tree)
+        # Size of the group of each node
+        self.sizes: Dict[Any, Point] = {}
+        # Corner of each node within its group
+        self.corners: Dict[Any, Point] = {}
+        # Size of the row of roots
+        self.row: Point = (0, 0)
+
+    def place_row(self, items: List[Any]) -> Tuple[List[float], float, float]:
+        """Place the groups of a row of nodes side by side.
+
+        Args:
+            items (list): The nodes, each already laid out
+
+        Returns:
+            tuple: The start of each group within the level, the size of the row within the level and between levels
+        """
+        starts = []
+        pos = 0
+        for item in items:
+            starts.append(pos)
+            pos = pos + self.sizes[item][0] + self.tree.item_spacing
+        row_width = starts[-1] + self.sizes[items[-1]][0]
+        return starts, row_width, max(self.sizes[item][1] for item in items)
+
+    def layout_node(self, node: Any, children: List[Any]) -> None:
+        node_size = (node.size_in_level, node.size_of_level)
+        if not children:
+            self.sizes[node] = node_size
+            self.corners[node] = (0, 0)
+            return
+
+        starts, row_width, row_height = self.place_row(children)
+        # Center the parent over the row
+        level_space = row_height / 2 + self.tree.level_spacing + node_size[1] / 2
+        corner = (
+            row_width / 2 - node_size[0] / 2,
+            row_height / 2 - self.sign * level_space - node_size[1] / 2,
+        )
+        low = (min(0, corner[0]), min(0, corner[1]))
+        high = (
+            max(row_width, corner[0] + node_size[0]),
+            max(row_height, corner[1] + node_size[1]),
+        )
+        self.sizes[node] = (high[0] - low[0], high[1] - low[1])
+        self.corners[node] = (corner[0] - low[0], corner[1] - low[1])
+        for child, start in zip(children, starts):
+            self.offsets[child] = (start - low[0], -low[1])
+
+    def layout_roots(self, roots: List[Any]) -> None:
+        starts, row_width, row_height = self.place_row(roots)
+        for root, start in zip(roots, starts):
+            self.offsets[root] = (start, 0)
+        self.row = (row_width, row_height)
+
+        # Center the row of roots on the origin
+        origin = self.to_page(self.tree.origin)
+        self.forest = (
+            origin[0] - row_width / 2,
+            origin[1] + self.sign * row_height / 2 - row_height / 2,
+        )
+
+    def local(self, node: Any) -> Point:
+        return self.corners[node]
+
+    def position(self, node: Any) -> Point:
+        return self.to_page(_add(self.anchors[node], self.corners[node]))
+
+
+class BuchheimLayout(TreeLayout):
+    """A linear time tidy tree layout after Reingold and Tilford, using the subtree spacing of Buchheim, Jünger and Leipert.
+
+    Each subtree is laid out once, relative to its own root, from the cached contours of its children. Siblings are packed as close as their contours allow and the smaller subtrees between two colliding ones are spread out evenly. The anchor of a node is its center within its level and its depth, and every level is as thick as its largest node.
+    """
+
+    name = "buchheim"
+
+    def __init__(self, tree: Any) -> None:
+        """
+        Args:
+            tree (TreeDiagram): The tree to lay out. Its item_spacing separates siblings and its group_spacing separates nodes of neighbouring subtrees.
+        """
+        super().__init__(tree)
+        # Left contour, right contour and number of levels of each subtree
+        self.contours: Dict[Any, Tuple[Contour, Contour, int]] = {}
+        # Size of each level between levels and where the levels start
+        self.level_sizes: List[float] = []
+        self.level_centers: List[float] = []
+        self.origin: Point = (0, 0)
+
+    ###########################################################
+    # Subtree layout
+    ###########################################################
+
+    def layout_node(self, node: Any, children: List[Any]) -> None:
+        half = node.size_in_level / 2
+        if not children:
+            self.contours[node] = ((0.0, half, None), (0.0, half, None), 1)
+            return
+        offsets, left, right, depth = self.place_row(children)
+        for child, offset in zip(children, offsets):
+            self.offsets[child] = (offset, 1)
+        self.contours[node] = ((0.0, half, left), (0.0, half, right), depth + 1)
+
+    def place_row(
+        self, children: List[Any]
+    ) -> Tuple[List[float], Contour, Contour, int]:
+        """Place a row of sibling subtrees as close together as their contours allow and center the row on zero.
+
+        Args:
+            children (list): The sibling nodes, each already laid out
+
+        Returns:
+            tuple: The offset of each sibling, the left and right contours of the row and its number of levels
+        """
+        count = len(children)
+        xs = [0.0] * count
+        change = [0.0] * count
+        shift = [0.0] * count
+
+        left, right, depth = self.contours[children[0]]
+        # Which sibling's subtree forms the right contour of the row at each
+        # level, as (deepest level, sibling index) with the shallowest on top
+        owners: List[Tuple[int, int]] = [(depth - 1, 0)]
+
+        for i in range(1, count):
+            c_left, c_right, c_depth = self.contours[children[i]]
+
+            # Siblings are placed side by side...
+            x = right[0] + right[1] + self.tree.item_spacing + c_left[1]
+
+            # ...then pushed apart until no level of the subtrees overlaps
+            r_cell, r_pos = right, right[0]
+            l_cell, l_pos = c_left, c_left[0]
+            level = 1
+            top = len(owners) - 1
+            while r_cell[2] is not None and l_cell[2] is not None:
+                r_cell = r_cell[2]
+                r_pos += r_cell[0]
+                l_cell = l_cell[2]
+                l_pos += l_cell[0]
+                while owners[top][0] < level:
+                    top -= 1
+                gap = (
+                    r_pos
+                    + r_cell[1]
+                    + self.tree.group_spacing
+                    + l_cell[1]
+                    - (x + l_pos)
+                )
+                if gap > 0:
+                    # Spread the smaller subtrees in between evenly
+                    owner = owners[top][1]
+                    subtrees = i - owner
+                    change[i] -= gap / subtrees
+                    shift[i] += gap
+                    change[owner] += gap / subtrees
+                    x += gap
+                level += 1
+            xs[i] = x
+
+            # Merge the new subtree into the contours of the row
+            if c_depth >= depth:
+                new_right = (c_right[0] + x, c_right[1], c_right[2])
+            else:
+                tail, tail_pos = _walk(right, c_depth)
+                new_right = _splice(c_right, c_depth, tail, tail_pos - x)
+                new_right = (new_right[0] + x, new_right[1], new_right[2])
+            if c_depth > depth:
+                tail, tail_pos = _walk(c_left, depth)
+                left = _splice(left, depth, tail, tail_pos + x)
+            right = new_right
+            depth = max(depth, c_depth)
+
+            while owners and owners[-1][0] <= c_depth - 1:
+                owners.pop()
+            owners.append((c_depth - 1, i))
+
+        # Apply the spreading shifts from right to left
+        total_shift = 0.0
+        total_change = 0.0
+        for i in range(count - 1, -1, -1):
+            xs[i] += total_shift
+            total_change += change[i]
+            total_shift += shift[i] + total_change
+
+        midpoint = (xs[0] + xs[-1]) / 2
+        offsets = [x - midpoint for x in xs]
+        left = (left[0] - midpoint, left[1], left[2])
+        right = (right[0] - midpoint, right[1], right[2])
+        return offsets, left, right, depth
+
+    @staticmethod
+    def extent(left: Contour, right: Contour) -> Tuple[float, float]:
+        """The lowest and highest coordinate within the level covered by a pair of contours.
+
+        Args:
+            left (Contour): The left contour
+            right (Contour): The right contour
+
+        Returns:
+            tuple: The minimum and maximum coordinates
+        """
+        low = float("inf")
+        cell, pos = left, 0.0
+        while cell is not None:
+            pos += cell[0]
+            low = min(low, pos - cell[1])
+            cell = cell[2]
+        high = float("-inf")
+        cell, pos = right, 0.0
+        while cell is not None:
+            pos += cell[0]
+            high = max(high, pos + cell[1])
+            cell = cell[2]
+        return low, high
+
+    ###########################################################
+    # Placement
+    ###########################################################
+
+    def layout_roots(self, roots: List[Any]) -> None:
+        offsets, left, right, _ = self.place_row(roots)
+        # Center the forest on the origin
+        low, high = self.extent(left, right)
+        middle = (low + high) / 2
+        for root, offset in zip(roots, offsets):
+            self.offsets[root] = (offset - middle, 0)
+        self.origin = self.to_page(self.tree.origin)
+        self.forest = (self.origin[0], 0)
+
+    def local(self, node: Any) -> Point:
+        return (0, 0)
+
+    def layout(self, roots: List[Any]) -> List[Tuple[Any, Any]]:
+        self.contours.clear()
+        self.level_sizes = []
+        return super().layout(roots)
+
+    def update_levels(self, nodes: Iterable[Any]) -> bool:
+        # Levels only grow between full layouts
+        changed = False
+        for node in nodes:
+            depth = int(self.anchors[node][1])
+            size = node.size_of_level
+            if depth == len(self.level_sizes):
+                self.level_sizes.append(size)
+                changed = True
+            elif size > self.level_sizes[depth]:
+                self.level_sizes[depth] = size
+                changed = True
+        if changed:
+            self.level_centers = []
+            level_start = 0
+            for size in self.level_sizes:
+                self.level_centers.append(level_start + size / 2)
+                level_start += size + self.tree.level_spacing
+        return changed
+
+    def position(self, node: Any) -> Point:
+        u, depth = self.anchors[node]
+        center = self.to_page(
+            (u, self.origin[1] + self.sign * self.level_centers[int(depth)])
+        )
+        return (
+            center[0] - node.geometry.width / 2,
+            center[1] - node.geometry.height / 2,
+        )
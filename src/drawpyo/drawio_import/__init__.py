@@ -1,2 +1,6 @@
-from .raw import RawMxCell, RawGeometry
-from .drawio_parser import load_diagram
+from .raw import RawMxCell, RawGeometry, RawPage
+from .drawio_parser import load_diagram, load_file, iter_cells, iter_pages
+from .passthrough import PassthroughCell, PassthroughObject, PassthroughEdge
+from .patcher import patch
+from .differ import diff, DiagramDiff, CellChange
+from .index import CellIndex
@@ -0,0 +1,194 @@
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+from .raw import RawMxCell
+from .drawio_parser import iter_cells
+from .style import _split_style
+
+__all__ = ["diff", "DiagramDiff", "CellChange"]
+
+
+@dataclass(slots=True)
+class CellChange:
+    """A shape or edge that's in both diagrams, before and after it changed."""
+
+    before: RawMxCell
+    after: RawMxCell
+
+    @property
+    def id(self) -> str:
+        """The ID of the cell in the second diagram."""
+        return self.after.id
+
+    @property
+    def style_changes(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """The style attributes that changed, mapped to their values before and after. An attribute that was added or removed is None on the side it's missing from."""
+        before = _split_style(self.before.style or "")
+        after = _split_style(self.after.style or "")
+        return {
+            name: (before.get(name), after.get(name))
+            for name in {**before, **after}
+            if before.get(name) != after.get(name)
+        }
+
+
+@dataclass(slots=True)
+class DiagramDiff:
+    """The differences between two diagrams, from diff(). Cells are listed in the order they're in their file, and a cell that changed in several ways is in each of moved, restyled, and relabelled."""
+
+    # Shapes and edges only in the second diagram
+    added: List[RawMxCell] = field(default_factory=list)
+    # Shapes and edges only in the first diagram
+    removed: List[RawMxCell] = field(default_factory=list)
+    # Changed position, size, parent, points, source, or target
+    moved: List[CellChange] = field(default_factory=list)
+    # Changed style
+    restyled: List[CellChange] = field(default_factory=list)
+    # Changed value
+    relabelled: List[CellChange] = field(default_factory=list)
+    # Cells matched by their content after their ID changed, first to second
+    renamed: Dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added or self.removed or self.moved or self.restyled or self.relabelled
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DiagramDiff - {len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.moved)} moved, {len(self.restyled)} restyled, "
+            f"{len(self.relabelled)} relabelled"
+        )
+
+    def __str__(self) -> str:
+        lines = [f"+ {_describe(cell)}" for cell in self.added]
+        lines += [f"- {_describe(cell)}" for cell in self.removed]
+        lines += [f"~ {_describe(change.after)} moved" for change in self.moved]
+        for change in self.restyled:
+            styles = ", ".join(
+                f"{name}: {before} -> {after}"
+                for name, (before, after) in sorted(change.style_changes.items())
+            )
+            lines.append(f"~ {_describe(change.after)} restyled ({styles})")
+        for change in self.relabelled:
+            lines.append(
+                f"~ {_describe(change.after)} relabelled: "
+                f"{change.before.value!r} -> {change.after.value!r}"
+            )
+        return "\n".join(lines)
+
+
+def _describe(cell: RawMxCell) -> str:
+    kind = "edge" if cell.is_edge else "shape"
+    return f"{kind} {cell.id}" + (f" {cell.value!r}" if cell.value else "")
+
+
+def _style_key(style: Optional[str], cache: Dict[Optional[str], tuple]) -> tuple:
+    """A style's attributes in a form that ignores their order and the trailing ";". Cells share their style strings, so each one is normalized once and kept in cache."""
+    key = cache.get(style)
+    if key is None:
+        key = cache[style] = tuple(sorted(_split_style(style or "").items()))
+    return key
+
+
+def _content_key(cell: RawMxCell, styles: Dict[Optional[str], tuple]) -> tuple:
+    """What a cell is matched by when its ID changed: its kind, value, style, and geometry."""
+    geometry = cell.geometry
+    if geometry is not None:
+        geometry = (
+            geometry.x,
+            geometry.y,
+            geometry.width,
+            geometry.height,
+            geometry.relative,
+            tuple(geometry.points),
+        )
+    return (cell.is_edge, cell.value, _style_key(cell.style, styles), geometry)
+
+
+def _elements(
+    source: Union[str, Path, IO, Mapping[str, RawMxCell]],
+) -> Dict[str, RawMxCell]:
+    if isinstance(source, Mapping):
+        cells = source.values()
+    else:
+        cells = iter_cells(source)
+    return {cell.id: cell for cell in cells if cell.is_vertex or cell.is_edge}
+
+
+def diff(
+    a: Union[str, Path, IO, Mapping[str, RawMxCell]],
+    b: Union[str, Path, IO, Mapping[str, RawMxCell]],
+) -> DiagramDiff:
+    """Compare the shapes and edges of two Draw.io diagrams.
+
+    Cells are matched by their ID. A cell whose ID isn't in the other diagram is matched to a cell with the same kind, value, style, and geometry instead, so regenerated diagrams with new IDs still line up. Styles are compared by their attributes, so reordering them or dropping the trailing ";" isn't a change. Parents, sources, and targets are compared through those matches. Matching is done with dictionaries, so the time grows linearly with the number of cells.
+
+    Like load_diagram(), the cells of every page are compared together. To compare pages one by one, pass the cells of each page from iter_pages().
+
+    Args:
+        a: The first diagram: a path to a .drawio or .xml file, a file object, or RawMxCells keyed by ID
+        b: The second diagram, in any of the same forms
+
+    Returns:
+        DiagramDiff listing the added, removed, moved, restyled, and relabelled shapes and edges
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist
+        ValueError: If a compressed page can't be decoded
+        ET.ParseError: If the XML is malformed
+    """
+    before = _elements(a)
+    after = _elements(b)
+    result = DiagramDiff()
+    styles: Dict[Optional[str], tuple] = {}
+
+    # Cells of the first diagram whose ID is gone, by their content
+    unmatched: Dict[tuple, Deque[RawMxCell]] = {}
+    for cell in before.values():
+        if cell.id not in after:
+            unmatched.setdefault(_content_key(cell, styles), deque()).append(cell)
+
+    pairs: List[Tuple[RawMxCell, RawMxCell]] = []
+    for cell in after.values():
+        old = before.get(cell.id)
+        if old is None:
+            candidates = unmatched.get(_content_key(cell, styles))
+            if not candidates:
+                result.added.append(cell)
+                continue
+            old = candidates.popleft()
+            result.renamed[old.id] = cell.id
+        pairs.append((old, cell))
+
+    result.removed = [
+        cell
+        for cell in before.values()
+        if cell.id not in after and cell.id not in result.renamed
+    ]
+
+    renamed = result.renamed
+    for old, new in pairs:
+        moved = (
+            old.geometry != new.geometry
+            or renamed.get(old.parent, old.parent) != new.parent
+            or renamed.get(old.source, old.source) != new.source
+            or renamed.get(old.target, old.target) != new.target
+        )
+        restyled = old.style != new.style and (
+            _style_key(old.style, styles) != _style_key(new.style, styles)
+        )
+        relabelled = old.value != new.value
+        if not (moved or restyled or relabelled):
+            continue
+        change = CellChange(old, new)
+        if moved:
+            result.moved.append(change)
+        if restyled:
+            result.restyled.append(change)
+        if relabelled:
+            result.relabelled.append(change)
+    return result
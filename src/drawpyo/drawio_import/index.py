@@ -0,0 +1,213 @@
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import product
+from typing import Any, DefaultDict, Dict, List, Mapping, Optional, Tuple
+
+from .raw import RawMxCell
+from .style import _split_style, _style_value
+
+__all__ = ["CellIndex"]
+
+# Width and height in pixels of the squares of the bounding box grid
+_GRID_SIZE = 200
+
+# IDs in document order. Dictionaries are used as ordered sets, so
+# membership checks don't need a set built for every query.
+_IdSet = Dict[str, None]
+
+
+class CellIndex:
+    """Secondary indexes over the shapes and edges of a diagram, built from their RawMxCells in one pass. They answer find() queries without scanning every cell:
+
+    - style: style attribute and value, with the baseStyle under "baseStyle"
+    - label: exact labels, and a sorted list of them for prefix searches
+    - parent: the ID of each cell's parent
+    - area: a grid of the squares each shape's absolute bounding box covers
+    - source and target: the ends of each edge
+
+    The indexes describe the diagram as it was loaded. Changes made to the built objects afterwards aren't reflected in them.
+    """
+
+    def __init__(self, raw_cells: Mapping[str, RawMxCell]) -> None:
+        """
+        Args:
+            raw_cells: Maps Draw.io cell IDs to their RawMxCells
+        """
+        self._order: Dict[str, int] = {}
+        self._styles: DefaultDict[Tuple[str, str], _IdSet] = defaultdict(dict)
+        self._labels: DefaultDict[str, _IdSet] = defaultdict(dict)
+        self._parents: DefaultDict[str, _IdSet] = defaultdict(dict)
+        self._sources: DefaultDict[str, _IdSet] = defaultdict(dict)
+        self._targets: DefaultDict[str, _IdSet] = defaultdict(dict)
+        self._grid: DefaultDict[Tuple[int, int], _IdSet] = defaultdict(dict)
+        self._bounds: Dict[str, Tuple[float, float, float, float]] = {}
+
+        # Cells share their style strings, so each one is only split once
+        style_keys: Dict[str, List[Tuple[str, str]]] = {}
+        # Absolute positions, filled in parent first as they're needed
+        positions: Dict[str, Tuple[float, float]] = {}
+        for cell in raw_cells.values():
+            if not (cell.is_vertex or cell.is_edge):
+                continue
+            cell_id = cell.id
+            self._order[cell_id] = len(self._order)
+            if cell.style:
+                keys = style_keys.get(cell.style)
+                if keys is None:
+                    keys = style_keys[cell.style] = [
+                        ("baseStyle", name) if value is None else (name, value)
+                        for name, value in _split_style(cell.style).items()
+                    ]
+                for key in keys:
+                    self._styles[key][cell_id] = None
+            if cell.value is not None:
+                self._labels[cell.value][cell_id] = None
+            if cell.parent is not None:
+                self._parents[cell.parent][cell_id] = None
+            if cell.is_edge:
+                if cell.source is not None:
+                    self._sources[cell.source][cell_id] = None
+                if cell.target is not None:
+                    self._targets[cell.target][cell_id] = None
+            elif cell.geometry is not None:
+                self._add_bounds(cell, raw_cells, positions)
+
+        self._sorted_labels: List[str] = sorted(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _add_bounds(
+        self,
+        cell: RawMxCell,
+        raw_cells: Mapping[str, RawMxCell],
+        positions: Dict[str, Tuple[float, float]],
+    ) -> None:
+        x, y = _absolute_position(cell, raw_cells, positions)
+        right = x + (cell.geometry.width or 0)
+        bottom = y + (cell.geometry.height or 0)
+        self._bounds[cell.id] = (x, y, right, bottom)
+        columns, rows = _grid_ranges(x, y, right, bottom)
+        for column in columns:
+            for row in rows:
+                self._grid[column, row][cell.id] = None
+
+    ###########################################################
+    # Queries
+    ###########################################################
+
+    def find(
+        self,
+        style: Optional[Mapping[str, Any]] = None,
+        label: Optional[str] = None,
+        label_prefix: Optional[str] = None,
+        parent: Optional[str] = None,
+        area: Optional[Tuple[float, float, float, float]] = None,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+    ) -> List[str]:
+        """Find the shapes and edges that match every criteria given. See ParsedDiagram.find().
+
+        Returns:
+            The Draw.io cell IDs of the matches, in document order
+        """
+        candidates: List[_IdSet] = []
+        for name, value in (style or {}).items():
+            candidates.append(self._styles.get((name, _style_value(value)), {}))
+        if label is not None:
+            candidates.append(self._labels.get(label, {}))
+        if label_prefix is not None:
+            candidates.append(self._with_label_prefix(label_prefix))
+        if parent is not None:
+            candidates.append(self._parents.get(parent, {}))
+        if area is not None:
+            candidates.append(self._in_area(*area))
+        if source is not None:
+            candidates.append(self._sources.get(source, {}))
+        if target is not None:
+            candidates.append(self._targets.get(target, {}))
+
+        if not candidates:
+            return list(self._order)
+        # Only the smallest candidate set is walked
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        matches = [
+            cell_id for cell_id in smallest if all(cell_id in other for other in others)
+        ]
+        matches.sort(key=self._order.__getitem__)
+        return matches
+
+    def _with_label_prefix(self, prefix: str) -> _IdSet:
+        ids: _IdSet = {}
+        labels = self._sorted_labels
+        position = bisect_left(labels, prefix)
+        while position < len(labels) and labels[position].startswith(prefix):
+            ids.update(self._labels[labels[position]])
+            position += 1
+        return ids
+
+    def _in_area(self, x: float, y: float, width: float, height: float) -> _IdSet:
+        ids: _IdSet = {}
+        right, bottom = x + width, y + height
+        columns, rows = _grid_ranges(x, y, right, bottom)
+        if len(columns) * len(rows) > len(self._grid):
+            # An area larger than the shapes cover only checks squares in use
+            squares = [(c, r) for c, r in self._grid if c in columns and r in rows]
+        else:
+            squares = product(columns, rows)
+        for square in squares:
+            for cell_id in self._grid.get(square, ()):
+                left, top, cell_right, cell_bottom = self._bounds[cell_id]
+                if left <= right and x <= cell_right:
+                    if top <= bottom and y <= cell_bottom:
+                        ids[cell_id] = None
+        return ids
+
+
+def _grid_ranges(
+    left: float, top: float, right: float, bottom: float
+) -> Tuple[range, range]:
+    """The columns and rows of the grid squares a bounding box covers."""
+    return (
+        range(int(left // _GRID_SIZE), int(right // _GRID_SIZE) + 1),
+        range(int(top // _GRID_SIZE), int(bottom // _GRID_SIZE) + 1),
+    )
+
+
+def _absolute_position(
+    cell: RawMxCell,
+    raw_cells: Mapping[str, RawMxCell],
+    positions: Dict[str, Tuple[float, float]],
+) -> Tuple[float, float]:
+    """The position of a shape on the page. A shape's geometry is relative to its parent shape, so the offsets up the chain of parents are added, remembering each position in positions."""
+    parent = raw_cells.get(cell.parent)
+    if parent is None or not parent.is_vertex:
+        # Most shapes are directly in a layer
+        position = positions[cell.id] = (cell.geometry.x or 0, cell.geometry.y or 0)
+        return position
+
+    # Walk up to the first shape whose position is known or has no parent shape
+    chain: List[RawMxCell] = []
+    seen = set()
+    offset = (0.0, 0.0)
+    current: Optional[RawMxCell] = cell
+    while current is not None and current.id not in positions:
+        if current.id in seen:
+            # A parent cycle, which Draw.io wouldn't draw
+            break
+        seen.add(current.id)
+        chain.append(current)
+        parent = raw_cells.get(current.parent)
+        current = parent if parent is not None and parent.is_vertex else None
+    if current is not None and current.id in positions:
+        offset = positions[current.id]
+
+    x, y = offset
+    for shape in reversed(chain):
+        geometry = shape.geometry
+        if geometry is not None:
+            x += geometry.x or 0
+            y += geometry.y or 0
+        positions[shape.id] = (x, y)
+    return positions[cell.id]
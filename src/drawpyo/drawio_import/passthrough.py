@@ -0,0 +1,120 @@
+from typing import Any, Dict, Optional, Type
+
+from drawpyo.diagram import Object, Edge, TextFormat
+
+__all__ = ["PassthroughCell", "PassthroughObject", "PassthroughEdge"]
+
+
+class PassthroughCell:
+    """A cell drawpyo has no object for, like the root cell or a layer. It's written back exactly as it was loaded."""
+
+    __slots__ = ("id", "xml", "__weakref__")
+
+    def __init__(self, cell_id: str, xml: str) -> None:
+        """
+        Args:
+            cell_id (str): The Draw.io cell ID
+            xml (str): The mxCell element as it was loaded
+        """
+        self.id: str = cell_id
+        self.xml: str = xml
+
+
+class _Passthrough:
+    """Writes a loaded object back as the XML it was loaded from until it changes.
+
+    Setting any attribute of the object drops the loaded XML. Changes that don't go through the object, like moving its geometry or editing its text format in place, are caught by comparing a snapshot of them taken at load time.
+    """
+
+    # Set in the instance __dict__ by _make_passthrough(), which bypasses
+    # __setattr__, along with the _source_xml itself
+    _source_state: Optional[tuple] = None
+    _source_text_format: Any = None
+    _source_parent_id: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("_source_xml", None)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the object has changed since it was loaded. A dirty object is written from its current attributes instead of the loaded XML.
+
+        Returns:
+            bool: True if the object has changed
+        """
+        return (
+            "_source_xml" not in self.__dict__
+            or self._nested_state() != self._source_state
+            or self._text_format_changed()
+        )
+
+    @property
+    def xml(self) -> str:
+        if self.dirty:
+            return super().xml
+        return self._source_xml
+
+    @property
+    def xml_parent_id(self) -> Any:
+        # Without a parent the element is written back to the parent it was
+        # loaded from, like its layer, instead of the default layer
+        parent_id = super().xml_parent_id
+        if parent_id == 1 and self._source_parent_id is not None:
+            return self._source_parent_id
+        return parent_id
+
+    def _nested_state(self) -> tuple:
+        return (self.geometry.attributes,)
+
+    def _text_format_changed(self) -> bool:
+        text_format = self._text_format
+        source = self._source_text_format
+        if text_format is source:
+            return False
+        if isinstance(source, TextFormat):
+            source = source._formatting_key()
+        return text_format._formatting_key() != source
+
+
+class PassthroughObject(_Passthrough, Object):
+    """An Object loaded by load_file() that's written back as it was loaded until it's changed."""
+
+
+class PassthroughEdge(_Passthrough, Edge):
+    """An Edge loaded by load_file() that's written back as it was loaded until it's changed."""
+
+    def _nested_state(self) -> tuple:
+        geometry = self.geometry
+        ends = (geometry.source_point, geometry.target_point)
+        points = [
+            point.attributes for point in (*ends, *geometry.points) if point is not None
+        ]
+        return super()._nested_state() + (points,)
+
+
+_PASSTHROUGH_CLASSES: Dict[type, Type[_Passthrough]] = {
+    Object: PassthroughObject,
+    Edge: PassthroughEdge,
+}
+
+
+def _make_passthrough(element: Any, xml: str, parent_id: Optional[str]) -> None:
+    """Turns a freshly built Object or Edge into its passthrough class.
+
+    The class is swapped once the element is fully built, so building it doesn't pay for change tracking.
+
+    Args:
+        element: The Object or Edge built from the cell
+        xml: The mxCell element as it was loaded
+        parent_id: The ID of the cell's parent in the file, if it isn't the parent of the element
+    """
+    element.__class__ = _PASSTHROUGH_CLASSES[type(element)]
+    element.__dict__["_source_parent_id"] = parent_id
+    element.__dict__["_source_xml"] = xml
+    element.__dict__["_source_state"] = element._nested_state()
+    # A frozen text format can't be changed in place, only replaced
+    text_format = element._text_format
+    if not text_format.frozen:
+        text_format = text_format._formatting_key()
+    element.__dict__["_source_text_format"] = text_format
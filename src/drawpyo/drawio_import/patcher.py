@@ -0,0 +1,263 @@
+import base64
+import binascii
+import html
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import zlib
+from os import path
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from .drawio_parser import _ATTRIBUTE_ESCAPES, _escape, _page_spans, _unquote
+from .style import _merge_style
+from drawpyo import logger
+
+__all__ = ["patch"]
+
+# Every double quoted id attribute, whatever element it's on. The space
+# before it is checked separately, as a literal prefix is much faster to scan.
+_ID_ATTRIBUTE = re.compile(rb'id="([^"]*)"')
+# Up to this many cells, their IDs are searched for directly instead of
+# looking up every id attribute in the file
+_MAX_SEARCHED_IDS = 64
+# An mxCell opening tag, or the UserObject or object element wrapping one,
+# skipping over quoted values that contain ">"
+_CELL_TAG = re.compile(
+    rb"<(mxCell|UserObject|object)"
+    rb"((?:\s+[^\s=/>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*)\s*(/?)>"
+)
+_INNER_CELL = re.compile(rb"<mxCell[\s/>]")
+# Attributes that stay on the mxCell of a wrapped cell. The value is the
+# wrapper's label, and the rest of its attributes are custom properties.
+_MX_CELL_ATTRIBUTES = frozenset(
+    ("style", "parent", "vertex", "edge", "source", "target", "connectable")
+)
+_ATTRIBUTE = re.compile(rb"([^\s=]+)\s*=\s*(\"[^\"]*\"|'[^']*')")
+
+# Characters encodeURIComponent() leaves alone, as Draw.io quotes a page with
+# it before compressing it
+_URI_SAFE = "~()*!.'"
+
+
+def _id_pattern(cell_ids: Collection[bytes]) -> re.Pattern:
+    if len(cell_ids) > _MAX_SEARCHED_IDS:
+        return _ID_ATTRIBUTE
+    return re.compile(rb'id="(' + b"|".join(map(re.escape, cell_ids)) + rb')"')
+
+
+def _patched_tag(tag: re.Match, changes: Dict[str, Any]) -> bytes:
+    """Rebuilds an opening tag matched by _CELL_TAG with changed attributes. Attributes that aren't changed are copied as they were."""
+    attributes: Dict[str, bytes] = {
+        match.group(1).decode(): match.group(0)
+        for match in _ATTRIBUTE.finditer(tag.group(2))
+    }
+    style_updates: Dict[str, Any] = {}
+    for name, value in changes.items():
+        if name.startswith("style."):
+            style_updates[name[6:]] = value
+        elif value is None:
+            attributes.pop(name, None)
+        else:
+            value = _escape(str(value), _ATTRIBUTE_ESCAPES)
+            attributes[name] = f'{name}="{value}"'.encode()
+
+    if style_updates:
+        style = b""
+        if "style" in attributes:
+            style = _ATTRIBUTE.match(attributes["style"]).group(2)[1:-1]
+        style = _merge_style(html.unescape(style.decode()), style_updates)
+        style = _escape(style, _ATTRIBUTE_ESCAPES)
+        attributes["style"] = f'style="{style}"'.encode()
+
+    tag_end = b" />" if tag.group(3) else b">"
+    return b"<" + tag.group(1) + b" " + b" ".join(attributes.values()) + tag_end
+
+
+def _split_wrapped_changes(
+    changes: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Splits the changes to a wrapped cell between the wrapper and its mxCell."""
+    wrapper_changes: Dict[str, Any] = {}
+    cell_changes: Dict[str, Any] = {}
+    for name, value in changes.items():
+        if name == "value":
+            wrapper_changes["label"] = value
+        elif name.startswith("style.") or name in _MX_CELL_ATTRIBUTES:
+            cell_changes[name] = value
+        else:
+            wrapper_changes[name] = value
+    return wrapper_changes, cell_changes
+
+
+def _patch_cells(
+    data: Any,
+    start: int,
+    end: int,
+    changes: Dict[bytes, Dict[str, Any]],
+    write: Callable[[Any], Any],
+    id_pattern: re.Pattern = _ID_ATTRIBUTE,
+) -> List[str]:
+    """Writes the XML between two offsets with the targeted mxCell tags patched. Everything else is written as it was, in slices of a memoryview so nothing is copied.
+
+    Args:
+        data: The XML, as bytes or a mmap
+        start: Offset to start at
+        end: Offset to stop at
+        changes: The changes to each cell, keyed by the escaped cell ID
+        write: Called with each piece of the output
+        id_pattern: Finds the id attributes to check. Default: all of them
+
+    Returns:
+        The IDs of the patched cells
+    """
+    patched: List[str] = []
+    pos = start
+    with memoryview(data) as view:
+        for match in id_pattern.finditer(data, start, end):
+            cell_changes = changes.get(match.group(1))
+            if cell_changes is None or data[match.start() - 1] not in b" \t\r\n":
+                continue
+            # "<" can't be in an attribute value, so this is where the tag opens
+            tag_start = data.rfind(b"<", start, match.start())
+            tag = _CELL_TAG.match(data, tag_start, end) if tag_start != -1 else None
+            if tag is None or tag.end() < match.end():
+                continue
+            if tag.group(1) == b"mxCell":
+                write(view[pos:tag_start])
+                write(_patched_tag(tag, cell_changes))
+                pos = tag.end()
+            else:
+                # The id is on a wrapper, which holds the label and custom
+                # properties, while the style and structure stay on its mxCell
+                inner = (
+                    None if tag.group(3) else _INNER_CELL.search(data, tag.end(), end)
+                )
+                inner = _CELL_TAG.match(data, inner.start(), end) if inner else None
+                if inner is None:
+                    continue
+                wrapper_changes, inner_changes = _split_wrapped_changes(cell_changes)
+                write(view[pos:tag_start])
+                write(_patched_tag(tag, wrapper_changes) if wrapper_changes else tag[0])
+                write(view[tag.end() : inner.start()])
+                write(_patched_tag(inner, inner_changes) if inner_changes else inner[0])
+                pos = inner.end()
+            patched.append(html.unescape(match.group(1).decode()))
+        write(view[pos:end])
+    return patched
+
+
+def _patch_compressed(
+    text: bytes, changes: Dict[bytes, Dict[str, Any]], id_pattern: re.Pattern
+) -> Tuple[List[str], bytes]:
+    """Patches the cells of a compressed page.
+
+    Args:
+        text: The base64 text of the <diagram> element
+        changes: The changes to each cell, keyed by the escaped cell ID
+        id_pattern: Finds the id attributes to check
+
+    Returns:
+        The IDs of the patched cells, and the page compressed again. The text is returned as it was if none of its cells were patched.
+
+    Raises:
+        ValueError: If the text isn't a compressed diagram
+    """
+    try:
+        xml = _unquote(zlib.decompress(base64.b64decode(text), -zlib.MAX_WBITS))
+    except (binascii.Error, zlib.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid compressed diagram: {e}")
+
+    parts: List[bytes] = []
+    patched = _patch_cells(xml, 0, len(xml), changes, parts.append, id_pattern)
+    if not patched:
+        return patched, text
+    quoted = quote(b"".join(parts), safe=_URI_SAFE).encode("ascii")
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    compressed = compressor.compress(quoted) + compressor.flush()
+    return patched, base64.b64encode(compressed)
+
+
+def patch(
+    file_path: Union[str, Path],
+    changes: Dict[Union[str, int], Dict[str, Any]],
+    output_path: Optional[Union[str, Path]] = None,
+) -> List[str]:
+    """Change the attributes of cells in a Draw.io file without loading it.
+
+    The file is streamed once and only the opening tags of the targeted mxCell elements are rewritten. Everything else, including every other cell, is copied byte for byte. Compressed pages are only inflated and compressed again if they contain one of the cells. The output is written to a temporary file that replaces the destination once it's complete, so it's never left half written.
+
+    Each cell's changes map mxCell attributes to their new values, like value or parent. Keys that start with "style." set an attribute in the cell's style, merged into the rest of the style. A value of None removes the attribute. For cells wrapped in a UserObject or object element, the value sets the wrapper's label and other attributes that aren't mxCell attributes, like tooltip or link, are set on the wrapper.
+
+    Example:
+        drawpyo.patch("network.drawio", {"router-1": {"value": "Core", "style.fillColor": "#FF0000"}})
+
+    Args:
+        file_path: Path to the .drawio or .xml file
+        changes: The changes to make, keyed by cell ID
+        output_path: Where to write the patched file. Default: overwrite file_path
+
+    Returns:
+        The IDs of the cells that were patched, in the order they're in the file. A cell ID that's on several pages is patched on each.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is empty or has an invalid compressed page
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    if not path.getsize(file_path):
+        raise ValueError(f"Invalid Draw.io file: '{file_path}' is empty")
+    output_path = file_path if output_path is None else output_path
+
+    escaped_changes = {
+        _escape(str(cell_id), _ATTRIBUTE_ESCAPES).encode(): dict(cell_changes)
+        for cell_id, cell_changes in changes.items()
+    }
+
+    id_pattern = _id_pattern(escaped_changes.keys())
+
+    patched: List[str] = []
+    spans = _page_spans(str(file_path))
+    directory = path.dirname(path.abspath(output_path))
+    out = tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False)
+    try:
+        with out, open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                pos = 0
+                for start, end in spans:
+                    # The text of a compressed page runs from the end of the
+                    # opening tag to the next "<"
+                    text_end = data.find(b"<", start + 1)
+                    text_start = data.rfind(b">", start, text_end) + 1
+                    text = data[text_start:text_end].strip()
+                    if not text:
+                        continue
+                    page_patched, compressed = _patch_compressed(
+                        text, escaped_changes, id_pattern
+                    )
+                    if not page_patched:
+                        continue
+                    patched += _patch_cells(
+                        data, pos, text_start, escaped_changes, out.write, id_pattern
+                    )
+                    patched += page_patched
+                    out.write(compressed)
+                    pos = text_end
+                patched += _patch_cells(
+                    data, pos, len(data), escaped_changes, out.write, id_pattern
+                )
+        shutil.copymode(file_path, out.name)
+        os.replace(out.name, output_path)
+    except BaseException:
+        os.unlink(out.name)
+        raise
+
+    missing = set(map(str, changes)).difference(patched)
+    if missing:
+        logger.warning(f"Cells not found, not patched: {sorted(missing)}")
+    logger.info(f"🩹 Patched {len(patched)} cells into: '{output_path}'")
+    return patched
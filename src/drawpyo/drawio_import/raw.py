@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class RawGeometry:
     x: Optional[float] = None
     y: Optional[float] = None
@@ -11,8 +11,13 @@ class RawGeometry:
     relative: bool = False
     points: List[Tuple[float, float]] = field(default_factory=list)
 
+    def __reduce__(self):
+        # Pickled as a plain tuple of the fields. This keeps the pages that
+        # load_file() sends back from its worker processes small.
+        return (RawGeometry, tuple(getattr(self, name) for name in self.__slots__))
 
-@dataclass
+
+@dataclass(slots=True)
 class RawMxCell:
     id: str
     parent: Optional[str] = None
@@ -28,3 +33,24 @@ class RawMxCell:
     target: Optional[str] = None
 
     geometry: Optional[RawGeometry] = None
+
+    # Properties of a cell wrapped in a UserObject or object element
+    tags: Optional[str] = None
+    tooltip: Optional[str] = None
+    link: Optional[str] = None
+
+    # The mxCell element as it was read, if the cell was parsed with keep_xml
+    xml: Optional[str] = None
+
+    def __reduce__(self):
+        # Pickled as a plain tuple of the fields, like RawGeometry
+        return (RawMxCell, tuple(getattr(self, name) for name in self.__slots__))
+
+
+@dataclass(slots=True)
+class RawPage:
+    name: Optional[str] = None
+    id: Optional[str] = None
+    # Attributes of the page's mxGraphModel, like dx, dy, or pageWidth
+    settings: Dict[str, str] = field(default_factory=dict)
+    cells: List[RawMxCell] = field(default_factory=list)
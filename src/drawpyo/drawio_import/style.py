@@ -0,0 +1,40 @@
+from typing import Any, Dict, Optional
+
+
+def _style_value(value: Any) -> str:
+    # Draw.io styles use 1 and 0 for flags
+    if isinstance(value, bool):
+        return str(int(value))
+    return str(value)
+
+
+def _split_style(style: str) -> Dict[str, Optional[str]]:
+    """Splits a Draw.io style string into its attributes, like parse_style_string() but keeping the exact text of each value. The baseStyle is kept as a name without a value (None)."""
+    attributes: Dict[str, Optional[str]] = {}
+    for token in style.split(";"):
+        if token:
+            name, has_value, value = token.partition("=")
+            attributes[name] = value if has_value else None
+    return attributes
+
+
+def _merge_style(style: str, updates: Dict[str, Any]) -> str:
+    """Merges style attributes into a Draw.io style string. Attributes that aren't updated keep their place and their exact value, and new ones are added at the end. An attribute set to None is removed.
+
+    Args:
+        style: A Draw.io style string
+        updates: The attribute values to set
+
+    Returns:
+        The merged style string
+    """
+    attributes = _split_style(style)
+    for name, value in updates.items():
+        if value is None:
+            attributes.pop(name, None)
+        else:
+            attributes[name] = _style_value(value)
+    return "".join(
+        f"{name};" if value is None else f"{name}={value};"
+        for name, value in attributes.items()
+    )
@@ -5,6 +5,7 @@ from .utils import logger
 from os import path, makedirs
 from sys import version_info
 from .page import Page
+from .streaming import StreamingPage
 
 
 class File(XMLBase):
@@ -125,6 +126,27 @@ class File(XMLBase):
     ###########################################################
     # File Handling
     ###########################################################
+    def open_stream(
+        self, file_path: Optional[str] = None, **kwargs: Any
+    ) -> StreamingPage:
+        """Start writing the file with a single StreamingPage. The headers are written right away, then each object is written when it's passed to the page's finalize() method, and the file is completed by the page's close() method. Use this for diagrams too large to keep in memory. The page isn't added to the file's pages.
+
+        Args:
+            file_path (str, optional): The full path to write to. Defaults to the file_path and file_name of the File.
+
+        Keyword Args:
+            overwrite (bool, opt): Whether to overwrite an existing file or not
+            Any Page keyword argument, like name, width, or height.
+
+        Returns:
+            StreamingPage: The page to add objects to
+        """
+        if file_path is None:
+            file_path = path.join(self.file_path, self.file_name)
+        kwargs.setdefault("page_num", len(self.pages) + 1)
+        kwargs.setdefault("name", f"Page-{kwargs['page_num']}")
+        return StreamingPage(self, file_path, **kwargs)
+
     def write(self, **kwargs: Any) -> str:
         """This function write the file to disc at the path and name specified.
 
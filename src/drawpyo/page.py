@@ -1,10 +1,13 @@
-from typing import List, Optional, Any, Union, Dict
-from .xml_base import XMLBase
+from typing import List, Optional, Any, Union, Dict, Iterable
+from .xml_base import XMLBase, WeakAttribute
 from .utils.logger import logger
 from .utils.page_sizes import PageSize
 
 
 class Page:
+    # The file owns its pages
+    _file = WeakAttribute()
+
     def __init__(self, file: Optional[Any] = None, **kwargs: Any) -> None:
         """
         Args:
@@ -40,10 +43,12 @@ class Page:
 
         self.file: Optional[File] = file
         self.objects: List[Any] = kwargs.get("objects", [])
+        # Membership index so adding objects doesn't rescan the whole page
+        self._object_set: set = set(self.objects)
 
         # There are two empty top level objects in every Draw.io diagram
-        self.objects.append(XMLBase(id=0, xml_class="mxCell"))
-        self.objects.append(XMLBase(id=1, xml_class="mxCell", xml_parent=0))
+        self.add_object(XMLBase(id=0, xml_class="mxCell"))
+        self.add_object(XMLBase(id=1, xml_class="mxCell", xml_parent=0))
 
         # Properties
 
@@ -96,11 +101,23 @@ class Page:
         del self
 
     def add_object(self, obj: Any) -> None:
-        if obj not in self.objects:
+        if obj not in self._object_set:
+            self._object_set.add(obj)
             self.objects.append(obj)
 
     def remove_object(self, obj: Any) -> None:
         self.objects.remove(obj)
+        self._object_set.discard(obj)
+
+    def remove_objects(self, objs: Iterable[Any]) -> None:
+        """Remove several objects from the page in a single pass over its objects.
+
+        Args:
+            objs (Iterable): The objects to remove
+        """
+        objs = set(objs)
+        self.objects[:] = [obj for obj in self.objects if obj not in objs]
+        self._object_set -= objs
 
     @property
     def file(self) -> Optional[Any]:
@@ -122,11 +139,10 @@ class Page:
     ###########################################################
     @property
     def xml(self) -> str:
-        xml_string = self.xml_open_tag
-        for obj in self.objects:
-            xml_string = xml_string + "\n        " + obj.xml
-        xml_string = xml_string + "\n" + self.xml_close_tag
-        return xml_string
+        # Joined in one pass, as concatenating in the loop is quadratic
+        xml_parts = [self.xml_open_tag]
+        xml_parts.extend(obj.xml for obj in self.objects)
+        return "\n        ".join(xml_parts) + "\n" + self.xml_close_tag
 
     @property
     def xml_open_tag(self) -> str:
@@ -169,6 +185,8 @@ class Diagram(XMLBase):
 
 
 class mxGraph(XMLBase):
+    page = WeakAttribute()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.xml_class: str = "mxGraphModel"
@@ -0,0 +1,202 @@
+from os import path, makedirs, remove
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from .page import Page
+from .diagram.edges import Edge
+from .utils.logger import logger
+
+__all__ = ["StreamingPage"]
+
+
+class _StreamedCell:
+    """Stands in for an object that has been written out and released, for the edges and objects still pointing to it. It only keeps what they read from their source, target, parent, or child: the ID, the position, and the size."""
+
+    __slots__ = ("id", "position", "width", "height", "__weakref__")
+
+    # A streamed cell can't be resized, so its children never update it
+    autosize_to_children: bool = False
+
+    def __init__(
+        self,
+        cell_id: Union[int, str],
+        position: Tuple[float, float],
+        width: float = 0,
+        height: float = 0,
+    ):
+        self.id: Union[int, str] = cell_id
+        self.position: Tuple[float, float] = position
+        self.width: float = width
+        self.height: float = height
+
+    def __call__(self) -> "_StreamedCell":
+        # Stored in place of a weak reference, see _pin()
+        return self
+
+    def remove_out_edge(self, edge: Any) -> None:
+        pass
+
+    def remove_in_edge(self, edge: Any) -> None:
+        pass
+
+
+def _pin(instance: Any, attribute: str, cell: _StreamedCell) -> None:
+    # Point a WeakAttribute back-reference at a streamed cell. The instance
+    # holds the cell strongly, so the cell lives exactly as long as something
+    # still refers to it.
+    descriptor = getattr(type(instance), attribute)
+    instance.__dict__[descriptor.storage_name] = cell
+
+
+class StreamingPage(Page):
+    """A StreamingPage writes its objects straight to a file instead of keeping them until File.write() is called. The file, diagram, and graph model headers are written when the page is created. Each object or edge is written and released when it's passed to finalize(), and the closing tags are written by close(). Only the objects that haven't been finalized yet are kept, so diagrams with millions of cells can be generated in constant memory.
+
+    StreamingPages are created with File.open_stream() and can be used as a context manager. Objects are written in the order they're finalized. Edges and child objects can still be created, changed, and finalized after the objects they point to have been written. If an exception leaves the context manager, the page is aborted and the partial file removed instead of being closed.
+    """
+
+    # Set once close() has written the closing tags
+    _closed: bool = False
+
+    def __init__(self, file: Any, file_path: str, **kwargs: Any) -> None:
+        """
+        Args:
+            file (File): The File whose attributes go into the header. The page isn't added to its pages.
+            file_path (str): The full path of the file to write
+
+        Keyword Args:
+            overwrite (bool): Whether to overwrite an existing file. Default: True
+            Any Page keyword argument, like name, width, or height.
+        """
+        self._pending: Dict[Any, None] = {}
+        super().__init__(**kwargs)
+        self.file_path: str = file_path
+        self.written: int = 0
+        self._file_close_tag: str = file.xml_close_tag
+
+        directory = path.dirname(file_path)
+        if directory and not path.exists(directory):
+            makedirs(directory)
+        write_mode = "w" if kwargs.get("overwrite", True) else "x"
+        self._stream = open(file_path, write_mode, encoding="utf-8")
+        try:
+            self._stream.write(file.xml_open_tag + "\n  " + self.xml_open_tag)
+            # The two empty top level cells go out with the headers
+            self.finalize(*self._pending)
+        except BaseException:
+            self.abort()
+            raise
+
+        logger.info(f"🌊 Streaming page to: '{file_path}'")
+
+    def __enter__(self) -> "StreamingPage":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called and the file is complete."""
+        return self._closed
+
+    # The objects of a StreamingPage are the ones still waiting to be written
+    @property
+    def objects(self) -> List[Any]:
+        return list(self._pending)
+
+    @objects.setter
+    def objects(self, value: List[Any]) -> None:
+        self._pending = dict.fromkeys(value)
+
+    def add_object(self, obj: Any) -> None:
+        if self._closed:
+            raise ValueError("Can't add objects to a closed StreamingPage.")
+        self._pending.setdefault(obj, None)
+
+    def remove_object(self, obj: Any) -> None:
+        del self._pending[obj]
+
+    def remove_objects(self, objs: Iterable[Any]) -> None:
+        for obj in objs:
+            self._pending.pop(obj, None)
+
+    ###########################################################
+    # Streaming
+    ###########################################################
+
+    def finalize(self, *objs: Any) -> None:
+        """Write objects or edges to the file and release them. Edges and child objects that point to a finalized object keep its ID, so they can be finalized later.
+
+        Args:
+            *objs: The objects and edges to write, in order
+        """
+        if self._closed:
+            raise ValueError("Can't finalize objects on a closed StreamingPage.")
+        for obj in objs:
+            self._stream.write("\n        " + obj.xml)
+            self.written += 1
+            self._pending.pop(obj, None)
+            self._release(obj)
+
+    def close(self) -> None:
+        """Finalize the objects still waiting in the order they were added, write the closing tags, and close the file. Closing a closed page does nothing."""
+        if self._closed:
+            return
+        self.finalize(*self._pending)
+        self._stream.write("\n" + self.xml_close_tag + "\n" + self._file_close_tag)
+        self._stream.close()
+        self._closed = True
+        logger.info(f"💾 Streamed {self.written} cells to: '{self.file_path}'")
+
+    def abort(self) -> None:
+        """Close the file without writing the closing tags and remove it, so an export that failed doesn't leave a file that looks complete. Aborting a closed page does nothing."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.close()
+        if path.exists(self.file_path):
+            remove(self.file_path)
+        logger.warning(f"Aborted streaming, removed: '{self.file_path}'")
+
+    @staticmethod
+    def _release(obj: Any) -> None:
+        # Drop the links that would keep finalized cells alive. An edge leaves
+        # the edge lists of its ends. Whatever still points to a finalized
+        # object is pointed at a streamed cell with its ID instead. A finalized
+        # child leaves the children of its parent, unless the parent resizes
+        # to its children and still needs its geometry.
+        if isinstance(obj, Edge):
+            for end, name in ((obj.source, "_out_edges"), (obj.target, "_in_edges")):
+                edges = getattr(end, "__dict__", {}).get(name)
+                if edges is not None and obj in edges:
+                    edges.remove(obj)
+            return
+
+        obj_dict: Dict[str, Any] = getattr(obj, "__dict__", {})
+        dependents: List[Tuple[Any, str]] = (
+            [(edge, "_source") for edge in obj_dict.pop("_out_edges", ())]
+            + [(edge, "_target") for edge in obj_dict.pop("_in_edges", ())]
+            + [
+                (child, "_parent")
+                for child in obj_dict.pop("_children", ())
+                if not isinstance(child, _StreamedCell)
+            ]
+        )
+        if dependents:
+            cell = _StreamedCell(obj.id, obj.position)
+            for dependent, attribute in dependents:
+                _pin(dependent, attribute, cell)
+
+        parent = getattr(obj, "parent", None)
+        siblings = getattr(parent, "__dict__", {}).get("_children", ())
+        for index, sibling in enumerate(siblings):
+            if sibling is obj:
+                if parent.autosize_to_children:
+                    siblings[index] = _StreamedCell(
+                        obj.id, obj.position, obj.width, obj.height
+                    )
+                else:
+                    del siblings[index]
+                break
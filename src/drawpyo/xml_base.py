@@ -1,3 +1,4 @@
+import weakref
 from typing import Dict, Optional, Any, Union
 
 xmlize: Dict[str, str] = {}
@@ -36,6 +37,7 @@ class XMLBase:
 
         self.tag: Optional[str] = kwargs.get("tag", None)
         self.tooltip: Optional[str] = kwargs.get("tooltip", None)
+        self.link: Optional[str] = kwargs.get("link", None)
 
     @property
     def id(self) -> Union[int, str]:
@@ -68,7 +70,8 @@ class XMLBase:
 
         When the "tag" attribute tag is provided, a tags attribute is applied to the object. This allows for selecting, hiding, or displaying multiple elements in the diagram.
         When the "tooltip" attribute tag is provided, a tooltip attribute is applied to the object. This allows for extra information to be displayed when an element is hovered over in the diagram.
-        When using tags or tooltips, the open_tag value and id are shifted to the <UserObject> tag.
+        When the "link" attribute tag is provided, clicking the object in the diagram opens the link. Links to "data:page/id,<page id>" go to another page of the file.
+        When using tags, tooltips, or links, the open_tag value and id are shifted to the <UserObject> tag.
 
 
         Example:
@@ -77,12 +80,14 @@ class XMLBase:
         Returns:
             str: The opening tag of the object with all the attributes.
         """
-        if self.tag or self.tooltip:
+        if self.tag or self.tooltip or self.link:
             open_user_object_tag = f'<UserObject label="{self.value}" id="{self.id}"'
             if self.tag:
                 open_user_object_tag += f' tags="{self.tag}"'
             if self.tooltip:
                 open_user_object_tag += f' tooltip="{self.xml_ify(self.tooltip)}"'
+            if self.link:
+                open_user_object_tag += f' link="{self.xml_ify(self.link)}"'
             open_user_object_tag += ">"
 
             open_tag = "<" + self.xml_class
@@ -111,7 +116,7 @@ class XMLBase:
         Returns:
             str: The closing tag of the object with all the attributes.
         """
-        if self.tag or self.tooltip:
+        if self.tag or self.tooltip or self.link:
             return "</{0}>\n</UserObject>".format(self.xml_class)
         return "</{0}>".format(self.xml_class)
 
@@ -142,3 +147,81 @@ class XMLBase:
             else:
                 new_str = new_str + char
         return new_str
+
+
+class XMLValue:
+    """
+    XMLValue is the base class for the small value types nested inside diagram objects, like geometries, points, and text formats. Unlike XMLBase they have no ID, parent, page, tags, or tooltips, and subclasses define __slots__ so each instance is as small as possible.
+    """
+
+    __slots__ = ()
+
+    xml_class: str = "xml_tag"
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """
+        The XML attributes of the value. Extended by subclasses.
+
+        Returns:
+            dict: A dict of attribute names and values. None values aren't printed.
+        """
+        return {}
+
+    @property
+    def xml_open_tag(self) -> str:
+        """
+        The opening tag of the value with all of its attributes.
+
+        Returns:
+            str: The opening tag of the value with all the attributes.
+        """
+        open_tag = "<" + self.xml_class
+        for att, value in self.attributes.items():
+            if value is not None:
+                xml_parameter = self.xml_ify(str(value))
+                open_tag = open_tag + " " + att + '="' + xml_parameter + '"'
+        return open_tag + ">"
+
+    @property
+    def xml_close_tag(self) -> str:
+        """
+        The closing tag of the value.
+
+        Returns:
+            str: The closing tag of the value.
+        """
+        return "</{0}>".format(self.xml_class)
+
+    @property
+    def xml(self) -> str:
+        """
+        The XML of the value as a single self-closing tag. Subclasses with inner values overload this.
+
+        Returns:
+            str: A single XML tag containing the value name, attributes, and a closer.
+        """
+        return self.xml_open_tag[:-1] + " />"
+
+    def xml_ify(self, parameter_string: str) -> str:
+        return XMLBase.translate_txt(parameter_string, xmlize)
+
+
+class WeakAttribute:
+    """
+    WeakAttribute is a descriptor for back-references, like the page or parent of an object. Ownership in drawpyo flows down from the File to its pages and from a page to the objects on it, so only those references are strong. A back-reference is held through a weak reference so it doesn't keep its owner alive, and it reads as None once the owner is gone. Discarded diagrams are then freed by reference counting instead of waiting for the cyclic garbage collector.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.storage_name: str = name + "_ref"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        reference = instance.__dict__.get(self.storage_name)
+        return None if reference is None else reference()
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.storage_name] = (
+            None if value is None else weakref.ref(value)
+        )
@@ -3,6 +3,8 @@ from unittest.mock import Mock
 from drawpyo.diagram_types.bar_chart import BarChart
 from drawpyo.diagram.text_format import TextFormat
 from drawpyo.diagram.objects import Object, Group
+from drawpyo.page import Page
+from drawpyo.utils.color_scheme import ColorScheme
 
 
 class TestBarChartInitialization:
@@ -450,3 +452,134 @@ class TestBarChartEdgeCases:
         # Original chart data should be unchanged
         assert "B" not in chart.data
         assert chart.data == {"A": 10}
+
+
+def chart_xml(chart):
+    """The XML of the chart objects with the IDs left out."""
+    return [obj.xml.replace(f'id="{obj.id}"', "") for obj in chart.group.objects]
+
+
+class TestBarChartIncrementalUpdates:
+    """Test that updates change the existing objects in place."""
+
+    OPTIONS = {"title": "Sales", "background_color": "#eeeeee", "show_axis": True}
+
+    def test_update_data_matches_fresh_chart(self):
+        """Test that an updated chart matches a chart built from the new data."""
+        chart = BarChart({"A": 10, "B": 20, "C": 5}, **self.OPTIONS)
+        new_data = {"C": 40, "D": 1, "A": 10, "E": 0}
+        chart.update_data(new_data)
+
+        assert chart_xml(chart) == chart_xml(BarChart(new_data, **self.OPTIONS))
+
+    def test_update_data_keeps_surviving_objects(self):
+        """Test that bars still in the data keep their objects and IDs."""
+        chart = BarChart({"A": 10, "B": 20, "C": 5}, **self.OPTIONS)
+        bars = dict(chart._bars)
+        fixed = chart.group.objects[: -2 * len(bars)]
+
+        chart.update_data({"C": 40, "A": 10, "D": 1})
+
+        assert chart._bars["A"] == bars["A"]
+        assert chart._bars["C"] == bars["C"]
+        assert chart._bars["D"] != bars["B"]
+        assert chart.group.objects[: len(fixed)] == fixed
+        assert chart.group.objects[len(fixed) :] == [
+            *bars["C"],
+            *bars["A"],
+            *chart._bars["D"],
+        ]
+        bar, base_obj = bars["C"]
+        assert bar.value == "40"
+        assert bar.height == chart._max_bar_height
+        assert base_obj.value == "C"
+
+    def test_update_data_updates_pages(self):
+        """Test that pages the chart was added to gain and lose bars."""
+        page = Page()
+        chart = BarChart({"A": 10, "B": 20})
+        chart.add_to_page(page)
+        removed = chart._bars["B"]
+
+        chart.update_data({"A": 10, "C": 30})
+
+        on_page = [obj for obj in page.objects if isinstance(obj, Object)]
+        assert on_page == chart.group.objects
+        assert not any(obj in page.objects for obj in removed)
+
+    def test_update_colors_in_place(self):
+        """Test that recoloring keeps the objects."""
+        scheme = ColorScheme(fill_color="#123456", stroke_color="#654321")
+        chart = BarChart({"A": 10, "B": 20})
+        objects = list(chart.group.objects)
+
+        chart.update_colors([scheme, "#ff0000"])
+
+        assert chart.group.objects == objects
+        assert chart_xml(chart) == chart_xml(
+            BarChart({"A": 10, "B": 20}, bar_colors=[scheme, "#ff0000"])
+        )
+        chart.update_colors(["#00ff00"])
+        assert chart._bars["A"][0].strokeColor is None
+        assert chart._bars["A"][0].color_scheme is None
+
+    def test_update_after_move(self):
+        """Test that updates keep the chart where it was moved."""
+        chart = BarChart({"A": 10, "B": 20}, **self.OPTIONS)
+        chart.move((100, 50))
+        chart.update_data({"B": 5, "C": 15})
+
+        assert chart_xml(chart) == chart_xml(
+            BarChart({"B": 5, "C": 15}, position=(100, 50), **self.OPTIONS)
+        )
+
+
+class TestBarChartVectorized:
+    """Test that the NumPy build path matches the scalar one."""
+
+    def test_vectorized_matches_scalar(self):
+        """Test that both paths build the same chart."""
+        pytest.importorskip("numpy")
+        scheme = ColorScheme(
+            fill_color="#123456", stroke_color="#654321", font_color="#aaaaaa"
+        )
+        data = {f"bin {i}": (i * 7919) % 97 + i / 3 for i in range(50)}
+        options = {
+            "title": "Histogram",
+            "show_axis": True,
+            "bar_width": 4.5,
+            "bar_spacing": 1,
+            "max_bar_height": 123.4,
+            "position": (10, 2.5),
+            "bar_colors": [scheme, "#ff0000", "#00ff00"],
+        }
+
+        scalar = BarChart(data, vectorize=False, **options)
+        vectorized = BarChart(data, vectorize=True, **options)
+
+        assert chart_xml(vectorized) == chart_xml(scalar)
+
+    def test_vectorized_updates(self):
+        """Test that a vectorized chart updates like a scalar one."""
+        pytest.importorskip("numpy")
+        chart = BarChart({"A": 10, "B": 20.5, "C": 3}, vectorize=True)
+        chart.update_data({"C": 8, "D": 1})
+
+        assert chart_xml(chart) == chart_xml(BarChart({"C": 8, "D": 1}))
+
+    def test_all_zero_data_uses_scalar_path(self):
+        """Test that integer heights of an all zero chart are kept."""
+        pytest.importorskip("numpy")
+        chart = BarChart({"A": 0, "B": 0}, vectorize=True)
+
+        assert chart._bars["A"][0].height == 0
+        assert isinstance(chart._bars["A"][0].height, int)
+
+    def test_vectorize_without_numpy(self, monkeypatch):
+        """Test that requiring NumPy without it installed raises an error."""
+        import drawpyo.diagram_types.bar_chart as bar_chart
+
+        monkeypatch.setattr(bar_chart, "np", None)
+        with pytest.raises(ImportError):
+            BarChart({"A": 1}, vectorize=True)
+        assert len(BarChart({"A": 1})) == 1
@@ -11,6 +11,7 @@ from drawpyo.diagram.base_diagram import (
     color_input_check,
     width_input_check,
     style_str_from_dict,
+    parse_style_string,
     import_shape_database,
 )
 
@@ -176,6 +177,39 @@ class TestStyleStrFromDict:
         assert len(parts) == 5
 
 
+class TestParseStyleString:
+    """Tests the cached function for parsing a style string"""
+
+    def test_parse(self) -> None:
+        """Checks the baseStyle, attribute order, and number conversion"""
+        base_style, attributes = parse_style_string(
+            "ellipse;fillColor=#FF0000;strokeWidth=2;opacity=0.5;"
+        )
+        assert base_style == "ellipse"
+        assert attributes == (
+            ("fillColor", "#FF0000"),
+            ("strokeWidth", 2),
+            ("opacity", "0.5"),
+        )
+
+    def test_no_base_style(self) -> None:
+        """Checks a style string without a baseStyle"""
+        assert parse_style_string("rounded=1;") == (None, (("rounded", 1),))
+
+    def test_cached(self) -> None:
+        """Checks that repeated style strings are served from the cache"""
+        style = "rounded=1;whiteSpace=wrap;fillColor=#dae8fc;cacheTest=1;"
+        parse_style_string.cache_clear()
+        first = parse_style_string(style)
+        for _ in range(3):
+            drawpyo.diagram.Object().apply_style_string(style)
+
+        info = parse_style_string.cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+        assert parse_style_string(style) is first
+
+
 class TestImportShapeDatabase:
     """Tests the shape database import function"""
 
@@ -230,6 +264,21 @@ class TestGeometry:
         assert 'width="200"' in xml
         assert 'height="150"' in xml
 
+    def test_geometry_is_slotted(self) -> None:
+        """Checks that Geometry is a compact value without an instance dict"""
+        geom = drawpyo.diagram.Geometry()
+        assert not hasattr(geom, "__dict__")
+        with pytest.raises(AttributeError):
+            geom.color = "#FF0000"
+
+    def test_geometry_copy(self) -> None:
+        """Checks that a copied Geometry can be changed independently"""
+        geom = drawpyo.diagram.Geometry(x=10, y=20, width=30, height=40)
+        copied = geom.copy()
+        copied.x = 50
+        assert geom.x == 10
+        assert copied.xml == geom.xml.replace('x="10"', 'x="50"')
+
 
 class TestDiagramBaseStyleAttributes:
     """DiagramBase style attribute tests"""
@@ -383,3 +383,150 @@ class TestBinaryTreeDiagramFromDictExtras:
         # these nodes should have received the side override
         assert getattr(ll, "fillColor", None) == left_hex
         assert getattr(rr, "fillColor", None) == right_hex
+
+
+class TestBinaryTreeDiagramFromDictDeep:
+    """from_dict must handle trees deeper than the recursion limit."""
+
+    def test_from_dict_depth_10k(self):
+        # Alternate between left children from dicts and right children from lists
+        data = "Leaf"
+        for i in reversed(range(10000)):
+            data = {str(i): [None, data]} if i % 2 else {str(i): data}
+        diagram = BinaryTreeDiagram.from_dict(data)
+
+        assert len(diagram.objects) == 10001
+        assert len(diagram.links) == 10000
+        nodes = diagram.objects
+        assert nodes[0].left is nodes[1] and nodes[0].right is None
+        assert nodes[1].right is nodes[2] and nodes[1].left is None
+        assert nodes[-1].value == "Leaf"
+        assert nodes[-1].tree_parent is nodes[-2]
+
+    def test_from_dict_depth_10k_invalid_leaf_raises(self):
+        data = {"Bad": ["A", "B", "C"]}
+        for i in range(10000):
+            data = {str(i): data}
+        with pytest.raises(TypeError, match="at most two children"):
+            BinaryTreeDiagram.from_dict(data)
+
+    def test_from_dict_builds_depth_first(self):
+        data = {"A": {"B": ["D", {"F": "G"}], "C": [None, "E"]}}
+        diagram = BinaryTreeDiagram.from_dict(data)
+        assert [o.value for o in diagram.objects] == list("ABDFGCE")
+
+    def test_relayout_after_setting_children(self):
+        data = {"A": {"B": ["D", None], "C": [None, "E"]}}
+        diagram = BinaryTreeDiagram.from_dict(data)
+        b = [o for o in diagram.objects if o.value == "B"][0]
+        b.right = BinaryNodeObject(tree=diagram, value="F")
+        diagram.relayout()
+
+        expected = BinaryTreeDiagram.from_dict(
+            {"A": {"B": ["D", "F"], "C": [None, "E"]}}
+        )
+        positions = {o.value: o.position for o in expected.objects}
+        assert {o.value: o.position for o in diagram.objects} == positions
+        assert len(diagram.links) == 5
+
+
+class TestBinaryTreeDiagramFromArray:
+    """from_array builds heap ordered arrays in one pass."""
+
+    def test_from_array_structure(self):
+        diagram = BinaryTreeDiagram.from_array([1, 2, 3, None, 5, 6])
+        nodes = {o.value: o for o in diagram.objects}
+
+        assert [o.value for o in diagram.objects] == ["1", "2", "3", "5", "6"]
+        assert nodes["1"].left is nodes["2"] and nodes["1"].right is nodes["3"]
+        assert nodes["2"].left is None and nodes["2"].right is nodes["5"]
+        assert nodes["3"].left is nodes["6"] and nodes["3"].right is None
+        assert [(l.source.value, l.target.value) for l in diagram.links] == [
+            ("1", "2"),
+            ("1", "3"),
+            ("2", "5"),
+            ("3", "6"),
+        ]
+        assert all(l.waypoints == "straight" for l in diagram.links)
+
+    def test_from_array_positions(self):
+        diagram = BinaryTreeDiagram.from_array(list(range(2**6 - 1)))
+        nodes = diagram.objects
+        column = nodes[0].width + diagram.item_spacing
+        band = nodes[0].height + diagram.level_spacing
+
+        # Leaves are one column apart and parents are centered over children
+        leaves = nodes[2**5 - 1 :]
+        assert [n.geometry.x - leaves[0].geometry.x for n in leaves] == [
+            column * i for i in range(len(leaves))
+        ]
+        for i, n in enumerate(nodes[: 2**5 - 1]):
+            left, right = nodes[2 * i + 1], nodes[2 * i + 2]
+            assert (
+                n.center_position[0]
+                == (left.center_position[0] + right.center_position[0]) / 2
+            )
+            assert left.geometry.y == n.geometry.y + band
+        assert nodes[0].center_position[0] == diagram.origin[0]
+        assert nodes[0].geometry.y == diagram.origin[1]
+
+    @pytest.mark.parametrize("direction", ["down", "up", "left", "right"])
+    def test_from_array_complete_matches_auto_layout(self, direction):
+        diagram = BinaryTreeDiagram.from_array(range(15), direction=direction)
+        positions = [o.position for o in diagram.objects]
+        diagram.auto_layout()
+        assert [o.position for o in diagram.objects] == positions
+        assert len(diagram.links) == 14
+
+    def test_from_array_direction(self):
+        diagram = BinaryTreeDiagram.from_array(["A", "B", "C"], direction="right")
+        a, b, c = diagram.objects
+        assert b.geometry.x == c.geometry.x == a.geometry.x + a.width + 80
+        assert b.geometry.y < a.geometry.y < c.geometry.y
+
+    def test_from_array_trailing_holes_and_empty(self):
+        diagram = BinaryTreeDiagram.from_array(["A", "B", None, None, None])
+        assert diagram.objects[1].geometry.y == diagram.objects[0].geometry.y + 160
+        assert BinaryTreeDiagram.from_array([None, None]).objects == []
+
+    def test_from_array_orphan_raises(self):
+        with pytest.raises(ValueError, match="index 3 has no parent"):
+            BinaryTreeDiagram.from_array(["A", None, "C", "D"])
+
+    def test_from_array_coloring(self):
+        left_hex, right_hex = "#112233", "#445566"
+        diagram = BinaryTreeDiagram.from_array(
+            list("ABCDE"), colors=[left_hex, right_hex], coloring="directional"
+        )
+        assert [o.fillColor for o in diagram.objects] == [
+            None,
+            left_hex,
+            right_hex,
+            left_hex,
+            right_hex,
+        ]
+
+        diagram = BinaryTreeDiagram.from_array(
+            list("ABCDE"), colors=["#000000", "#888888", "#ffffff"], coloring="type"
+        )
+        assert [o.fillColor for o in diagram.objects] == [
+            "#000000",
+            "#000000",
+            "#ffffff",
+            "#ffffff",
+            "#ffffff",
+        ]
+
+    def test_from_array_then_relayout(self):
+        diagram = BinaryTreeDiagram.from_array([1, 2, 3, 4])
+        diagram.relayout()
+        expected = BinaryTreeDiagram.from_dict({"1": {"2": ["4", None], "3": None}})
+        positions = {o.value: o.position for o in expected.objects}
+        assert {o.value: o.position for o in diagram.objects} == positions
+        assert len(diagram.links) == 3
+
+    def test_from_array_complete_tree(self):
+        diagram = BinaryTreeDiagram.from_array(range(2**12 - 1))
+        assert len(diagram.objects) == 2**12 - 1
+        assert len(diagram.links) == 2**12 - 2
+        assert diagram.objects[-1].tree_parent is diagram.objects[(2**12 - 3) // 2]
@@ -178,6 +178,32 @@ class TestEdgeGeometry:
         assert edge.targetPerimeterSpacing == 10
         assert edge.sourcePerimeterSpacing == 15
 
+    def test_free_end_points(self, empty_page: drawpyo.Page) -> None:
+        """Checks an edge between points instead of objects"""
+        edge = Edge(page=empty_page, source_point=(10, 20), target_point=(30, 40))
+        edge.add_point(15, 25)
+
+        assert edge.source_point == (10, 20)
+        assert edge.target_point == (30, 40)
+        assert "source=" not in edge.xml_open_tag
+        assert "target=" not in edge.xml_open_tag
+        assert edge.geometry.xml.split("\n")[1:-1] == [
+            '<mxPoint x="10" y="20" as="sourcePoint" />',
+            '<mxPoint x="30" y="40" as="targetPoint" />',
+            '<Array as="points">',
+            '<mxPoint x="15" y="25" />',
+            "</Array>",
+        ]
+
+    def test_connected_edge_keeps_source(
+        self, empty_page: drawpyo.Page, basic_object: drawpyo.diagram.Object
+    ) -> None:
+        """Checks that a source object is used over a source point"""
+        edge = Edge(page=empty_page, source=basic_object, source_point=(10, 20))
+
+        assert f'source="{basic_object.id}"' in edge.xml_open_tag
+        assert 'target="1"' in edge.xml_open_tag
+
 
 class TestEdgeLabels:
     """Edge tag tests"""
@@ -437,3 +463,9 @@ class TestPointClass:
         point = Point()
         assert point.x == 0
         assert point.y == 0
+
+    def test_point_xml(self) -> None:
+        """Checks the XML of a slotted Point"""
+        point = Point(x=5, y=6, as_attribute="sourcePoint")
+        assert not hasattr(point, "__dict__")
+        assert point.xml == '<mxPoint x="5" y="6" as="sourcePoint" />'
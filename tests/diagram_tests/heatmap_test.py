@@ -0,0 +1,211 @@
+import math
+
+import pytest
+from drawpyo.diagram_types.heatmap import Heatmap
+from drawpyo.diagram.objects import Object
+from drawpyo.page import Page
+from drawpyo.utils.standard_colors import StandardColor
+
+
+def chart_xml(chart):
+    """The XML of the chart objects with the IDs left out."""
+    return [obj.xml.replace(f'id="{obj.id}"', "") for obj in chart.group.objects]
+
+
+class TestHeatmapInitialization:
+    """Test Heatmap initialization and validation."""
+
+    def test_empty_data_raises_error(self):
+        """Test that empty data raises ValueError."""
+        with pytest.raises(ValueError, match="Data cannot be empty"):
+            Heatmap([])
+        with pytest.raises(ValueError, match="Data cannot be empty"):
+            Heatmap([[]])
+
+    def test_non_grid_data_raises_error(self):
+        """Test that data that isn't a list of rows raises TypeError."""
+        with pytest.raises(TypeError, match="list of rows"):
+            Heatmap({"a": [1]})
+        with pytest.raises(TypeError, match="list of rows"):
+            Heatmap([1, 2, 3])
+
+    def test_ragged_rows_raise_error(self):
+        """Test that rows of different lengths raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid rows: \\[1\\]"):
+            Heatmap([[1, 2], [3], [4, 5]])
+
+    def test_non_numeric_value_raises_error(self):
+        """Test that non-numeric values raise TypeError."""
+        with pytest.raises(TypeError, match="Invalid cells: \\[\\(1, 0\\)\\]"):
+            Heatmap([[1, 2], ["3", 4]])
+
+    @pytest.mark.parametrize("vectorize", [False, True])
+    def test_infinite_value_raises_error(self, vectorize):
+        """Test that infinite values raise ValueError on both build paths."""
+        if vectorize:
+            pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="Invalid cells: \\[\\(0, 1\\)\\]"):
+            Heatmap([[1, math.inf], [3, 4]], vectorize=vectorize)
+        chart = Heatmap([[1, 2]], vectorize=vectorize)
+        with pytest.raises(ValueError, match="finite"):
+            chart.update_data([[-math.inf, 2]])
+
+    def test_invalid_colormap_raises_error(self):
+        """Test that unknown colormaps and colors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid colormap"):
+            Heatmap([[1]], colormap="rainbow")
+        with pytest.raises(ValueError, match="Invalid color"):
+            Heatmap([[1]], colormap=["#000000", "red"])
+
+    def test_repr_and_len(self):
+        """Test the string representation and the cell count."""
+        chart = Heatmap([[1, 2, 3], [4, 5, 6]])
+
+        assert len(chart) == 6
+        assert repr(chart) == "Heatmap(rows=2, columns=3, position=(0, 0))"
+
+
+class TestHeatmapCells:
+    """Test the placement and colors of the cells."""
+
+    def test_cell_positions(self):
+        """Test that cells are laid out in rows and columns."""
+        chart = Heatmap(
+            [[1, 2, 3], [4, 5, 6]], cell_width=10, cell_height=5, position=(7, 3)
+        )
+
+        assert [[cell.position for cell in row] for row in chart.cells] == [
+            [(7, 3), (17, 3), (27, 3)],
+            [(7, 8), (17, 8), (27, 8)],
+        ]
+        assert all(cell.geometry.width == 10 for cell in chart.group.objects)
+        assert all(cell.geometry.height == 5 for cell in chart.group.objects)
+
+    def test_quantized_colors(self):
+        """Test that values are binned evenly into the level colors."""
+        chart = Heatmap(
+            [[0, 0.24, 0.25, 0.5], [0.74, 0.75, 0.99, 1]],
+            colormap=["#000000", "#FFFFFF"],
+            levels=4,
+        )
+
+        assert chart.level_colors == ["#000000", "#555555", "#AAAAAA", "#FFFFFF"]
+        assert [[cell.fillColor for cell in row] for row in chart.cells] == [
+            ["#000000", "#000000", "#555555", "#AAAAAA"],
+            ["#AAAAAA", "#FFFFFF", "#FFFFFF", "#FFFFFF"],
+        ]
+
+    def test_value_range_clamps(self):
+        """Test that values outside the value range get the end colors."""
+        chart = Heatmap(
+            [[-2, 0, 2]], colormap="coolwarm", levels=3, value_range=(-1, 1)
+        )
+
+        assert [cell.fillColor for cell in chart.cells[0]] == chart.level_colors
+
+    def test_missing_values(self):
+        """Test that NaN values get the missing color."""
+        chart = Heatmap([[1, math.nan, 3]], missing_color=StandardColor.GRAY1)
+
+        assert chart.cells[0][1].fillColor == StandardColor.GRAY1
+        assert chart.cells[0][0].fillColor == chart.level_colors[0]
+
+    def test_show_values(self):
+        """Test that values are written in a readable color."""
+        chart = Heatmap(
+            [[0, 1]],
+            colormap="grays",
+            show_values=True,
+            value_formatter=lambda value: f"{value:.0%}",
+        )
+        low, high = chart.cells[0]
+
+        assert (low.value, high.value) == ("0%", "100%")
+        assert low.text_format.fontColor == "#000000"
+        assert high.text_format.fontColor == "#FFFFFF"
+
+    def test_labels(self):
+        """Test that row and column labels are placed beside the grid."""
+        chart = Heatmap(
+            [[1, 2], [3, 4]],
+            row_labels=["a", "b"],
+            column_labels=["x", "y"],
+            title="Grid",
+        )
+        labels = [obj for obj in chart.group.objects if obj.value]
+        first_cell = chart.cells[0][0]
+
+        assert [obj.value for obj in labels] == ["Grid", "x", "y", "a", "b"]
+        assert labels[1].geometry.x == first_cell.geometry.x
+        assert labels[1].geometry.y < first_cell.geometry.y
+        assert labels[3].geometry.x < first_cell.geometry.x
+
+
+class TestHeatmapVectorized:
+    """Test that the NumPy build path matches the scalar one."""
+
+    def test_vectorized_matches_scalar(self):
+        """Test that both paths build the same chart."""
+        pytest.importorskip("numpy")
+        data = [[((i * 31 + j * 17) % 23) / 3 - 2 for j in range(12)] for i in range(9)]
+        data[2][5] = math.nan
+        options = {
+            "show_values": True,
+            "cell_width": 7.5,
+            "position": (3, 1.5),
+            "column_labels": [str(j) for j in range(12)],
+        }
+
+        scalar = Heatmap(data, vectorize=False, **options)
+        vectorized = Heatmap(data, vectorize=True, **options)
+
+        assert chart_xml(vectorized) == chart_xml(scalar)
+
+    def test_numpy_array_input(self):
+        """Test that 2-D arrays are accepted and other shapes aren't."""
+        np = pytest.importorskip("numpy")
+        grid = np.arange(6).reshape(2, 3)
+
+        assert Heatmap(grid).data == [[0, 1, 2], [3, 4, 5]]
+        assert chart_xml(Heatmap(grid)) == chart_xml(Heatmap(grid.tolist()))
+        with pytest.raises(ValueError, match="2-D array"):
+            Heatmap(np.arange(6))
+
+
+class TestHeatmapUpdates:
+    """Test updating, moving, and drawing the chart."""
+
+    def test_update_colormap_in_place(self):
+        """Test that recoloring keeps the cells."""
+        chart = Heatmap([[1, 2], [3, 4]])
+        cells = chart.group.objects[:]
+
+        chart.update_colormap("reds")
+
+        assert chart.group.objects == cells
+        assert chart_xml(chart) == chart_xml(Heatmap([[1, 2], [3, 4]], colormap="reds"))
+
+    def test_move(self):
+        """Test that moving shifts every object."""
+        chart = Heatmap([[1, 2], [3, 4]], row_labels=["a", "b"], title="T")
+        chart.move((50, 20))
+
+        assert chart_xml(chart) == chart_xml(
+            Heatmap(
+                [[1, 2], [3, 4]], row_labels=["a", "b"], title="T", position=(50, 20)
+            )
+        )
+
+    def test_update_data_updates_pages(self):
+        """Test that pages the chart was added to get the new cells."""
+        page = Page()
+        chart = Heatmap([[1, 2], [3, 4]])
+        chart.add_to_page(page)
+        old_cells = chart.group.objects[:]
+
+        chart.update_data([[5, 6, 7]])
+
+        on_page = [obj for obj in page.objects if isinstance(obj, Object)]
+        assert on_page == chart.group.objects
+        assert len(on_page) == 3
+        assert not any(cell in page.objects for cell in old_cells)
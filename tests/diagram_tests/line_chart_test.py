@@ -0,0 +1,204 @@
+import math
+
+import pytest
+from drawpyo.diagram_types.line_chart import (
+    LineChart,
+    downsample_lttb,
+    downsample_min_max,
+)
+from drawpyo.diagram.edges import Edge
+from drawpyo.diagram.objects import Object
+from drawpyo.page import Page
+from drawpyo.utils.color_scheme import ColorScheme
+
+
+def line_points(line):
+    """The page coordinates of a line, from its source to its target."""
+    geometry = line.geometry
+    points = [geometry.source_point, *geometry.points, geometry.target_point]
+    return [(point.x, point.y) for point in points]
+
+
+class TestDownsampling:
+    """Test the downsampling functions."""
+
+    def test_short_series_unchanged(self):
+        """Test that series within the budget are kept as they are."""
+        points = [(0, 1), (1, 3), (2, 2)]
+
+        assert downsample_lttb(points, 3) == points
+        assert downsample_min_max(points, 10) == points
+
+    def test_lttb_keeps_ends_and_budget(self):
+        """Test that LTTB keeps the first and last point and the budget."""
+        points = [(i, math.sin(i / 10)) for i in range(1000)]
+        sampled = downsample_lttb(points, 50)
+
+        assert len(sampled) == 50
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert sampled == sorted(sampled)
+
+    def test_lttb_keeps_spike(self):
+        """Test that LTTB picks the point that changes the shape most."""
+        points = [(i, 0) for i in range(100)]
+        points[37] = (37, 50)
+
+        assert (37, 50) in downsample_lttb(points, 10)
+
+    def test_min_max_keeps_extremes(self):
+        """Test that min/max bucketing keeps every bucket's extremes in order."""
+        points = [(i, (i * 7919) % 101) for i in range(1000)]
+        sampled = downsample_min_max(points, 40)
+
+        assert len(sampled) <= 40
+        assert sampled == sorted(sampled)
+        for bucket in range(20):
+            ys = [y for _, y in points[bucket * 50 : (bucket + 1) * 50]]
+            kept = [y for x, y in sampled if bucket * 50 <= x < (bucket + 1) * 50]
+            assert min(ys) in kept
+            assert max(ys) in kept
+
+    def test_budget_too_small(self):
+        """Test that budgets that can't keep the shape raise ValueError."""
+        points = [(i, i) for i in range(10)]
+        with pytest.raises(ValueError):
+            downsample_lttb(points, 2)
+        with pytest.raises(ValueError):
+            downsample_min_max(points, 1)
+
+
+class TestLineChartInitialization:
+    """Test LineChart initialization and validation."""
+
+    def test_empty_data_raises_error(self):
+        """Test that empty data raises ValueError."""
+        with pytest.raises(ValueError, match="Data cannot be empty"):
+            LineChart({})
+
+    def test_non_dict_data_raises_error(self):
+        """Test that non-dict data raises TypeError."""
+        with pytest.raises(TypeError, match="Data must be a dict"):
+            LineChart([1, 2, 3])
+
+    def test_invalid_series_raises_error(self):
+        """Test that series that aren't numbers or pairs raise TypeError."""
+        with pytest.raises(TypeError, match="Invalid: \\['b', 'c', 'd'\\]"):
+            LineChart({"a": [1, 2], "b": [], "c": "12", "d": [(1, 2), (3,)]})
+
+    @pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+    def test_non_finite_values_raise_error(self, value):
+        """Test that NaN and infinite values raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid: \\['b', 'c'\\]"):
+            LineChart({"a": [1, 2], "b": [1, value], "c": [(value, 1), (2, 3)]})
+        chart = LineChart({"a": [1, 2]})
+        with pytest.raises(ValueError, match="finite"):
+            chart.update_data({"a": [value, 2]})
+
+    def test_invalid_downsampling_raises_error(self):
+        """Test that unknown downsampling methods raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid downsampling method"):
+            LineChart({"a": [1, 2]}, downsampling="average")
+
+    def test_values_and_pairs(self):
+        """Test that lists of values are plotted against their index."""
+        chart = LineChart({"a": [1, 3, 2], "b": [(0, 1), (2, 2)]})
+
+        assert chart.data == {
+            "a": [(0, 1.0), (1, 3.0), (2, 2.0)],
+            "b": [(0.0, 1.0), (2.0, 2.0)],
+        }
+        assert len(chart) == 2
+        assert repr(chart) == "LineChart(series=2, position=(0, 0))"
+
+
+class TestLineChartLines:
+    """Test how the series are drawn."""
+
+    def test_one_edge_per_series(self):
+        """Test that each series is a single edge through its points."""
+        chart = LineChart({"a": [0, 10, 5]}, width=100, height=50, position=(10, 20))
+        line = chart.lines["a"]
+
+        assert isinstance(line, Edge)
+        assert line.line_end_target == "none"
+        assert line_points(line) == [(10.0, 70.0), (60.0, 20.0), (110.0, 45.0)]
+
+    def test_long_series_is_downsampled(self):
+        """Test that the number of points stays within the budget."""
+        values = [math.sin(i / 50) for i in range(20000)]
+        for method in LineChart.DOWNSAMPLING_METHODS:
+            chart = LineChart({"a": values}, max_points=100, downsampling=method)
+
+            assert len(line_points(chart.lines["a"])) <= 100
+
+    def test_series_share_axes(self):
+        """Test that all series are scaled to the same ranges."""
+        chart = LineChart({"a": [0, 10], "b": [(0, 0), (0.5, 5)]}, width=100)
+
+        assert line_points(chart.lines["b"])[-1] == (50.0, 100.0)
+
+    def test_flat_series(self):
+        """Test that a constant series doesn't divide by zero."""
+        chart = LineChart({"a": [3, 3, 3]}, height=100)
+
+        assert {y for _, y in line_points(chart.lines["a"])} == {100.0}
+
+    def test_colors(self):
+        """Test that lines use plain colors and color schemes."""
+        scheme = ColorScheme(fill_color="#123456", stroke_color="#654321")
+        chart = LineChart(
+            {"a": [1, 2], "b": [2, 1], "c": [1, 1]},
+            line_colors=["#ff0000", scheme],
+        )
+
+        assert chart.lines["a"].strokeColor == "#ff0000"
+        assert chart.lines["b"].strokeColor == "#654321"
+        assert chart.lines["c"].strokeColor == "#ff0000"
+
+        chart.update_colors(["#00ff00"])
+        assert all(line.strokeColor == "#00ff00" for line in chart.lines.values())
+
+
+class TestLineChartUpdates:
+    """Test updating, moving, and drawing the chart."""
+
+    OPTIONS = {"title": "Load", "background_color": "#eeeeee", "show_axis": True}
+
+    def test_axis_labels(self):
+        """Test that the axes are labeled with the data ranges."""
+        chart = LineChart(
+            {"a": [(10, 0), (20, 100)]},
+            show_axis=True,
+            axis_tick_count=2,
+            x_label_formatter=lambda value: f"t={value:g}",
+        )
+        labels = [obj.value for obj in chart.group.objects if obj.value]
+
+        assert labels == ["100.0", "t=10", "50.0", "t=15", "0.0", "t=20"]
+
+    def test_move(self):
+        """Test that moving shifts the objects and the lines."""
+        chart = LineChart({"a": [0, 10, 5]}, **self.OPTIONS)
+        before = line_points(chart.lines["a"])
+        positions = [obj.position for obj in chart.group.objects]
+
+        chart.move((100, 50))
+
+        assert line_points(chart.lines["a"]) == [(x + 100, y + 50) for x, y in before]
+        assert [obj.position for obj in chart.group.objects] == [
+            (x + 100, y + 50) for x, y in positions
+        ]
+
+    def test_update_data_updates_pages(self):
+        """Test that pages the chart was added to get the new objects."""
+        page = Page()
+        chart = LineChart({"a": [1, 2], "b": [2, 1]}, **self.OPTIONS)
+        chart.add_to_page(page)
+        old_lines = chart.lines
+
+        chart.update_data({"c": [5, 1, 3]})
+
+        on_page = [obj for obj in page.objects if isinstance(obj, (Object, Edge))]
+        assert on_page == chart.group.objects + [chart.lines["c"]]
+        assert not any(line in page.objects for line in old_lines.values())
@@ -4,6 +4,9 @@ Tests for the Object class.
 Object is the base class for all shapes and objects in Draw.io diagrams.
 """
 
+import pickle
+from copy import deepcopy
+
 import pytest
 import drawpyo
 from drawpyo.utils.color_scheme import ColorScheme
@@ -140,6 +143,36 @@ class TestObjectTemplate:
         assert obj_style["fillColor"] == "#FF0000"
         assert obj_style["strokeColor"] == "#000000"
 
+    def test_create_many(self, empty_page: drawpyo.Page) -> None:
+        """Checks that create_many builds independent objects with the same style"""
+        objects = drawpyo.diagram.Object.create_many(
+            3, page=empty_page, width=40, fillColor="#ff0000", rounded=True
+        )
+
+        assert len(objects) == 3
+        assert len({obj.id for obj in objects}) == 3
+        assert all(obj in empty_page.objects for obj in objects)
+        assert all(obj.style == objects[0].style for obj in objects)
+        assert all(obj.geometry.parent_object is obj for obj in objects)
+
+        objects[1].position = (10, 20)
+        objects[1].text_format.fontColor = "#00ff00"
+        objects[1].add_style_attribute("extra")
+        assert objects[0].position == (0, 0)
+        assert objects[0].text_format.fontColor is None
+        assert "extra" not in objects[2]._style_attributes
+        objects[1].add_object(objects[2])
+        objects[1].add_out_edge("edge")
+        assert len(objects[0].children) == len(objects[0].out_edges) == 0
+
+    def test_create_many_with_parent(self, empty_page: drawpyo.Page) -> None:
+        """Checks that create_many adds every object to the parent"""
+        parent = drawpyo.diagram.Object(page=empty_page)
+        objects = drawpyo.diagram.Object.create_many(2, page=empty_page, parent=parent)
+
+        assert parent.children == objects
+        assert drawpyo.diagram.Object.create_many(0) == []
+
 
 class TestObjectColors:
     """Tests of working with object colors"""
@@ -180,6 +213,118 @@ class TestObjectColors:
         assert obj.color_scheme == basic_color_scheme
 
 
+class TestObjectLazyContainers:
+    """Tests of the containers objects only allocate when needed"""
+
+    def test_defaults_are_shared(self, empty_page: drawpyo.Page) -> None:
+        """Checks that new objects don't allocate child, edge, or style lists"""
+        obj = drawpyo.diagram.Object(page=empty_page)
+        for name in ("_children", "_in_edges", "_out_edges", "_style_attributes"):
+            assert name not in obj.__dict__
+
+    def test_reads_dont_allocate(self, empty_page: drawpyo.Page) -> None:
+        """Checks that reading the child and edge lists doesn't allocate them"""
+        obj = drawpyo.diagram.Object(page=empty_page)
+        assert len(obj.children) == len(obj.in_edges) == 0
+        assert [edge for edge in obj.out_edges] == []
+        for name in ("_children", "_in_edges", "_out_edges"):
+            assert name not in obj.__dict__
+
+    def test_containers_allocated_on_add(self, empty_page: drawpyo.Page) -> None:
+        """Checks that changing one object's lists leaves the others alone"""
+        first = drawpyo.diagram.Object(page=empty_page)
+        second = drawpyo.diagram.Object(page=empty_page)
+        first.add_object(second)
+        first.add_out_edge("edge")
+        first.add_style_attribute("custom")
+        assert first.children == [second] and first.out_edges == ["edge"]
+        assert len(second.children) == len(second.out_edges) == 0
+        assert "custom" not in second.style_attributes
+        assert "custom" not in drawpyo.diagram.Object._style_attributes
+
+    def test_edges_allocate_lists(self, empty_page: drawpyo.Page) -> None:
+        """Checks that connecting an edge gives only the linked ends a list"""
+        source = drawpyo.diagram.Object(page=empty_page)
+        target = drawpyo.diagram.Object(page=empty_page)
+        edge = drawpyo.diagram.Edge(page=empty_page, source=source, target=target)
+        assert source.out_edges == [edge]
+        assert target.in_edges == [edge]
+        assert "_in_edges" not in source.__dict__
+
+
+class TestObjectTextFormat:
+    """Tests of the shared, frozen text formats"""
+
+    def test_default_format_is_shared(self, empty_page: drawpyo.Page) -> None:
+        """Checks that objects with default formatting share one TextFormat"""
+        first = drawpyo.diagram.Object(page=empty_page)
+        second = drawpyo.diagram.Object(page=empty_page)
+        assert first._text_format is drawpyo.diagram.TextFormat.DEFAULT
+        assert second._text_format is first._text_format
+
+    def test_text_format_copied_on_access(self, empty_page: drawpyo.Page) -> None:
+        """Checks that editing one object's text format leaves the others alone"""
+        first = drawpyo.diagram.Object(page=empty_page)
+        second = drawpyo.diagram.Object(page=empty_page)
+        first.text_format.bold = True
+        assert "fontStyle=1" in first.style
+        assert second._text_format is drawpyo.diagram.TextFormat.DEFAULT
+        assert "fontStyle" not in second.style
+
+    def test_text_format_shared_after_reads(self, empty_page: drawpyo.Page) -> None:
+        """Checks that reading the style, XML, or text format doesn't copy it"""
+        TextFormat = drawpyo.diagram.TextFormat
+        obj = drawpyo.diagram.Object(page=empty_page)
+        edge = drawpyo.diagram.Edge(page=empty_page, source=obj, target=obj)
+        empty_page.xml
+        assert obj.text_format.bold is False
+        assert isinstance(edge.text_format, TextFormat)
+        assert obj._text_format is edge._text_format is TextFormat.DEFAULT
+
+        edge.text_format.fontColor = "#FF0000"
+        assert edge._text_format is not TextFormat.DEFAULT
+        assert "fontColor=#FF0000" in edge.style
+        assert TextFormat.DEFAULT.fontColor is None
+
+    def test_frozen_format_is_immutable(self) -> None:
+        """Checks that a frozen format can't be changed"""
+        text_format = drawpyo.diagram.TextFormat(fontSize=14).freeze()
+        with pytest.raises(AttributeError):
+            text_format.fontSize = 16
+        assert text_format.copy().frozen is False
+
+    def test_replace_interns_formats(self) -> None:
+        """Checks that equal frozen formats are the same instance"""
+        TextFormat = drawpyo.diagram.TextFormat
+        first = TextFormat(fontColor="#FF0000").freeze()
+        second = TextFormat.DEFAULT.replace(fontColor="#FF0000")
+        assert first is second
+        assert first.replace(fontColor="#FF0000") is first
+        assert deepcopy(first) is first
+        assert first.style == TextFormat(fontColor="#FF0000").style
+
+    def test_interned_formats_released(self) -> None:
+        """Checks that frozen formats nothing uses are dropped, and that equal values of different types aren't mixed up"""
+        TextFormat = drawpyo.diagram.TextFormat
+        text_format = TextFormat(fontFamily="Released Font").freeze()
+        key = text_format._formatting_key()
+        assert key in TextFormat._interned
+        del text_format
+        assert key not in TextFormat._interned
+
+        whole = TextFormat(fontSize=12).freeze()
+        decimal = TextFormat(fontSize=12.0).freeze()
+        assert whole is not decimal
+        assert "fontSize=12.0;" in decimal.style
+
+    def test_text_format_pickles(self) -> None:
+        """Checks that a slotted, frozen format survives pickling"""
+        text_format = drawpyo.diagram.TextFormat(fontSize=14, bold=True).freeze()
+        unpickled = pickle.loads(pickle.dumps(text_format))
+        assert unpickled.style == text_format.style
+        assert unpickled.freeze() is text_format
+
+
 class TestObjectGeometry:
     """Tests of geometry and positioning of objects"""
 
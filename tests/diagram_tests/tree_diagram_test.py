@@ -0,0 +1,684 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from drawpyo.diagram import Edge
+from drawpyo.diagram_types import TreeDiagram, NodeObject, TreeGroup
+
+
+SAMPLE_TREE = {
+    "Root": {
+        "A": ["A1", "A2", "A3"],
+        "B": {"B1": ["X", "Y"], "B2": "Z"},
+        "C": "C1",
+    }
+}
+# The nodes of SAMPLE_TREE in depth first order
+SAMPLE_ORDER = "Root A A1 A2 A3 B B1 X Y B2 Z C C1".split()
+
+
+def node(tree: TreeDiagram, value: str) -> NodeObject:
+    return [o for o in tree.objects if o.value == value][0]
+
+
+def random_tree(size: int, seed: int = 0, **kwargs) -> TreeDiagram:
+    """A tree with random shape and node sizes."""
+    rng = random.Random(seed)
+    tree = TreeDiagram(**kwargs)
+    nodes = [NodeObject(tree=tree, value="0")]
+    for i in range(1, size):
+        parent = rng.choice(nodes[-50:])
+        nodes.append(
+            NodeObject(
+                tree=tree,
+                value=str(i),
+                tree_parent=parent,
+                width=rng.choice([40, 80, 120]),
+                height=rng.choice([30, 60]),
+            )
+        )
+    return tree
+
+
+def assert_no_overlaps(tree: TreeDiagram) -> None:
+    """Nodes on the same level must not overlap."""
+    levels = defaultdict(list)
+    for obj in tree.objects:
+        if tree.direction in ["up", "down"]:
+            levels[obj.center_position[1]].append((obj.geometry.x, obj.width))
+        else:
+            levels[obj.center_position[0]].append((obj.geometry.y, obj.height))
+    for spans in levels.values():
+        spans.sort()
+        for (start, size), (next_start, _) in zip(spans, spans[1:]):
+            assert start + size + tree.item_spacing <= next_start + 1e-6
+
+
+class TestLayoutEngineSelection:
+    def test_default_engine_is_group(self):
+        assert TreeDiagram().layout_engine == "group"
+
+    def test_invalid_engine_raises(self):
+        with pytest.raises(ValueError, match="not a valid entry for layout_engine"):
+            TreeDiagram(layout_engine="spring")
+
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        with pytest.raises(ValueError, match="not a valid entry for layout_engine"):
+            tree.auto_layout(engine="spring")
+
+    def test_engine_argument_does_not_change_default(self):
+        tree = TreeDiagram()
+        NodeObject(tree=tree, value="Root")
+        tree.auto_layout(engine="buchheim")
+        assert tree.layout_engine == "group"
+
+    def test_from_dict_passes_engine(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        assert tree.layout_engine == "buchheim"
+        assert len(tree.links) == len(tree.objects) - 1
+
+
+class TestBuchheimLayout:
+    @pytest.mark.parametrize("direction", ["down", "up", "left", "right"])
+    def test_levels_follow_direction(self, direction):
+        tree = TreeDiagram.from_dict(
+            SAMPLE_TREE, direction=direction, layout_engine="buchheim"
+        )
+        root, a, a1 = node(tree, "Root"), node(tree, "A"), node(tree, "A1")
+        axis = 1 if direction in ["up", "down"] else 0
+        sign = 1 if direction in ["down", "right"] else -1
+
+        assert sign * (a.center_position[axis] - root.center_position[axis]) > 0
+        assert sign * (a1.center_position[axis] - a.center_position[axis]) > 0
+        assert a.center_position[axis] == node(tree, "C").center_position[axis]
+        assert_no_overlaps(tree)
+
+    def test_parent_centered_over_children(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        a = node(tree, "A")
+        assert a.center_position[0] == pytest.approx(
+            (node(tree, "A1").center_position[0] + node(tree, "A3").center_position[0])
+            / 2
+        )
+        assert node(tree, "C1").center_position[0] == pytest.approx(
+            node(tree, "C").center_position[0]
+        )
+
+    def test_siblings_spaced_by_item_spacing(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        a1, a2 = node(tree, "A1"), node(tree, "A2")
+        assert a2.geometry.x - (a1.geometry.x + a1.width) == tree.item_spacing
+
+    def test_level_spacing(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        root, a = node(tree, "Root"), node(tree, "A")
+        assert a.geometry.y - (root.geometry.y + root.height) == tree.level_spacing
+        assert root.geometry.y == tree.padding
+
+    def test_links_follow_depth_first_order(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        targets = [link.target.value for link in tree.links]
+        assert targets == SAMPLE_ORDER[1:]
+
+    def test_multiple_roots(self):
+        tree = TreeDiagram(layout_engine="buchheim")
+        first = NodeObject(tree=tree, value="First")
+        second = NodeObject(tree=tree, value="Second")
+        NodeObject(tree=tree, value="Child", tree_parent=first)
+        tree.auto_layout()
+
+        assert first.center_position[1] == second.center_position[1]
+        assert second.geometry.x - (first.geometry.x + first.width) >= (
+            tree.item_spacing
+        )
+
+    @pytest.mark.parametrize("direction", ["down", "right"])
+    def test_large_random_tree(self, direction):
+        tree = random_tree(2000, direction=direction, layout_engine="buchheim")
+        group = tree.auto_layout()
+
+        assert len(group.objects) == 2000
+        assert len(tree.links) == 1999
+        assert_no_overlaps(tree)
+
+    def test_returns_group_around_tree(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        group = tree.auto_layout()
+        assert group.left == min(o.geometry.x for o in tree.objects)
+        assert group.width > 0
+
+
+def chain(depth: int):
+    """Nested dict data for a tree that is a single path of depth nodes."""
+    data = "leaf"
+    for i in reversed(range(depth)):
+        data = {str(i): data}
+    return data
+
+
+class TestGroupLayout:
+    def test_parent_centered_over_children(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        a, a1, a3 = node(tree, "A"), node(tree, "A1"), node(tree, "A3")
+        assert a.center_position[0] == (
+            (a1.center_position[0] + a3.center_position[0]) / 2
+        )
+        assert a1.geometry.y - (a.geometry.y + a.height) == tree.level_spacing
+        assert node(tree, "Root").geometry.y == tree.padding
+
+    def test_links_follow_depth_first_order(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        targets = [link.target.value for link in tree.links]
+        assert targets == SAMPLE_ORDER[1:]
+
+    def test_nested_groups_wrap_their_objects(self):
+        tree = random_tree(300, seed=3)
+        top_group = tree.auto_layout()
+
+        stack = [top_group]
+        while stack:
+            grp = stack.pop()
+            for obj in grp.objects:
+                assert obj.geometry.x >= grp.geometry.x
+                assert obj.geometry.y >= grp.geometry.y
+                if isinstance(obj, TreeGroup):
+                    assert obj.parent_object is not None
+                    stack.append(obj)
+            assert grp.geometry.x == grp.left
+            assert grp.geometry.y == grp.top
+            assert grp.geometry.width == grp.width
+            assert grp.geometry.height == grp.height
+
+    @pytest.mark.parametrize("direction", ["down", "left"])
+    def test_random_tree_has_no_overlaps(self, direction):
+        tree = random_tree(1000, seed=1, direction=direction)
+        tree.auto_layout()
+        assert_no_overlaps(tree)
+
+
+class TestDeepTrees:
+    @pytest.mark.parametrize("engine", ["group", "buchheim"])
+    def test_from_dict_depth_10k(self, engine):
+        tree = TreeDiagram.from_dict(chain(10000), layout_engine=engine)
+
+        assert len(tree.objects) == 10001
+        assert len(tree.links) == 10000
+        first, last = tree.objects[0], tree.objects[-1]
+        assert (first.value, last.value) == ("0", "leaf")
+        assert last.tree_parent is tree.objects[-2]
+        assert last.center_position[0] == first.center_position[0]
+        assert last.geometry.y == tree.padding + 10000 * (
+            first.height + tree.level_spacing
+        )
+
+    def test_from_dict_order_matches_data(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        assert [o.value for o in tree.objects] == SAMPLE_ORDER
+        assert [c.value for c in node(tree, "B").tree_children] == ["B1", "B2"]
+
+    def test_from_dict_invalid_types_raise(self):
+        with pytest.raises(TypeError, match="Invalid dict key type"):
+            TreeDiagram.from_dict({"Root": {(1, 2): "A"}})
+        with pytest.raises(TypeError, match="Unsupported type in tree data"):
+            TreeDiagram.from_dict({"Root": ["A", {"B": None}]})
+
+
+class TestPeerLinks:
+    def peer_links(self, tree: TreeDiagram):
+        # Links that don't join a parent and its child
+        return [
+            (link.source.value, link.target.value)
+            for link in tree.links
+            if link.target.tree_parent is not link.source
+        ]
+
+    def test_peers_are_ordered_sets(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        a, b, c = node(tree, "A"), node(tree, "B"), node(tree, "C")
+        a.add_peer(c)
+        a.add_peer(b)
+        a.add_peer(c)
+        b.add_peer(a)
+        assert list(a.peers) == [c, b]
+        assert list(b.peers) == [a]
+
+    def test_peer_links_follow_object_order(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        node(tree, "C").add_peer(node(tree, "B"))
+        node(tree, "A").add_peer(node(tree, "C"))
+        node(tree, "A").add_peer(node(tree, "B"))
+        tree.connect_peers()
+        assert self.peer_links(tree) == [("A", "C"), ("A", "B"), ("B", "C")]
+
+    def test_existing_links_are_not_duplicated(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        root, a, b = node(tree, "Root"), node(tree, "A"), node(tree, "B")
+        # Already linked as parent and child
+        root.add_peer(a)
+        a.add_peer(b)
+        tree.connect_peers()
+        tree.connect_peers()
+        assert self.peer_links(tree) == [("A", "B")]
+
+    def test_links_appended_directly_are_respected(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        a, b = node(tree, "A"), node(tree, "B")
+        tree.links.append(Edge(page=tree.page, source=b, target=a))
+        a.add_peer(b)
+        tree.connect_peers()
+        assert self.peer_links(tree) == [("B", "A")]
+
+    def test_connect_peers_10k_nodes(self):
+        tree = TreeDiagram()
+        root = NodeObject(tree=tree, value="root")
+        children = [
+            NodeObject(tree=tree, value=str(i), tree_parent=root) for i in range(10000)
+        ]
+        for child, next_child in zip(children, children[1:]):
+            child.add_peer(next_child)
+            child.add_peer(root)
+        tree.auto_layout(engine="buchheim")
+        assert len(tree.links) == 10000 + 9999
+        assert self.peer_links(tree)[:2] == [("0", "1"), ("1", "2")]
+
+
+def add_leaves(tree: TreeDiagram, seed: int, count: int = 5) -> None:
+    """Add leaves under random nodes of a tree."""
+    rng = random.Random(seed)
+    for i in range(count):
+        NodeObject(
+            tree=tree,
+            value="new{0}".format(i),
+            tree_parent=rng.choice(tree.objects),
+            width=rng.choice([40, 80]),
+        )
+
+
+def assert_same_layout(tree: TreeDiagram, other: TreeDiagram) -> None:
+    """The nodes of two trees differ by the same offset."""
+    first, other_first = tree.objects[0], other.objects[0]
+    dx = first.geometry.x - other_first.geometry.x
+    dy = first.geometry.y - other_first.geometry.y
+    for obj, other_obj in zip(tree.objects, other.objects):
+        assert obj.geometry.x - other_obj.geometry.x == pytest.approx(dx)
+        assert obj.geometry.y - other_obj.geometry.y == pytest.approx(dy)
+
+
+class TestRelayout:
+    @pytest.mark.parametrize("engine", ["group", "buchheim"])
+    def test_auto_layout_again_keeps_links(self, engine):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine=engine)
+        links = list(tree.links)
+        tree.auto_layout()
+        assert tree.links == links
+        assert len(tree.page.objects) == 2 + 13 + 12
+
+    @pytest.mark.parametrize("engine", ["group", "buchheim"])
+    @pytest.mark.parametrize("direction", ["down", "left"])
+    def test_matches_full_layout(self, engine, direction):
+        for seed in range(5):
+            tree = random_tree(200, seed, layout_engine=engine, direction=direction)
+            tree.auto_layout()
+            add_leaves(tree, seed)
+            tree.relayout()
+
+            expected = random_tree(200, seed, layout_engine=engine, direction=direction)
+            add_leaves(expected, seed)
+            expected.auto_layout()
+            assert_same_layout(tree, expected)
+            assert len(tree.links) == len(tree.objects) - 1
+
+    def test_first_root_stays_in_place(self):
+        tree = random_tree(100, seed=4)
+        tree.auto_layout()
+        root = tree.objects[0]
+        position = root.position
+        add_leaves(tree, seed=4, count=20)
+        tree.relayout()
+        assert root.position == position
+
+    def test_untouched_subtrees_are_not_moved(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        a1, z = node(tree, "A1"), node(tree, "Z")
+        # Changes the layout of B's subtree but not its width
+        new = NodeObject(tree=tree, value="new", tree_parent=z)
+        a1.geometry.x = -1000
+        tree.relayout()
+
+        assert a1.geometry.x == -1000
+        assert new.center_position[0] == z.center_position[0]
+        assert new.geometry.y == z.geometry.y + z.height + tree.level_spacing
+
+    def test_reuses_links(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        links = list(tree.links)
+        new = NodeObject(tree=tree, value="new", tree_parent=node(tree, "A"))
+        tree.relayout()
+        assert tree.links[:-1] == links
+        assert (tree.links[-1].source, tree.links[-1].target) == (node(tree, "A"), new)
+
+    def test_reparent_replaces_link(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        a, b, a1 = node(tree, "A"), node(tree, "B"), node(tree, "A1")
+        count = len(tree.links)
+        a1.tree_parent = b
+        tree.relayout()
+
+        assert a1 not in a.tree_children
+        assert len(tree.links) == count
+        pairs = {(link.source, link.target) for link in tree.links}
+        assert (b, a1) in pairs and (a, a1) not in pairs
+        edges = [obj for obj in tree.page.objects if isinstance(obj, Edge)]
+        assert sorted(map(id, edges)) == sorted(map(id, tree.links))
+
+    def test_without_layout_lays_out_everything(self):
+        tree = random_tree(50, seed=5)
+        tree.relayout()
+        expected = random_tree(50, seed=5)
+        expected.auto_layout()
+        assert [o.position for o in tree.objects] == [
+            o.position for o in expected.objects
+        ]
+
+    def test_direction_change_lays_out_everything(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        tree.direction = "right"
+        tree.relayout()
+        expected = TreeDiagram.from_dict(
+            SAMPLE_TREE, layout_engine="buchheim", direction="right"
+        )
+        assert [o.position for o in tree.objects] == [
+            o.position for o in expected.objects
+        ]
+
+    def test_resized_node(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        node(tree, "X").width = 400
+        tree.mark_dirty(node(tree, "X"))
+        tree.relayout()
+        assert_no_overlaps(tree)
+
+        expected = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        node(expected, "X").width = 400
+        expected.auto_layout()
+        assert_same_layout(tree, expected)
+
+
+def edge_rows(tree: TreeDiagram):
+    """The (id, parent_id, label) rows of a tree, numbering nodes by object order."""
+    ids = {obj: i for i, obj in enumerate(tree.objects)}
+    return [(ids[obj], ids.get(obj.tree_parent), obj.value) for obj in tree.objects]
+
+
+def assert_same_tree(tree: TreeDiagram, other: TreeDiagram) -> None:
+    def walk(roots):
+        stack = list(reversed(roots))
+        while stack:
+            obj = stack.pop()
+            yield obj
+            stack.extend(reversed(obj.tree_children))
+
+    for a, b in zip(walk(tree.roots), walk(other.roots), strict=True):
+        assert (a.value, a.fillColor, a.strokeColor, a.position) == (
+            b.value,
+            b.fillColor,
+            b.strokeColor,
+            b.position,
+        )
+
+
+class TestFromEdges:
+    def test_matches_from_dict(self):
+        expected = TreeDiagram.from_dict(SAMPLE_TREE)
+        tree = TreeDiagram.from_edges(edge_rows(expected))
+        assert_same_tree(tree, expected)
+
+    def test_children_before_parents(self):
+        expected = TreeDiagram.from_dict(SAMPLE_TREE, layout_engine="buchheim")
+        tree = TreeDiagram.from_edges(
+            reversed(edge_rows(expected)), layout_engine="buchheim"
+        )
+        # Children arriving before their parent keep their row order
+        assert [c.value for c in node(tree, "Root").tree_children] == ["C", "B", "A"]
+
+        rows = edge_rows(expected)
+        random.Random(3).shuffle(rows)
+        tree = TreeDiagram.from_edges(rows)
+
+        def pairs(tree):
+            return {
+                (o.value, o.tree_parent and o.tree_parent.value) for o in tree.objects
+            }
+
+        assert pairs(tree) == pairs(expected)
+
+    def test_label_defaults_to_id(self):
+        tree = TreeDiagram.from_edges([("root", None), ("leaf", "root", None)])
+        assert [o.value for o in tree.objects] == ["root", "leaf"]
+        assert node(tree, "leaf").tree_parent is node(tree, "root")
+
+    @pytest.mark.parametrize("coloring", ["depth", "hash", "type"])
+    def test_coloring_matches_from_dict(self, coloring):
+        import drawpyo
+
+        colors = [
+            drawpyo.ColorScheme(fill_color="#111111", stroke_color="#222222"),
+            "#333333",
+            drawpyo.StandardColor.RED2,
+        ]
+        expected = TreeDiagram.from_dict(SAMPLE_TREE, colors=colors, coloring=coloring)
+        rows = edge_rows(expected)
+        random.Random(7).shuffle(rows)
+        tree = TreeDiagram.from_edges(rows, colors=colors, coloring=coloring)
+        by_value = {o.value: o for o in tree.objects}
+        for obj in expected.objects:
+            other = by_value[obj.value]
+            assert (other.fillColor, other.strokeColor, other.color_scheme) == (
+                obj.fillColor,
+                obj.strokeColor,
+                obj.color_scheme,
+            )
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            TreeDiagram.from_edges([(1, None), (1, None)])
+        with pytest.raises(ValueError, match="Unknown parent ids: 9"):
+            TreeDiagram.from_edges([(1, None), (2, 9)])
+        with pytest.raises(ValueError, match="cycle"):
+            TreeDiagram.from_edges([(1, None), (2, 3), (3, 2)])
+        with pytest.raises(ValueError, match="own parent"):
+            TreeDiagram.from_edges([(1, 1)])
+        with pytest.raises(ValueError, match="not a valid row"):
+            TreeDiagram.from_edges([(1,)])
+        with pytest.raises(ValueError, match="Row 2 .* must be hashable"):
+            TreeDiagram.from_edges([(1, None), (2, [1])])
+        with pytest.raises(ValueError, match="Invalid coloring mode"):
+            TreeDiagram.from_edges([], coloring="nope")
+        with pytest.raises(TypeError, match="colors must be a list"):
+            TreeDiagram.from_edges([], colors="#ffffff")
+
+    def test_streams_large_input(self):
+        def rows():
+            yield (0, None, "root")
+            for i in range(1, 20000):
+                yield (i, (i - 1) // 4, "n{0}".format(i))
+
+        tree = TreeDiagram.from_edges(rows(), layout_engine="buchheim")
+        assert len(tree.objects) == 20000
+        assert len(tree.links) == 19999
+
+    def test_from_jsonl(self, tmp_path):
+        path = tmp_path / "tree.jsonl"
+        path.write_text(
+            '{"id": "b", "parent_id": "a", "label": "B"}\n'
+            "\n"
+            '{"id": "a", "parent_id": null, "label": "A"}\n'
+            '["c", "a", "C"]\n'
+            '{"id": "d", "parent_id": "b"}\n',
+            encoding="utf-8",
+        )
+        tree = TreeDiagram.from_jsonl(str(path), colors=["#ffffff"])
+        assert [o.value for o in tree.roots] == ["A"]
+        assert [c.value for c in node(tree, "A").tree_children] == ["B", "C"]
+        assert [c.value for c in node(tree, "B").tree_children] == ["d"]
+        assert all(o.fillColor == "#ffffff" for o in tree.objects)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            '{"id": [1, 2], "parent_id": 1}',
+            '{"id": 2, "parent_id": {"a": 1}}',
+            "[[2], 1]",
+        ],
+    )
+    def test_from_jsonl_invalid_ids(self, tmp_path, line):
+        path = tmp_path / "tree.jsonl"
+        path.write_text('{"id": 1}\n\n' + line + "\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Line 3 .* ids must be"):
+            TreeDiagram.from_jsonl(str(path))
+
+
+def page_nodes(page):
+    return [o for o in page.objects if isinstance(o, NodeObject)]
+
+
+class TestPaginate:
+    def test_pages_fit_budget(self):
+        tree = random_tree(2000, seed=4)
+        tree.auto_layout()
+        pages = tree.paginate(max_nodes_per_page=200)
+
+        assert pages == tree.file.pages
+        assert len(pages) > 10
+        assert all(len(page_nodes(page)) <= 200 for page in pages)
+        # Every node is on exactly one page, along with one stub per moved subtree
+        values = [o.value for page in pages for o in page_nodes(page) if not o.link]
+        assert sorted(values, key=int) == [str(i) for i in range(2000)]
+        assert len(tree.objects) == 2000 + len(pages) - 1
+
+    def test_stubs_link_to_pages(self):
+        tree = random_tree(500, seed=1, layout_engine="buchheim")
+        pages = tree.paginate(100)
+        ids = {page.diagram.id: page for page in pages}
+        stubs = [o for o in tree.objects if o.link]
+        assert len(stubs) == len(pages) - 1
+        for stub in stubs:
+            page = ids[int(stub.link.split(",")[1])]
+            (root,) = [o for o in tree.roots if o.page is page]
+            assert page.name == root.value == stub.value
+            assert stub.tree_children == []
+            assert stub.page is stub.tree_parent.page is not page
+            assert 'link="data:page/id,' in stub.xml
+        assert not any(page_nodes(page)[0].link for page in pages)
+
+    def test_links_stay_on_their_page(self):
+        tree = random_tree(300, seed=2)
+        tree.auto_layout()
+        tree.objects[5].add_peer(tree.objects[250])
+        tree.objects[10].add_peer(tree.objects[11])
+        tree.connect_peers()
+        pages = tree.paginate(50)
+
+        links = [o for page in pages for o in page.objects if isinstance(o, Edge)]
+        assert sorted(map(id, links)) == sorted(map(id, tree.links))
+        for page in pages:
+            for link in page.objects:
+                if isinstance(link, Edge):
+                    assert link.source.page is link.target.page is page
+        # One tree link per node that has a parent
+        assert len(tree.links) == len(tree.objects) - len(tree.roots) + (
+            tree.objects[5].page is tree.objects[250].page
+        ) + (tree.objects[10].page is tree.objects[11].page)
+
+    def test_pages_are_laid_out(self):
+        tree = random_tree(400, seed=3)
+        pages = tree.paginate(60)
+        for page in pages:
+            nodes = page_nodes(page)
+            levels = defaultdict(list)
+            for obj in nodes:
+                levels[obj.center_position[1]].append((obj.geometry.x, obj.width))
+            for spans in levels.values():
+                spans.sort()
+                for (start, size), (next_start, _) in zip(spans, spans[1:]):
+                    assert start + size + tree.item_spacing <= next_start + 1e-6
+            roots = [o for o in nodes if o.tree_parent is None]
+            assert len(roots) == 1
+            assert roots[0].center_position[0] == tree.origin[0]
+
+    def test_small_tree_stays_on_one_page(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        positions = [o.position for o in tree.objects]
+        assert tree.paginate(100) == [tree.page]
+        assert [o.position for o in tree.objects] == positions
+
+    def test_several_roots(self):
+        tree = TreeDiagram.from_dict({"A": ["1", "2", "3"], "B": ["4", "5", "6"]})
+        pages = tree.paginate(5)
+        assert [[o.value for o in page_nodes(page)] for page in pages] == [
+            ["A", "1", "2", "3"],
+            ["B", "4", "5", "6"],
+        ]
+        assert not any(o.link for o in tree.objects)
+
+    def test_wide_node_keeps_its_leaves(self):
+        tree = TreeDiagram.from_dict({"Root": [str(i) for i in range(10)]})
+        assert tree.paginate(4) == [tree.page]
+
+    def test_paginate_again(self):
+        tree = random_tree(600, seed=6)
+        tree.paginate(300)
+        pages = tree.paginate(100)
+        assert pages == tree.file.pages
+        assert all(len(page_nodes(page)) <= 100 for page in pages)
+
+    def test_relayout_keeps_pages_apart(self):
+        tree = random_tree(300, seed=3)
+        pages = tree.paginate(60)
+        second = pages[1]
+        positions = {o: o.position for o in tree.objects}
+        parent = page_nodes(second)[-1]
+        new = NodeObject(tree=tree, value="new", tree_parent=parent)
+        tree.relayout()
+
+        assert new.page is second and new in page_nodes(second)
+        assert new.geometry.y == parent.geometry.y + parent.height + tree.level_spacing
+        # The other pages weren't touched
+        others = [o for o in tree.objects if o.page is not second]
+        assert all(o.position == positions[o] for o in others)
+        assert all(link.source.page is link.target.page for link in tree.links)
+        with pytest.raises(ValueError, match="paginate"):
+            tree.auto_layout()
+
+    def test_peers_linked_on_their_page(self):
+        tree = random_tree(300, seed=3)
+        second = tree.paginate(60)[1]
+        first, other = page_nodes(second)[1:3]
+        first.add_peer(other)
+        tree.relayout()
+
+        (link,) = [
+            link for link in tree.links if {link.source, link.target} == {first, other}
+        ]
+        assert link.page is second and link in second.objects
+        assert link not in tree.page.objects
+
+    def test_writes_valid_xml(self):
+        import xml.etree.ElementTree as ET
+
+        tree = random_tree(200, seed=8)
+        tree.paginate(40)
+        root = ET.fromstring(tree.file.xml)
+        diagrams = root.findall("diagram")
+        assert len(diagrams) == len(tree.file.pages)
+        ids = {d.get("id") for d in diagrams}
+        for user_object in root.iter("UserObject"):
+            assert user_object.get("link").split(",")[1] in ids
+
+    def test_invalid_arguments(self):
+        tree = TreeDiagram.from_dict(SAMPLE_TREE)
+        with pytest.raises(ValueError, match="strategy"):
+            tree.paginate(10, strategy="level")
+        with pytest.raises(ValueError, match="max_nodes_per_page"):
+            tree.paginate(0)
@@ -5,9 +5,12 @@ A File is a Draw.io file (.drawio), which can contain one or more diagram pages.
 """
 
 import drawpyo
+from drawpyo.utils.logger import logger
+import logging
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import pytest
+import tracemalloc
 
 
 class TestFileInit:
@@ -192,3 +195,163 @@ class TestFileWrite:
         file_path = test_file.write()
         assert Path(file_path).is_file()
         assert Path(file_path).parent == new_dir
+
+
+class TestFileOpenStream:
+    """Tests for streaming a page straight to disk"""
+
+    @staticmethod
+    def _build(page: drawpyo.Page, finalize: bool) -> None:
+        container = drawpyo.diagram.Object(
+            page=page, value="Container", position=(0, 0), width=400, height=300
+        )
+        first = drawpyo.diagram.Object(page=page, value="First", position=(20, 20))
+        if finalize:
+            page.finalize(container, first)
+        second = drawpyo.diagram.Object(page=page, value="Second", position=(20, 120))
+        second.parent = container
+        edge = drawpyo.diagram.Edge(page=page, source=first, target=second)
+        if finalize:
+            page.finalize(second, edge)
+
+    @staticmethod
+    def _cells(file_path: str) -> list:
+        root = ET.parse(file_path).getroot()
+        return [dict(cell.attrib) for cell in root.iter("mxCell")]
+
+    def test_open_stream_matches_write(self, test_output_dir: Path) -> None:
+        """Checks that a streamed page has the same cells as a written one"""
+        written = drawpyo.File(file_name="written.drawio", file_path=test_output_dir)
+        self._build(drawpyo.Page(file=written), finalize=False)
+        written_path = written.write()
+
+        streamed = drawpyo.File(file_path=test_output_dir)
+        streamed_path = str(test_output_dir / "streamed.drawio")
+        with streamed.open_stream(streamed_path) as page:
+            self._build(page, finalize=True)
+
+        written_cells = self._cells(written_path)
+        streamed_cells = self._cells(streamed_path)
+        assert len(written_cells) == len(streamed_cells) == 6
+        for written_cell, streamed_cell in zip(written_cells, streamed_cells):
+            assert written_cell.keys() == streamed_cell.keys()
+            assert written_cell.get("style") == streamed_cell.get("style")
+            assert written_cell.get("value") == streamed_cell.get("value")
+
+    def test_finalized_ids_are_kept(self, test_output_dir: Path) -> None:
+        """Checks that edges and children keep the IDs of finalized objects"""
+        file = drawpyo.File(file_path=test_output_dir)
+        with file.open_stream() as page:
+            self._build(page, finalize=True)
+            assert page.objects == []
+        cells = self._cells(page.file_path)
+        edge = next(cell for cell in cells if "edge" in cell)
+        cells = {cell["value"]: cell for cell in cells if cell.get("value")}
+        assert cells["Second"]["parent"] == cells["Container"]["id"]
+        assert edge["source"] == cells["First"]["id"]
+        assert edge["target"] == cells["Second"]["id"]
+
+    def test_close(self, test_output_dir: Path) -> None:
+        """Checks that closing writes pending objects and can be repeated"""
+        file = drawpyo.File(file_path=test_output_dir)
+        page = file.open_stream(str(test_output_dir / "closed.drawio"))
+        drawpyo.diagram.Object(page=page, value="Pending")
+        page.close()
+        page.close()
+
+        assert page.closed
+        assert page.written == 3
+        assert file.pages == []
+        root = ET.parse(page.file_path).getroot()
+        assert root.tag == "mxfile"
+        assert len(root.findall(".//mxCell")) == 3
+
+        with pytest.raises(ValueError):
+            drawpyo.diagram.Object(page=page, value="Late")
+
+    def test_exception_aborts(self, test_output_dir: Path) -> None:
+        """Checks that a failed export doesn't leave a file that looks complete"""
+        file = drawpyo.File(file_path=test_output_dir)
+        file_path = test_output_dir / "aborted.drawio"
+        with pytest.raises(RuntimeError):
+            with file.open_stream(str(file_path)) as page:
+                self._build(page, finalize=True)
+                raise RuntimeError("export failed")
+
+        assert page.closed
+        assert not file_path.exists()
+        page.close()
+        assert not file_path.exists()
+
+    def test_failed_header_aborts(
+        self, test_output_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Checks that the file is closed and removed if the headers fail"""
+
+        def broken_tag(file: drawpyo.File) -> str:
+            raise RuntimeError("broken header")
+
+        monkeypatch.setattr(drawpyo.File, "xml_open_tag", property(broken_tag))
+        file_path = test_output_dir / "broken.drawio"
+        with pytest.raises(RuntimeError):
+            drawpyo.File(file_path=test_output_dir).open_stream(str(file_path))
+        assert not file_path.exists()
+
+    def test_finalized_children_are_released(
+        self, test_output_dir: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Checks that children finalized before their parent aren't kept"""
+
+        def add_children(page: drawpyo.Page, parent, count: int) -> None:
+            for index in range(count):
+                child = drawpyo.diagram.Object(
+                    page=page, value=f"Child {index}", position=(20, 20)
+                )
+                child.parent = parent
+                page.finalize(child)
+
+        # Captured log records would be counted as well
+        caplog.set_level(logging.WARNING, logger=logger.name)
+        file = drawpyo.File(file_path=test_output_dir)
+        tracemalloc.start()
+        try:
+            with file.open_stream() as page:
+                parent = drawpyo.diagram.Object(
+                    page=page, value="Parent", width=400, height=300
+                )
+                add_children(page, parent, 1000)
+                before = tracemalloc.get_traced_memory()[0]
+                add_children(page, parent, 10000)
+                after = tracemalloc.get_traced_memory()[0]
+                assert parent.children == []
+        finally:
+            tracemalloc.stop()
+
+        assert after - before < 100_000
+        cells = self._cells(page.file_path)
+        parent_id = next(cell["id"] for cell in cells if cell.get("value") == "Parent")
+        children = [cell for cell in cells if cell.get("value", "").startswith("Child")]
+        assert len(children) == 11000
+        assert all(cell["parent"] == parent_id for cell in children)
+
+    def test_finalized_children_still_resize(self, test_output_dir: Path) -> None:
+        """Checks that an autosizing parent still fits its finalized children"""
+        file = drawpyo.File(file_path=test_output_dir)
+        with file.open_stream() as page:
+            parent = drawpyo.diagram.Object(
+                page=page,
+                position=(0, 0),
+                autosize_to_children=True,
+                autocontract=True,
+            )
+            first = drawpyo.diagram.Object(
+                page=page, parent=parent, position=(500, 500)
+            )
+            page.finalize(first)
+            drawpyo.diagram.Object(page=page, parent=parent, position=(100, 100))
+            right, bottom = (
+                parent.position[0] + parent.width,
+                parent.position[1] + parent.height,
+            )
+            assert right >= 500 + first.width
+            assert bottom >= 500 + first.height
@@ -1,5 +1,12 @@
+import base64
+import re
+import zlib
+from urllib.parse import quote
+
 import pytest
-from drawpyo import load_diagram
+from drawpyo import load_diagram, load_file, patch, diff
+from drawpyo.drawio_import import drawio_parser, iter_cells, iter_pages
+from drawpyo.drawio_import import PassthroughCell, PassthroughObject, PassthroughEdge
 from drawpyo.diagram import Object, Edge
 
 # Sample XML string for testing
@@ -81,3 +88,569 @@ class TestDrawpyoParsing:
     def test_no_edges(self, diagram):
         """Test that edges list is empty when no edges exist"""
         assert len(diagram.edges) == 0
+
+
+def test_deeply_nested_containers(tmp_path):
+    """Nesting deeper than the recursion limit still gets its geometry applied"""
+    depth = 10000
+    cells = [
+        f'<mxCell id="c{i}" value="{i}" parent="{f"c{i - 1}" if i else "1"}" '
+        f'vertex="1"><mxGeometry x="{i % 7}" y="5" width="20" height="10" '
+        'as="geometry"/></mxCell>'
+        for i in range(depth)
+    ]
+    first_shape = '<mxCell id="100"'
+    xml = SAMPLE_XML.replace(first_shape, "".join(cells) + first_shape)
+    file_path = tmp_path / "deep.drawio"
+    file_path.write_text(xml)
+    diagram = load_diagram(str(file_path))
+
+    assert diagram.element_count == depth + 3
+    deepest = diagram.get_by_id(f"c{depth - 1}")
+    assert deepest.parent is diagram.get_by_id(f"c{depth - 2}")
+    assert deepest.position_rel_to_parent == ((depth - 1) % 7, 5)
+    assert deepest.width == 20
+
+
+class TestIterCells:
+    def test_cells_in_document_order(self, tmp_path):
+        """Cells are yielded in order with their attributes and geometry"""
+        file_path = tmp_path / "test.drawio"
+        file_path.write_text(SAMPLE_XML)
+        cells = list(iter_cells(str(file_path)))
+
+        assert [cell.id for cell in cells] == ["0", "1", "100", "101", "102"]
+        assert cells[2].value == "List"
+        assert cells[2].style == "swimlane"
+        assert cells[2].is_vertex
+        assert cells[3].parent == "100"
+        assert cells[3].geometry.y == 30
+        assert cells[3].geometry.x is None
+        assert all(cell.children == [] for cell in cells)
+
+    def test_file_object(self, tmp_path):
+        """A file object can be parsed as well as a path"""
+        file_path = tmp_path / "test.drawio"
+        file_path.write_text(SAMPLE_XML)
+        with open(file_path, "rb") as f:
+            assert len(list(iter_cells(f))) == 5
+
+    def test_missing_file(self, tmp_path):
+        """A missing file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            next(iter_cells(str(tmp_path / "missing.drawio")))
+
+
+def _compress_pages(xml):
+    """Compresses each page of a file the way Draw.io does"""
+
+    def compress(match):
+        deflater = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        quoted = quote(match.group(2), safe="~()*!.'").encode("ascii")
+        data = deflater.compress(quoted) + deflater.flush()
+        return match.group(1) + base64.b64encode(data).decode("ascii") + "</diagram>"
+
+    return re.sub(r"(<diagram[^>]*>)\s*(.*?)\s*</diagram>", compress, xml, flags=re.S)
+
+
+class TestCompressedDiagrams:
+    def test_compressed_page(self, tmp_path):
+        """A compressed page loads the same as a plain one"""
+        file_path = tmp_path / "compressed.drawio"
+        file_path.write_text(_compress_pages(SAMPLE_XML))
+        diagram = load_diagram(str(file_path))
+
+        assert diagram.element_count == 3
+        item1_obj = diagram.get_by_id("101")
+        assert item1_obj in diagram.get_by_id("100").children
+        assert item1_obj.geometry.y == 30
+
+    def test_split_escapes(self, tmp_path, monkeypatch):
+        """Escapes and multi-byte characters split between chunks are decoded"""
+        monkeypatch.setattr(drawio_parser, "_INFLATE_CHUNK_SIZE", 3)
+        xml = SAMPLE_XML.replace('value="Item 2"', 'value="Ítem 2 → ✓ &amp; %"')
+        file_path = tmp_path / "compressed.drawio"
+        file_path.write_text(_compress_pages(xml), encoding="utf-8")
+
+        values = [cell.value for cell in iter_cells(str(file_path))]
+        assert values == [None, None, "List", "Item 1", "Ítem 2 → ✓ & %"]
+
+    def test_multiple_pages(self, tmp_path):
+        """Plain and compressed pages in one file are all read"""
+        page = SAMPLE_XML[SAMPLE_XML.index("<diagram") : SAMPLE_XML.index("</mxfile>")]
+        second = _compress_pages(page.replace('id="10', 'id="20'))
+        xml = SAMPLE_XML.replace("</mxfile>", second + "</mxfile>")
+        file_path = tmp_path / "pages.drawio"
+        file_path.write_text(xml)
+
+        assert len(list(iter_cells(str(file_path)))) == 10
+
+    def test_invalid_compressed_page(self, tmp_path):
+        """A page that isn't valid compressed text raises ValueError"""
+        file_path = tmp_path / "invalid.drawio"
+        file_path.write_text(
+            '<mxfile><diagram name="P">bm90IGRlZmxhdGVk</diagram></mxfile>'
+        )
+
+        with pytest.raises(ValueError):
+            load_diagram(str(file_path))
+
+
+def _multi_page_xml():
+    """A plain first page and a compressed second page with different settings"""
+    page = SAMPLE_XML[SAMPLE_XML.index("<diagram") : SAMPLE_XML.index("</mxfile>")]
+    second = page.replace('name="Page-1"', 'name="Second" id="page-2"')
+    second = second.replace('dx="2037"', 'dx="10" pageWidth="1169.5"')
+    second = second.replace('value="List"', 'value="Other"')
+    return SAMPLE_XML.replace("</mxfile>", _compress_pages(second) + "</mxfile>")
+
+
+class TestLoadFile:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "pages.drawio"
+        file_path.write_text(_multi_page_xml())
+        return str(file_path)
+
+    def test_iter_pages(self, file_path):
+        """Cells are grouped by page along with the page's settings"""
+        pages = list(iter_pages(file_path))
+
+        assert [page.name for page in pages] == ["Page-1", "Second"]
+        assert pages[1].id == "page-2"
+        assert pages[1].settings["pageWidth"] == "1169.5"
+        assert [len(page.cells) for page in pages] == [5, 5]
+
+    def test_pages_rebuilt(self, file_path, tmp_path):
+        """Each page is rebuilt with its settings, objects, and cell IDs"""
+        file = load_file(file_path)
+
+        assert [page.name for page in file.pages] == ["Page-1", "Second"]
+        first, second = file.pages
+        assert first.dx == 2037
+        assert first.grid == 1
+        assert second.dx == 10
+        assert second.width == 1169.5
+        assert second.diagram.id == "page-2"
+        assert all(page.file is file for page in file.pages)
+
+        values = [obj.value for obj in second.objects if isinstance(obj, Object)]
+        assert values == ["Other", "Item 1", "Item 2"]
+        container = second.objects[2]
+        assert container.id == "100"
+        assert container.page is second
+        assert second.objects[3].parent is container
+
+        # The rebuilt file can be written again
+        file.file_path = str(tmp_path / "out")
+        assert load_file(file.write()).pages[1].objects[2].value == "Other"
+
+    def test_workers(self, file_path):
+        """Parsing the pages in worker processes gives the same pages"""
+        serial = load_file(file_path)
+        parallel = load_file(file_path, workers=2)
+
+        assert len(serial.pages) == len(parallel.pages) == 2
+        for serial_page, parallel_page in zip(serial.pages, parallel.pages):
+            assert serial_page.name == parallel_page.name
+            assert serial_page.width == parallel_page.width
+            serial_xml = [obj.xml for obj in serial_page.objects]
+            assert serial_xml == [obj.xml for obj in parallel_page.objects]
+
+    def test_no_pages(self, tmp_path):
+        """A file without any pages raises ValueError"""
+        file_path = tmp_path / "empty.drawio"
+        file_path.write_text("<mxfile></mxfile>")
+
+        with pytest.raises(ValueError):
+            load_file(str(file_path))
+
+
+class TestLazyDiagram:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        edge = (
+            '<mxCell id="200" value="Link" parent="1" edge="1" source="101" '
+            'target="102"><mxGeometry relative="1" as="geometry"/></mxCell>'
+        )
+        file_path = tmp_path / "test.drawio"
+        file_path.write_text(SAMPLE_XML.replace("    </root>", edge + "</root>"))
+        return str(file_path)
+
+    def test_summary_builds_nothing(self, file_path):
+        """Counts, IDs, and labels are read without building any objects"""
+        diagram = load_diagram(file_path, lazy=True)
+
+        assert diagram.lazy
+        assert diagram.element_count == 4
+        assert diagram.shape_ids == ["100", "101", "102"]
+        assert diagram.edge_ids == ["200"]
+        assert "101" in diagram
+        assert "1" not in diagram
+        assert diagram.get_label("200") == "Link"
+        assert diagram.find_ids("Item") == ["101", "102"]
+        assert diagram._id_map == {}
+
+    def test_get_by_id_builds_on_demand(self, file_path):
+        """Elements are built when accessed, the same as an eager load"""
+        eager = load_diagram(file_path)
+        diagram = load_diagram(file_path, lazy=True)
+
+        item = diagram.get_by_id("102")
+        assert item is diagram.get_by_id("102")
+        assert item.parent is diagram.get_by_id("100")
+        assert item.position == eager.get_by_id("102").position
+        assert "200" not in diagram._id_map
+
+        edge = diagram.get_by_id("200")
+        assert edge.source is diagram.get_by_id("101")
+        assert edge.target is item
+        assert diagram.get_by_id("missing") is None
+
+    def test_shapes_and_edges(self, file_path):
+        """Accessing shapes or edges builds all of them"""
+        diagram = load_diagram(file_path, lazy=True)
+
+        assert [shape.value for shape in diagram.shapes] == ["List", "Item 1", "Item 2"]
+        assert [edge.label for edge in diagram.edges] == ["Link"]
+        assert len(diagram._id_map) == 4
+
+
+class TestPassthrough:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        cells = (
+            '<mxCell id="L2" value="Notes" parent="0"/>'
+            '<mxCell id="300" value="Note" style="shape=note;customKey=7;" '
+            'parent="L2" vertex="1" tags="keep">'
+            '<mxGeometry x="5" y="6" width="70" height="80" as="geometry">'
+            '<mxRectangle width="50" height="40" as="alternateBounds"/>'
+            "</mxGeometry></mxCell>"
+            '<mxCell id="200" value="Link" parent="1" edge="1" source="101" '
+            'target="102"><mxGeometry relative="1" as="geometry"><Array as="points">'
+            '<mxPoint x="10" y="20"/></Array></mxGeometry></mxCell>'
+        )
+        file_path = tmp_path / "test.drawio"
+        file_path.write_text(SAMPLE_XML.replace("    </root>", cells + "</root>"))
+        return str(file_path)
+
+    @staticmethod
+    def _by_id(page):
+        return {obj.id: obj for obj in page.objects}
+
+    def test_unchanged_cells_written_as_loaded(self, file_path):
+        """Cells that haven't changed keep what drawpyo doesn't model"""
+        page = load_file(file_path).pages[0]
+        cells = self._by_id(page)
+
+        assert [obj.id for obj in page.objects] == [
+            "0", "1", "100", "101", "102", "L2", "300", "200"
+        ]  # fmt: skip
+        assert isinstance(cells["L2"], PassthroughCell)
+        assert isinstance(cells["300"], PassthroughObject)
+        assert isinstance(cells["200"], PassthroughEdge)
+        assert not any(obj.dirty for obj in page.objects if hasattr(obj, "dirty"))
+
+        xml = page.xml
+        assert '<mxCell id="L2" value="Notes" parent="0" />' in xml
+        assert 'tags="keep"' in xml
+        assert 'as="alternateBounds"' in xml
+        assert 'style="shape=note;customKey=7;"' in xml
+
+    def test_changed_cells_serialized_again(self, file_path):
+        """Changing an object, its geometry, or its points marks it dirty"""
+        page = load_file(file_path).pages[0]
+        cells = self._by_id(page)
+
+        note, item, edge = cells["300"], cells["101"], cells["200"]
+        note.value = "Changed"
+        item.geometry.width = 99
+        edge.geometry.points[0].x = 15
+        assert note.dirty and item.dirty and edge.dirty
+        assert not cells["102"].dirty
+
+        xml = page.xml
+        assert 'value="Changed"' in xml
+        assert 'tags="keep"' not in xml
+        # Still written to the layer it was loaded from
+        assert 'parent="L2"' in note.xml
+        assert note.position == (5, 6) and note.geometry.size == (70, 80)
+        assert 'width="99"' in item.xml
+        assert '<mxPoint x="15" y="20" />' in edge.xml
+
+    def test_text_format_change(self, file_path):
+        """Editing the shared text format in place marks the object dirty"""
+        item = self._by_id(load_file(file_path).pages[0])["101"]
+
+        item.text_format.bold = True
+        assert item.dirty
+        assert "fontStyle=1" in item.xml
+
+    def test_reading_text_format(self, file_path):
+        """Reading the text format doesn't mark the object dirty"""
+        note = self._by_id(load_file(file_path).pages[0])["300"]
+
+        assert note.text_format.bold is False
+        assert not note.dirty
+        assert "customKey=7" in note.xml
+
+    def test_wrapped_cells_round_trip(self, tmp_path):
+        """Cells wrapped in a UserObject keep their ID, label, and properties"""
+        cell = (
+            '<UserObject label="hello" tooltip="tip" tags="a b" id="u1">'
+            '<mxCell style="rounded=1;" parent="1" vertex="1">'
+            '<mxGeometry x="10" y="20" width="30" height="40" as="geometry" />'
+            "</mxCell></UserObject>"
+        )
+        file_path = tmp_path / "wrapped.drawio"
+        file_path.write_text(SAMPLE_XML.replace("    </root>", cell + "</root>"))
+
+        file = load_file(str(file_path))
+        obj = self._by_id(file.pages[0])["u1"]
+        assert isinstance(obj, PassthroughObject)
+        assert (obj.value, obj.tooltip, obj.tag) == ("hello", "tip", "a b")
+        assert obj.xml == cell
+
+        file.write(file_path=str(tmp_path), file_name="out.drawio")
+        assert cell in (tmp_path / "out.drawio").read_text()
+        assert load_diagram(str(file_path)).get_label("u1") == "hello"
+
+    def test_load_diagram_unaffected(self, file_path):
+        """load_diagram() builds plain objects for the layer's shapes"""
+        diagram = load_diagram(file_path)
+
+        note = diagram.get_by_id("300")
+        assert type(note) is Object
+        assert note.position == (5, 6)
+
+
+class TestPatch:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "pages.drawio"
+        file_path.write_text(_multi_page_xml())
+        return str(file_path)
+
+    def test_patch_attributes_and_style(self, file_path):
+        """Targeted cells are changed on every page and the rest is untouched"""
+        before = open(file_path).read()
+        changes = {
+            "101": {"value": "<b>New</b>", "style.fillColor": "#FF0000"},
+            "100": {"style.swimlane": None, "style.rounded": True},
+        }
+        assert patch(file_path, changes) == ["100", "101", "100", "101"]
+
+        cells = [cell for cell in iter_cells(file_path) if cell.id in ("100", "101")]
+        values = [cell.value for cell in cells]
+        assert values == ["List", "<b>New</b>", "Other", "<b>New</b>"]
+        assert cells[0].style == cells[2].style == "rounded=1;"
+        assert cells[1].style == "fillColor=#FF0000;"
+
+        # The first page only changes in the opening tags of the patched cells
+        after = open(file_path).read()
+        untouched = '<mxCell id="102" value="Item 2" parent="100" vertex="1">'
+        assert untouched in after
+        assert after[: after.index('<mxCell id="100"')] == (
+            before[: before.index('<mxCell id="100"')]
+        )
+
+    def test_merge_keeps_other_style_values(self, tmp_path):
+        """Style attributes that aren't patched keep their exact text"""
+        style = "ellipse;image=data:image/png,iVBO==;flag=False;"
+        file_path = tmp_path / "style.drawio"
+        file_path.write_text(SAMPLE_XML.replace('style="swimlane"', f'style="{style}"'))
+
+        patch(file_path, {"100": {"style.fillColor": "none", "style.flag": 1}})
+        cell = next(cell for cell in iter_cells(file_path) if cell.id == "100")
+        assert cell.style == (
+            "ellipse;image=data:image/png,iVBO==;flag=1;fillColor=none;"
+        )
+
+    def test_wrapped_cell(self, tmp_path, caplog):
+        """Cells wrapped in a UserObject are patched on the wrapper and mxCell"""
+        cell = (
+            '<UserObject label="hello" tooltip="tip" id="u1">'
+            '<mxCell style="rounded=1;" parent="1" vertex="1">'
+            '<mxGeometry width="30" height="40" as="geometry" /></mxCell>'
+            "</UserObject>"
+        )
+        file_path = tmp_path / "wrapped.drawio"
+        file_path.write_text(SAMPLE_XML.replace("    </root>", cell + "</root>"))
+
+        changes = {"value": "X", "tooltip": "new", "style.fillColor": "#FF0000"}
+        assert patch(file_path, {"u1": changes, "gone": {"value": "x"}}) == ["u1"]
+        assert "gone" in caplog.text
+
+        xml = file_path.read_text()
+        assert '<UserObject label="X" tooltip="new" id="u1">' in xml
+        assert '<mxCell style="rounded=1;fillColor=#FF0000;" parent="1"' in xml
+        patched = next(cell for cell in iter_cells(file_path) if cell.id == "u1")
+        assert patched.value == "X" and patched.tooltip == "new"
+
+    def test_output_path(self, file_path, tmp_path):
+        """Writing to another path leaves the original alone"""
+        before = open(file_path).read()
+        output_path = tmp_path / "patched.drawio"
+
+        assert patch(file_path, {"missing": {"value": "x"}}, output_path) == []
+        assert open(file_path).read() == before
+        assert output_path.read_text() == before
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_invalid_compressed_page(self, tmp_path):
+        """A failed patch leaves no output behind"""
+        file_path = tmp_path / "broken.drawio"
+        file_path.write_text(
+            '<mxfile><diagram name="Bad">not base64!</diagram></mxfile>'
+        )
+
+        with pytest.raises(ValueError):
+            patch(file_path, {"1": {"value": "x"}}, tmp_path / "out.drawio")
+        assert not (tmp_path / "out.drawio").exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestDiff:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        edge = (
+            '<mxCell id="200" value="Link" parent="1" edge="1" source="101" '
+            'target="102"><mxGeometry relative="1" as="geometry"/></mxCell>'
+        )
+        file_path = tmp_path / "a.drawio"
+        file_path.write_text(SAMPLE_XML.replace("    </root>", edge + "</root>"))
+        return str(file_path)
+
+    def _changed(self, file_path, tmp_path, *replacements):
+        xml = open(file_path).read()
+        for old, new in replacements:
+            xml = xml.replace(old, new)
+        changed_path = tmp_path / "b.drawio"
+        changed_path.write_text(xml)
+        return str(changed_path)
+
+    def test_same_diagram(self, file_path):
+        """A diagram has no differences from itself"""
+        result = diff(file_path, file_path)
+
+        assert not result
+        assert str(result) == ""
+
+    def test_changes(self, file_path, tmp_path):
+        """Cells matched by ID are reported by what changed about them"""
+        changed = self._changed(
+            file_path,
+            tmp_path,
+            ('value="Item 1"', 'value="First" style="fillColor=#FF0000;"'),
+            ('y="60"', 'y="90"'),
+            ('<mxCell id="0"/>', '<mxCell id="0"/><mxCell id="50" vertex="1"/>'),
+            ('target="102"', 'target="100"'),
+        )
+        result = diff(file_path, changed)
+
+        assert [cell.id for cell in result.added] == ["50"]
+        assert result.removed == []
+        assert [change.id for change in result.moved] == ["102", "200"]
+        assert [change.id for change in result.restyled] == ["101"]
+        assert result.restyled[0].style_changes == {"fillColor": (None, "#FF0000")}
+        assert [change.id for change in result.relabelled] == ["101"]
+        assert "~ shape 101 'First' relabelled: 'Item 1' -> 'First'" in str(result)
+
+    def test_renamed_cells(self, file_path, tmp_path):
+        """Cells whose ID changed are matched by their content"""
+        changed = self._changed(
+            file_path,
+            tmp_path,
+            ('id="102"', 'id="new-102"'),
+            ('target="102"', 'target="new-102"'),
+            ('id="101" value="Item 1"', 'id="new-101" value="Changed"'),
+        )
+        result = diff(file_path, changed)
+
+        assert result.renamed == {"102": "new-102"}
+        # The edge still points to the same cell
+        assert result.moved == []
+        assert [cell.id for cell in result.added] == ["new-101"]
+        assert [cell.id for cell in result.removed] == ["101"]
+
+    def test_reordered_style(self, file_path, tmp_path):
+        """Reordering style attributes or dropping the last ";" isn't a change"""
+        first = self._changed(
+            file_path, tmp_path, ('"swimlane"', '"swimlane;a=1;b=2;"')
+        )
+        second = tmp_path / "c.drawio"
+        second.write_text(
+            open(first).read().replace("swimlane;a=1;b=2;", "b=2;swimlane;a=1")
+        )
+        assert not diff(first, second)
+
+        renamed = tmp_path / "d.drawio"
+        renamed.write_text(open(second).read().replace('id="100"', 'id="new-100"'))
+        result = diff(first, renamed)
+        assert result.renamed == {"100": "new-100"}
+        assert result.restyled == [] and result.added == result.removed == []
+
+    def test_raw_cells(self, file_path):
+        """RawMxCells from iter_pages() can be compared directly"""
+        page = next(iter_pages(file_path))
+        cells = {cell.id: cell for cell in page.cells}
+        fewer = {cell_id: cell for cell_id, cell in cells.items() if cell_id != "200"}
+
+        result = diff(cells, fewer)
+        assert [cell.id for cell in result.removed] == ["200"]
+        assert repr(result) == (
+            "DiagramDiff - 0 added, 1 removed, 0 moved, 0 restyled, 0 relabelled"
+        )
+
+
+class TestFind:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        edge = (
+            '<mxCell id="200" value="svc-link" parent="1" edge="1" source="101" '
+            'target="102"><mxGeometry relative="1" as="geometry"/></mxCell>'
+        )
+        xml = SAMPLE_XML.replace(
+            'value="Item 1"', 'value="svc-a" style="ellipse;fillColor=#FF0000;"'
+        ).replace('value="Item 2"', 'value="svc-b" style="fillColor=#FF0000;"')
+        file_path = tmp_path / "test.drawio"
+        file_path.write_text(xml.replace("    </root>", edge + "</root>"))
+        return str(file_path)
+
+    def test_queries(self, file_path):
+        """Each index answers its own kind of query"""
+        diagram = load_diagram(file_path, index=True)
+        get = diagram.get_by_id
+
+        assert diagram.find(style={"fillColor": "#FF0000"}) == [get("101"), get("102")]
+        assert diagram.find(style={"baseStyle": "ellipse"}) == [get("101")]
+        assert diagram.find(label="List") == [get("100")]
+        assert diagram.find(label_prefix="svc-") == [get("101"), get("102"), get("200")]
+        assert diagram.find(parent="100") == [get("101"), get("102")]
+        assert diagram.find(source="101", target="102") == [get("200")]
+        assert diagram.find(label="missing") == []
+        assert len(diagram.find()) == 4
+
+    def test_area(self, file_path):
+        """Areas are matched against absolute bounding boxes"""
+        diagram = load_diagram(file_path, index=True)
+        get = diagram.get_by_id
+
+        # Item 2 is 60 below the top of the list, which starts at (150, 100)
+        assert diagram.find(area=(200, 170, 10, 10)) == [get("100"), get("102")]
+        assert diagram.find(area=(0, 0, 150, 100)) == [get("100")]
+        assert diagram.find(area=(0, 0, 100, 50)) == []
+        assert len(diagram.find(area=(-1e6, -1e6, 2e6, 2e6))) == 3
+
+    def test_combined_criteria(self, file_path):
+        """Criteria are combined, and a lazy diagram only builds the matches"""
+        diagram = load_diagram(file_path, lazy=True)
+
+        found = diagram.find(style={"fillColor": "#FF0000"}, label_prefix="svc-b")
+        assert [element.value for element in found] == ["svc-b"]
+        assert set(diagram._id_map) == {"100", "101", "102"}
+
+    def test_requires_index(self, file_path):
+        """A diagram built up front needs to be loaded with index=True"""
+        with pytest.raises(ValueError):
+            load_diagram(file_path).find(label="List")
@@ -5,6 +5,9 @@ A Page represents a single diagram page in a Draw.io file.
 Each page contains its own objects, grid settings, and other parameters.
 """
 
+import gc
+import weakref
+
 import drawpyo
 import pytest
 
@@ -170,3 +173,39 @@ class TestPageCustomization:
         """Checks the scale setting"""
         page = drawpyo.Page(scale=2)
         assert page.scale == 2
+
+
+class TestPageOwnership:
+    """Tests of the weak back-references to pages and files"""
+
+    def test_page_refers_to_file_weakly(self) -> None:
+        """Checks that a page doesn't keep its file alive"""
+        file = drawpyo.File()
+        page = drawpyo.Page(file=file)
+        assert page.file is file
+        del file
+        assert page.file is None
+
+    def test_discarded_diagram_is_freed(self) -> None:
+        """Checks that a diagram is freed without the cyclic garbage collector"""
+
+        def build() -> tuple:
+            file = drawpyo.File()
+            page = drawpyo.Page(file=file)
+            parent = drawpyo.diagram.Object(page=page)
+            child = drawpyo.diagram.Object(page=page, parent=parent)
+            drawpyo.diagram.Edge(page=page, source=parent, target=child)
+            tree = drawpyo.diagram_types.TreeDiagram()
+            root = drawpyo.diagram_types.NodeObject(tree=tree, value="root")
+            drawpyo.diagram_types.NodeObject(tree=tree, tree_parent=root)
+            tree.auto_layout()
+            return parent, root
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            references = [weakref.ref(obj) for obj in build()]
+            assert all(reference() is None for reference in references)
+        finally:
+            if gc_enabled:
+                gc.enable()
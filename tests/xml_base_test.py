@@ -45,6 +45,11 @@ class TestXMLBaseInit:
         obj = drawpyo.XMLBase(tooltip="This is a tooltip")
         assert obj.tooltip == "This is a tooltip"
 
+    def test_with_link(self) -> None:
+        """Checks the creation of an object with a link"""
+        obj = drawpyo.XMLBase(link="data:page/id,abc")
+        assert obj.link == "data:page/id,abc"
+
 
 class TestXMLBaseAttributes:
     """Tests for XMLBase object attributes"""
@@ -77,6 +82,14 @@ class TestXMLBaseTags:
         """Checks the generation of a self-closing XML tag"""
         assert xml_base_with_class.xml == f'<mxCell id="{xml_base_with_class.id}" />'
 
+    def test_link_moves_to_user_object(self) -> None:
+        """Checks that a link wraps the tag in a UserObject"""
+        obj = drawpyo.diagram.Object(value="Next", link="data:page/id,abc")
+        assert obj.xml_open_tag.startswith(
+            f'<UserObject label="Next" id="{obj.id}" link="data:page/id,abc">'
+        )
+        assert obj.xml_close_tag == "</mxCell>\n</UserObject>"
+
     def test_open_tag_with_multiple_attributes(self) -> None:
         """Checks the generation of a tag with multiple attributes"""
         obj = drawpyo.XMLBase(id="test_id", xml_class="mxCell", xml_parent="parent_id")